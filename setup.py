@@ -25,6 +25,9 @@ setup(
         'django~=5.2',
         'uw-restclients-pws',
     ],
+    extras_require={
+        'parquet': ['pyarrow'],
+    },
     license='Apache License, Version 2.0',
     description=('A UW Person Client Django app'),
     long_description=README,
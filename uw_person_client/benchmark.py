@@ -0,0 +1,198 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.db import connections, transaction
+from django.forms.models import model_to_dict
+from django.test.utils import CaptureQueriesContext
+from uw_person_client.models import Person, PersonQueue
+from uw_person_client.serializers import serialize
+from itertools import product
+import statistics
+import time
+import tracemalloc
+
+STUDENT_INCLUDES = ('include_student_transcripts', 'include_student_transfers',
+                    'include_student_holds', 'include_student_degrees')
+
+
+def include_combinations():
+    """
+    Yields every distinct combination of include_* flags. The
+    include_student_* flags are ignored without include_student, so they
+    are only combined with it.
+    """
+    for include_employee in (False, True):
+        yield {'include_employee': include_employee}
+        for flags in product((False, True), repeat=len(STUDENT_INCLUDES)):
+            kwargs = dict(zip(STUDENT_INCLUDES, flags))
+            kwargs.update(include_employee=include_employee,
+                          include_student=True)
+            yield kwargs
+
+
+def sample_identifiers():
+    """
+    Returns the identifiers of a student in the uw_person database, an
+    employee too if there is one, for each PersonManager lookup kind.
+    """
+    person = (Person.objects.filter(
+        student__isnull=False, employee__isnull=False).first() or
+        Person.objects.filter(student__isnull=False).first())
+    if person is None:
+        raise ValueError('The uw_person database has no students')
+    return {
+        'uwnetid': person.uwnetid,
+        'uwregid': person.uwregid,
+        'system_key': person.system_key,
+        'student_number': person.student_set.values_list(
+            'student_number', flat=True).first(),
+    }
+
+
+class PersonBenchmark:
+    """
+    Measures the latency, uw_person query count and peak Python memory of
+    the PersonManager hot paths against the rows in the uw_person database.
+    Each benchmark runs repeat times for latency, plus once each with
+    queries captured and with tracemalloc tracing.
+
+    groups limits a run to some of GROUPS, and kinds limits the lookups
+    to some of PersonManager.LOOKUPS.
+    """
+    GROUPS = ('lookups', 'populations', 'to_dict', 'serializers', 'queue')
+
+    def __init__(self, repeat=20, groups=None, kinds=None,
+                 using='uw_person'):
+        self.repeat = repeat
+        self.groups = groups or self.GROUPS
+        self.kinds = kinds or list(Person.objects.LOOKUPS)
+        self.using = using
+        for group in self.groups:
+            if group not in self.GROUPS:
+                raise ValueError('Unknown benchmark group: {}'.format(group))
+        for kind in self.kinds:
+            if kind not in Person.objects.LOOKUPS:
+                raise ValueError('Unknown lookup kind: {}'.format(kind))
+
+    def measure(self, name, func, repeat=None, **params):
+        timings = []
+        for _ in range(repeat or self.repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+
+        with CaptureQueriesContext(connections[self.using]) as queries:
+            func()
+
+        tracemalloc.start()
+        try:
+            func()
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        timings.sort()
+        return {
+            'name': name,
+            'params': params,
+            'runs': len(timings),
+            'min': timings[0],
+            'median': statistics.median(timings),
+            'p95': timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+            'mean': statistics.fmean(timings),
+            'queries': len(queries),
+            'peak_memory': peak_memory,
+        }
+
+    def run_lookups(self):
+        results = []
+        identifiers = sample_identifiers()
+        for kind in self.kinds:
+            identifier = identifiers[kind]
+            lookup = getattr(Person.objects, 'get_person_by_{}'.format(kind))
+            for kwargs in include_combinations():
+                results.append(self.measure(
+                    'get_person_by_{}'.format(kind),
+                    lambda: lookup(identifier, **kwargs), **kwargs))
+        return results
+
+    def run_populations(self, repeat=3):
+        rows = Person.objects.count()
+        results = []
+        for method in ('get_active_students', 'get_active_employees'):
+            for kwargs in ({}, {'include_employee': True,
+                                'include_student': True}):
+                func = getattr(Person.objects, method)
+                results.append(self.measure(
+                    method, lambda: func(**kwargs), repeat=repeat, rows=rows,
+                    **kwargs))
+        return results
+
+    def run_to_dict(self):
+        kwargs = dict.fromkeys(STUDENT_INCLUDES, True)
+        person = Person.objects.get_person_by_uwnetid(
+            sample_identifiers()['uwnetid'], include_employee=True,
+            include_student=True, include_student_advisers=True,
+            include_student_sports=True, **kwargs)
+        return [self.measure('to_dict', person.to_dict)]
+
+    def run_serializers(self):
+        # serialize() against the model_to_dict it replaced, per model
+        person = Person.objects.get_person_by_uwnetid(
+            sample_identifiers()['uwnetid'], include_student=True,
+            include_student_transcripts=True)
+        results = []
+        for obj in [person, person.student,
+                    person.student.transcripts.first()]:
+            if obj is None:
+                continue
+            model = type(obj).__name__
+            results.append(self.measure(
+                'model_to_dict', lambda: model_to_dict(obj), model=model))
+            results.append(self.measure(
+                'serialize', lambda: serialize(obj), model=model))
+        return results
+
+    def rolled_back(self, func):
+        # Run func in a savepoint that is rolled back, so that each run
+        # sees, and leaves, the same rows
+        def wrapper():
+            with transaction.atomic(using=self.using):
+                func()
+                transaction.set_rollback(True, using=self.using)
+        return wrapper
+
+    def run_queue(self, size=1000):
+        netids = ['bench{}'.format(i) for i in range(size)]
+        return [
+            self.measure('add_to_queue', self.rolled_back(
+                lambda: PersonQueue.objects.add_to_queue(netids[0]))),
+            self.measure('add_many_to_queue', self.rolled_back(
+                lambda: PersonQueue.objects.add_many_to_queue(netids)),
+                repeat=3, values=size),
+        ]
+
+    def run(self):
+        results = []
+        for group in self.groups:
+            results.extend(getattr(self, 'run_{}'.format(group))())
+        return results
+
+
+def compare(results, baseline, threshold=0.2):
+    """
+    Returns (name, params, baseline median, median) for each result whose
+    median is more than threshold slower than the matching baseline result.
+    """
+    def key(result):
+        return (result['name'], result.get('size'),
+                repr(sorted(result['params'].items())))
+
+    medians = {key(result): result['median'] for result in baseline}
+    regressions = []
+    for result in results:
+        before = medians.get(key(result))
+        if before is not None and result['median'] > before * (1 + threshold):
+            regressions.append((result['name'], result['params'], before,
+                                result['median']))
+    return regressions
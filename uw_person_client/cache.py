@@ -0,0 +1,397 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from django.core.cache import caches
+from django.db import connections
+from django.db.models import Count, Max
+from uw_person_client.models import Adviser, Term, Major, Sport
+from threading import Event, Lock, Thread
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class PersonCacheEntry:
+    def __init__(self, person, version, keys):
+        self.person = person
+        self.version = version
+        self.keys = keys
+        self.stored = time.time()
+
+
+class PersonCache(ABC):
+    """
+    Base class for the read-through cache used by PersonManager. Assembled
+    persons are stored under a key for each of their identifiers, and are
+    served without a database query until ttl seconds have passed. After
+    that, an entry is served again only if the validate callable passed to
+    get() confirms that the person's _last_changed values have not moved.
+    """
+    key_prefix = 'uw_person'
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        # Caches are shared across threads, e.g. by PersonResolver
+        self._stats_lock = Lock()
+
+    @property
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+        }
+
+    def make_key(self, kind, identifier, plan_key):
+        return '{}:{}:{}:{}'.format(
+            self.key_prefix, plan_key, kind, identifier)
+
+    def _is_expired(self, entry):
+        return time.time() - entry.stored > self.ttl
+
+    def _increment(self, stat):
+        with self._stats_lock:
+            setattr(self, stat, getattr(self, stat) + 1)
+
+    def _count(self, entry):
+        if entry is None:
+            self._increment('misses')
+            return None
+
+        self._increment('hits')
+        return entry.person
+
+    def get(self, key, validate=None):
+        entry = self._get(key)
+        if entry is not None and self._is_expired(entry):
+            if validate is not None and validate(entry.person, entry.version):
+                entry.stored = time.time()
+                self._set(entry)
+            else:
+                self._increment('invalidations')
+                self._delete(entry.keys)
+                entry = None
+        return self._count(entry)
+
+    async def aget(self, key, validate=None):
+        """
+        Async variant of get(), taking a coroutine function to validate
+        expired entries.
+        """
+        entry = await self._aget(key)
+        if entry is not None and self._is_expired(entry):
+            if validate is not None and await validate(
+                    entry.person, entry.version):
+                entry.stored = time.time()
+                await self._aset(entry)
+            else:
+                self._increment('invalidations')
+                await self._adelete(entry.keys)
+                entry = None
+        return self._count(entry)
+
+    def set(self, person, version, keys):
+        self._set(PersonCacheEntry(person, version, keys))
+
+    async def aset(self, person, version, keys):
+        await self._aset(PersonCacheEntry(person, version, keys))
+
+    @abstractmethod
+    def _get(self, key):
+        pass
+
+    @abstractmethod
+    def _set(self, entry):
+        pass
+
+    @abstractmethod
+    def _delete(self, keys):
+        pass
+
+    # Backends that don't block on I/O can serve the async API directly
+    async def _aget(self, key):
+        return self._get(key)
+
+    async def _aset(self, entry):
+        self._set(entry)
+
+    async def _adelete(self, keys):
+        self._delete(keys)
+
+
+class LocalPersonCache(PersonCache):
+    """
+    An in-process LRU cache holding at most maxsize keys. Cached Person
+    instances are shared between callers.
+    """
+    def __init__(self, maxsize=10000, **kwargs):
+        super().__init__(**kwargs)
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def _get(self, key):
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            except KeyError:
+                return None
+
+    def _set(self, entry):
+        with self._lock:
+            for key in entry.keys:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._increment('evictions')
+
+    def _delete(self, keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class DjangoPersonCache(PersonCache):
+    """
+    Stores pickled persons in a configured Django cache backend, shared
+    across processes. Eviction and clearing are left to the backend, so
+    evictions aren't counted.
+    """
+    def __init__(self, alias='default', timeout=None, **kwargs):
+        super().__init__(**kwargs)
+        self.alias = alias
+        self.timeout = timeout
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def _get(self, key):
+        return self.backend.get(key)
+
+    def _set(self, entry):
+        self.backend.set_many(
+            {key: entry for key in entry.keys}, timeout=self.timeout)
+
+    def _delete(self, keys):
+        self.backend.delete_many(keys)
+
+    async def _aget(self, key):
+        return await self.backend.aget(key)
+
+    async def _aset(self, entry):
+        await self.backend.aset_many(
+            {key: entry for key in entry.keys}, timeout=self.timeout)
+
+    async def _adelete(self, keys):
+        await self.backend.adelete_many(keys)
+
+
+class AdviserDirectory:
+    """
+    An in-process snapshot of every adviser, with the employee and person
+    loaded, consulted by AdviserManager when set as Adviser.objects.directory.
+    The snapshot is versioned by the adviser count, max id and the max
+    _last_changed of the adviser, employee and person tables, which are
+    rechecked in one query at most every max_age seconds, and the snapshot is
+    reloaded when they have moved. Adviser instances are shared between
+    callers.
+    """
+    def __init__(self, max_age=60, using='uw_person'):
+        self.max_age = max_age
+        self.using = using
+        self.version = None
+        self.checked = None
+        self.loads = 0
+        self._advisers = []
+        self._by_uwnetid = {}
+        self._by_prior_uwnetid = {}
+        self._lock = Lock()
+
+    def _get_version(self):
+        return tuple(sorted(Adviser.objects.using(self.using).aggregate(
+            count=Count('id'), max_id=Max('id'),
+            adviser_changed=Max('last_changed'),
+            employee_changed=Max('employee__last_changed'),
+            person_changed=Max('employee__person__last_changed')).items()))
+
+    def _load(self):
+        advisers = list(
+            Adviser.objects.db_manager(self.using)._advisers_queryset())
+        by_uwnetid = {}
+        by_prior_uwnetid = {}
+        for adviser in advisers:
+            person = adviser.employee.person
+            by_uwnetid.setdefault(person.uwnetid, []).append(adviser)
+            for value in person.prior_uwnetids or []:
+                by_prior_uwnetid.setdefault(value, []).append(adviser)
+        self._advisers = advisers
+        self._by_uwnetid = by_uwnetid
+        self._by_prior_uwnetid = by_prior_uwnetid
+        self.loads += 1
+
+    def refresh(self, force=False):
+        """
+        Rechecks the version, reloading the snapshot if it has moved, or
+        unconditionally with force=True.
+        """
+        with self._lock:
+            version = self._get_version()
+            if force or version != self.version:
+                self._load()
+                self.version = version
+            self.checked = time.time()
+
+    def _current(self):
+        if self.checked is None or time.time() - self.checked > self.max_age:
+            self.refresh()
+
+    def lookup_all(self, uwnetid):
+        """
+        Returns an (advisers, outcome) tuple for uwnetid, where outcome is
+        'exact', 'prior' or 'not_found', and advisers is None if not found.
+        """
+        self._current()
+        advisers = self._by_uwnetid.get(uwnetid)
+        if advisers is not None:
+            return advisers, 'exact'
+        advisers = self._by_prior_uwnetid.get(uwnetid)
+        if advisers is not None:
+            return advisers, 'prior'
+        return None, 'not_found'
+
+    def lookup(self, uwnetid):
+        """
+        Returns an (adviser, outcome) tuple for uwnetid, as lookup_all.
+        """
+        advisers, outcome = self.lookup_all(uwnetid)
+        return advisers[0] if advisers is not None else None, outcome
+
+    def advisers(self, program=None, is_dept_adviser=None):
+        self._current()
+        return [adviser for adviser in self._advisers if (
+            program is None or adviser.advising_program == program) and (
+            is_dept_adviser is None or
+            adviser.is_dept_adviser == is_dept_adviser)]
+
+    def clear(self):
+        with self._lock:
+            self.version = None
+            self.checked = None
+            self._advisers = []
+            self._by_uwnetid = {}
+            self._by_prior_uwnetid = {}
+
+
+class ReferenceDataCache:
+    """
+    A process-wide snapshot of the Term, Major and Sport reference tables,
+    holding one shared instance per row. Once installed, foreign keys to
+    these models are resolved from it instead of the database, and
+    PersonManager loads students without joining them.
+
+    Reads are only ever served from the current snapshot, never querying,
+    so they are safe on an event loop and inside no_queries(). Installing
+    starts a daemon thread that reloads the tables every max_age seconds,
+    keeping the instances of unchanged rows, and version is incremented
+    whenever a reload finds a changed, added or removed row.
+    """
+    models = (Term, Major, Sport)
+
+    def __init__(self, max_age=300, using='uw_person'):
+        self.max_age = max_age
+        self.using = using
+        self.version = 0
+        self.loaded = None
+        self._rows = {}
+        self._lock = Lock()
+        self._stopped = Event()
+        self._thread = None
+
+    def _values(self, obj):
+        return [field.value_from_object(obj)
+                for field in obj._meta.concrete_fields]
+
+    def _load(self):
+        changed = False
+        rows = {}
+        for model in self.models:
+            previous = self._rows.get(model, {})
+            rows[model] = {}
+            for obj in model.objects.using(self.using).order_by('pk'):
+                current = previous.get(obj.pk)
+                if current is not None and (
+                        self._values(current) == self._values(obj)):
+                    obj = current
+                else:
+                    changed = True
+                rows[model][obj.pk] = obj
+            if len(rows[model]) != len(previous):
+                changed = True
+        self._rows = rows
+        if changed:
+            self.version += 1
+
+    def refresh(self, force=False):
+        """
+        Reloads the tables if they are more than max_age seconds old, or
+        unconditionally with force=True.
+        """
+        with self._lock:
+            # Another thread may have reloaded while this one waited
+            if force or self.loaded is None or (
+                    time.time() - self.loaded >= self.max_age):
+                self._load()
+                self.loaded = time.time()
+
+    def _run(self):
+        while not self._stopped.wait(self.max_age):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception('Reference data refresh failed')
+            finally:
+                connections[self.using].close()
+
+    def get(self, model, pk):
+        """
+        Returns the cached instance of model with pk, or None.
+        """
+        return self._rows.get(model, {}).get(pk)
+
+    def install(self):
+        """
+        Loads the tables, sets this as the cache of their managers and
+        starts the refresh thread.
+        """
+        self.refresh(force=True)
+        for model in self.models:
+            model.objects.cache = self
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = Thread(target=self._run, daemon=True,
+                                  name='uw_person_reference_refresh')
+            self._thread.start()
+
+    def uninstall(self):
+        for model in self.models:
+            if model.objects.cache is self:
+                model.objects.cache = None
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,108 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.conf import settings
+from django.db import connections
+from uw_person_client.signals import person_client_call
+from contextlib import ExitStack
+from functools import wraps
+from threading import local
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+_state = local()
+
+
+class QueryTimer:
+    """
+    A database execute wrapper counting the queries made through it and the
+    time spent executing them.
+    """
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.queries += 1
+
+
+def slow_call_threshold():
+    return getattr(settings, 'UW_PERSON_SLOW_CALL_THRESHOLD', None)
+
+
+def is_enabled():
+    return (slow_call_threshold() is not None or
+            person_client_call.has_listeners())
+
+
+def count_rows(result):
+    if result is None:
+        return 0
+    if isinstance(result, dict):
+        return sum(len(value) if isinstance(value, list) else 1
+                   for value in result.values() if value is not None)
+    if isinstance(result, list):
+        return len(result)
+    if hasattr(result, 'persons'):
+        return len(result.persons)
+    return 1
+
+
+def instrumented(method):
+    """
+    Instruments a manager method, sending person_client_call after each
+    call, and logging calls slower than the UW_PERSON_SLOW_CALL_THRESHOLD
+    setting (in seconds). Instrumentation is skipped unless the signal has
+    receivers or the threshold is set, and only the outermost instrumented
+    call on a thread is measured.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if getattr(_state, 'active', False) or not is_enabled():
+            return method(self, *args, **kwargs)
+
+        timer = QueryTimer()
+        result, exception = None, None
+        _state.active = True
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(timer))
+                result = method(self, *args, **kwargs)
+            return result
+        except Exception as ex:
+            exception = ex
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            _state.active = False
+            report(self.model, method.__name__, kwargs, timer, duration,
+                   count_rows(result), exception)
+    return wrapper
+
+
+def report(model, method, kwargs, timer, duration, rows, exception):
+    flags = {key: value for key, value in kwargs.items()
+             if key.startswith('include_') or key == 'profile'}
+    python_time = max(0.0, duration - timer.db_time)
+
+    threshold = slow_call_threshold()
+    if threshold is not None and duration >= threshold:
+        logger.warning(
+            'Slow call {}({}): {:.3f}s, {} queries in {:.3f}s, {} rows'.format(
+                method, ', '.join('{}={}'.format(key, value)
+                                  for key, value in sorted(flags.items())),
+                duration, timer.queries, timer.db_time, rows))
+
+    person_client_call.send(
+        sender=model, method=method, flags=flags, queries=timer.queries,
+        rows=rows, duration=duration, db_time=timer.db_time,
+        python_time=python_time, exception=exception)
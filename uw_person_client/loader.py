@@ -0,0 +1,157 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.apps import apps
+from django.core import serializers
+from django.core.management.color import no_style
+from django.db import connections, transaction
+from graphlib import TopologicalSorter
+import csv
+import io
+import json
+import os
+import time
+
+COPY_CHUNK_SIZE = 1 << 20
+
+
+def load_order():
+    """
+    Returns the unmanaged uw_person_client models, parents before the
+    models with foreign keys to them, e.g. person, employee, adviser...
+    """
+    models = [m for m in apps.get_app_config('uw_person_client').get_models()
+              if m._meta.managed is False and
+              m.__module__ == 'uw_person_client.models' and
+              not getattr(m, 'materialized_view', False)]
+    graph = TopologicalSorter()
+    for model in models:
+        graph.add(model, *[
+            field.related_model for field in model._meta.concrete_fields
+            if field.is_relation and field.related_model in models and
+            field.related_model is not model])
+    return list(graph.static_order())
+
+
+class FixtureLoader:
+    """
+    Bulk loads fixtures into the unmanaged uw_person tables. Accepts
+    Django JSON fixtures, JSON Lines files with one fixture object per line
+    (.jsonl), which are streamed, and CSV files (.csv) named for a table or
+    model, e.g. person.csv or student_hold.csv, with a header row of column
+    names, which are loaded with COPY FROM STDIN.
+
+    JSON objects are inserted with bulk_create in batches of batch_size, and
+    a model's pending rows are always inserted after those of the models it
+    references. Files are loaded in foreign key order, each in a
+    transaction, and load() returns a (model, rows, seconds) tuple per
+    model loaded.
+    """
+    def __init__(self, using='uw_person', batch_size=5000):
+        self.using = using
+        self.batch_size = batch_size
+        self.models = load_order()
+        self.tables = {}
+        for model in self.models:
+            self.tables[model._meta.db_table] = model
+            self.tables[model._meta.model_name] = model
+
+    def csv_model(self, path):
+        name = os.path.splitext(os.path.basename(path))[0].lower()
+        try:
+            return self.tables[name]
+        except KeyError:
+            raise ValueError('No uw_person table for {}'.format(path))
+
+    def iter_objects(self, path):
+        with open(path) as f:
+            if path.endswith('.jsonl'):
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+            else:
+                yield from json.load(f)
+
+    def first_model(self, path):
+        if path.endswith('.csv'):
+            return self.csv_model(path)
+        for obj in self.iter_objects(path):
+            return apps.get_model(obj['model'])
+        return self.models[0]
+
+    def sort_paths(self, paths):
+        return sorted(paths, key=lambda path: self.models.index(
+            self.first_model(path)))
+
+    def load(self, paths):
+        stats = {}
+        for path in self.sort_paths(paths):
+            with transaction.atomic(using=self.using):
+                if path.endswith('.csv'):
+                    model = self.csv_model(path)
+                    start = time.time()
+                    count = self.copy_csv(path, model)
+                    self.add_stats(stats, model, count, time.time() - start)
+                else:
+                    self.load_json(path, stats)
+        self.reset_sequences(list(stats))
+        return [(model, ) + tuple(stats[model])
+                for model in self.models if model in stats]
+
+    def add_stats(self, stats, model, count, elapsed):
+        counts = stats.setdefault(model, [0, 0.0])
+        counts[0] += count
+        counts[1] += elapsed
+
+    def load_json(self, path, stats):
+        pending = {}
+
+        def flush(model):
+            # Insert the pending rows of the models this one references first
+            for parent in self.models[:self.models.index(model) + 1]:
+                objs = pending.pop(parent, None)
+                if objs:
+                    start = time.time()
+                    parent.objects.using(self.using).bulk_create(
+                        objs, batch_size=self.batch_size)
+                    self.add_stats(
+                        stats, parent, len(objs), time.time() - start)
+
+        for deserialized in serializers.deserialize(
+                'python', self.iter_objects(path), using=self.using):
+            obj = deserialized.object
+            model = type(obj)
+            pending.setdefault(model, []).append(obj)
+            if len(pending[model]) >= self.batch_size:
+                flush(model)
+
+        if len(pending):
+            flush(self.models[-1])
+
+    def copy_csv(self, path, model):
+        connection = connections[self.using]
+        with open(path, newline='') as f:
+            header = f.readline()
+            if not header.strip():
+                return 0
+            columns = next(csv.reader(io.StringIO(header)))
+            sql = 'COPY {} ({}) FROM STDIN WITH (FORMAT csv)'.format(
+                connection.ops.quote_name(model._meta.db_table),
+                ', '.join(connection.ops.quote_name(c.strip())
+                          for c in columns))
+            with connection.cursor() as cursor:
+                with cursor.copy(sql) as copy:
+                    while True:
+                        data = f.read(COPY_CHUNK_SIZE)
+                        if not data:
+                            break
+                        copy.write(data)
+                return cursor.rowcount
+
+    def reset_sequences(self, models):
+        connection = connections[self.using]
+        statements = connection.ops.sequence_reset_sql(no_style(), models)
+        if len(statements):
+            with connection.cursor() as cursor:
+                for sql in statements:
+                    cursor.execute(sql)
@@ -0,0 +1,93 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management import call_command
+from django.utils import timezone
+from uw_person_client.benchmark import PersonBenchmark, compare
+import json
+import os
+
+VERSION_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'VERSION')
+
+
+class Command(BaseCommand):
+    help = ('Benchmark the PersonManager lookups, population queries, '
+            'to_dict and queue enqueue, writing the results as JSON.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes', help='Comma-separated population sizes to generate '
+                            'and benchmark in turn, e.g. 1000,10000,100000, '
+                            'replacing the uw_person data (localdev only). '
+                            'By default the existing data is used.')
+        parser.add_argument(
+            '--only', help='Comma-separated benchmark groups to run, of '
+                           'lookups, populations, to_dict, serializers and '
+                           'queue')
+        parser.add_argument(
+            '--kinds', help='Comma-separated lookup kinds to benchmark, '
+                            'e.g. uwnetid,system_key')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument('--output', help='Path to write the JSON to '
+                                             '(default stdout)')
+        parser.add_argument(
+            '--baseline', help='Path to the JSON output of an earlier run, '
+                               'to report regressions against')
+        parser.add_argument(
+            '--threshold', type=float, default=0.2,
+            help='Fraction by which a median may exceed the baseline '
+                 'before it is reported (default 0.2)')
+
+    def split(self, value):
+        return [v.strip() for v in (value or '').split(',') if v.strip()]
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [int(s) for s in self.split(options['sizes'])]
+        except ValueError:
+            raise CommandError('Invalid --sizes: {}'.format(options['sizes']))
+
+        results = []
+        try:
+            benchmark = PersonBenchmark(
+                repeat=options['repeat'], groups=self.split(options['only']),
+                kinds=self.split(options['kinds']))
+            if not len(sizes):
+                results.extend(benchmark.run())
+            for size in sizes:
+                call_command('generate_person_data', persons=size,
+                             seed=options['seed'], truncate=True,
+                             stdout=self.stderr)
+                for result in benchmark.run():
+                    result['size'] = size
+                    results.append(result)
+        except ValueError as ex:
+            raise CommandError(ex)
+
+        with open(VERSION_PATH) as f:
+            version = f.read().strip()
+        data = json.dumps({
+            'version': version,
+            'timestamp': timezone.now().isoformat(),
+            'repeat': options['repeat'],
+            'results': results,
+        }, indent=2)
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(data)
+        else:
+            self.stdout.write(data)
+
+        if options['baseline']:
+            with open(options['baseline']) as f:
+                baseline = json.load(f)['results']
+            for name, params, before, after in compare(
+                    results, baseline, options['threshold']):
+                self.stderr.write(
+                    'REGRESSION {} {}: median {:.6f}s -> {:.6f}s'.format(
+                        name, params, before, after))
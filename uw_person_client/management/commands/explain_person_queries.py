@@ -0,0 +1,111 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, router, transaction
+from uw_person_client.models import Person, Adviser, PersonLoadingPlan
+from uw_person_client.benchmark import sample_identifiers
+import json
+
+
+class Command(BaseCommand):
+    help = ('EXPLAIN the PersonManager and AdviserManager lookup queries '
+            'against the uw_person database and flag sequential scans. '
+            'Identifiers not given are sampled from the database.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--uwnetid')
+        parser.add_argument('--uwregid')
+        parser.add_argument('--system-key')
+        parser.add_argument('--student-number')
+        parser.add_argument(
+            '--force-index', action='store_true',
+            help='Disable sequential scans while planning, so that a seq '
+                 'scan is only reported for queries no index can serve')
+        parser.add_argument(
+            '--show-plans', action='store_true',
+            help='Print the full plan for each query')
+
+    def get_identifiers(self, options):
+        identifiers = {kind: options[kind] for kind in Person.objects.LOOKUPS}
+        if None in identifiers.values():
+            try:
+                sampled = sample_identifiers()
+            except ValueError as ex:
+                raise CommandError(ex)
+            for kind, value in identifiers.items():
+                if value is None:
+                    identifiers[kind] = sampled[kind]
+        return identifiers
+
+    def get_querysets(self, identifiers):
+        # The querysets the managers run, from the same builders
+        querysets = []
+        for kind, identifier in identifiers.items():
+            name = 'get_person_by_{}'.format(kind)
+            for queryset, outcome in Person.objects._lookup_querysets(
+                    kind, identifier):
+                querysets.append((
+                    name if outcome == 'exact' else '{} ({})'.format(
+                        name, outcome), queryset))
+            querysets.append((
+                'get_persons_by_{}s'.format(kind),
+                Person.objects._bulk_lookup_queryset(kind, [identifier])))
+
+        person_ids = list(Person.objects.filter(
+            uwnetid=identifiers['uwnetid']).values_list('pk', flat=True))
+        querysets.extend([
+            ('include_student prefetch',
+             PersonLoadingPlan(include_student=True).student_queryset(
+                 ).filter(person_id__in=person_ids)),
+            ('get_active_students', Person.objects._active_queryset(
+                'is_active_student')),
+            ('get_active_employees', Person.objects._active_queryset(
+                'is_active_employee')),
+        ])
+
+        uwnetid = identifiers['uwnetid']
+        for queryset, outcome in Adviser.objects._lookup_querysets(uwnetid):
+            querysets.append((
+                'get_adviser_by_uwnetid' if outcome == 'exact' else
+                'get_adviser_by_uwnetid ({})'.format(outcome), queryset))
+        querysets.append((
+            'get_advisers_by_uwnetids',
+            Adviser.objects._bulk_lookup_queryset([uwnetid])))
+        return querysets
+
+    def seq_scans(self, plan):
+        scans = []
+        if plan.get('Node Type') == 'Seq Scan':
+            scans.append(plan.get('Relation Name'))
+        for subplan in plan.get('Plans', []):
+            scans.extend(self.seq_scans(subplan))
+        return scans
+
+    def explain(self, queryset, force_index):
+        using = router.db_for_read(queryset.model)
+        with transaction.atomic(using=using):
+            if force_index:
+                with connections[using].cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+            return json.loads(queryset.explain(format='json'))[0]['Plan']
+
+    def handle(self, *args, **options):
+        querysets = self.get_querysets(self.get_identifiers(options))
+        flagged = 0
+        for name, queryset in querysets:
+            plan = self.explain(queryset, options['force_index'])
+            scans = self.seq_scans(plan)
+            if len(scans):
+                flagged += 1
+                self.stdout.write('{}: SEQ SCAN on {}'.format(
+                    name, ', '.join(scans)))
+            else:
+                self.stdout.write('{}: OK'.format(name))
+
+            if options['show_plans']:
+                self.stdout.write(json.dumps(plan, indent=2))
+
+        self.stdout.write('{} of {} queries use a sequential scan'.format(
+            flagged, len(querysets)))
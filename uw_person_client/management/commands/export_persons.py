@@ -0,0 +1,216 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+
+from django.core.exceptions import FieldDoesNotExist, FieldError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, router
+from django.db.models.constants import LOOKUP_SEP
+from uw_person_client.models import (
+    Person, Transcript, Transfer, StudentHold, Degree)
+import codecs
+import csv
+import io
+import tempfile
+import time
+
+STUDENT_COLUMNS = [
+    'uwnetid', 'uwregid', 'system_key', 'student__student_number',
+    'display_name', 'first_name', 'surname', 'student__student_email',
+    'student__class_desc', 'student__campus_desc',
+    'student__enroll_status_code', 'student__academic_term__year',
+    'student__academic_term__quarter', 'student__major_1__major_abbr_code',
+    'student__major_1__major_name', 'student__major_2__major_name',
+    'student__major_3__major_name', 'student__cumulative_gpa',
+    'student__total_credits',
+]
+
+EMPLOYEE_COLUMNS = [
+    'uwnetid', 'uwregid', 'display_name', 'first_name', 'surname',
+    'employee__employee_number', 'employee__title', 'employee__department',
+    'employee__home_department', 'employee__email_addresses',
+]
+
+
+def local_columns(model):
+    return [field.name for field in model._meta.concrete_fields
+            if not field.is_relation and not field.primary_key]
+
+
+# Each table is a queryset over active students or employees, and its
+# default columns
+TABLES = {
+    'students': (
+        lambda: Person.objects.filter(is_active_student=True),
+        STUDENT_COLUMNS),
+    'employees': (
+        lambda: Person.objects.filter(is_active_employee=True),
+        EMPLOYEE_COLUMNS),
+    'transcripts': (
+        lambda: Transcript.objects.filter(
+            student__person__is_active_student=True),
+        ['student__system_key', 'tran_term__year', 'tran_term__quarter'] +
+        local_columns(Transcript)),
+    'transfers': (
+        lambda: Transfer.objects.filter(
+            student__person__is_active_student=True),
+        ['student__system_key'] + local_columns(Transfer)),
+    'holds': (
+        lambda: StudentHold.objects.filter(
+            student__person__is_active_student=True),
+        ['student__system_key'] + local_columns(StudentHold)),
+    'degrees': (
+        lambda: Degree.objects.filter(
+            student__person__is_active_student=True),
+        ['student__system_key', 'degree_term__year', 'degree_term__quarter'] +
+        local_columns(Degree)),
+}
+
+
+def resolve_field(model, column):
+    for name in column.split(LOOKUP_SEP):
+        field = model._meta.get_field(name)
+        model = field.related_model
+    if field.is_relation:
+        field = model._meta.pk
+    return field
+
+
+def arrow_type(field):
+    import pyarrow as pa
+    internal_type = field.get_internal_type()
+    if internal_type in ('AutoField', 'BigAutoField', 'BigIntegerField'):
+        return pa.int64()
+    if internal_type == 'IntegerField':
+        return pa.int32()
+    if internal_type == 'SmallIntegerField':
+        return pa.int16()
+    if internal_type == 'BooleanField':
+        return pa.bool_()
+    if internal_type == 'DecimalField':
+        return pa.decimal128(field.max_digits, field.decimal_places)
+    if internal_type == 'DateField':
+        return pa.date32()
+    if internal_type == 'DateTimeField':
+        return pa.timestamp('us', tz='UTC')
+    # Text, and arrays in their Postgres literal form
+    return pa.string()
+
+
+class StdoutWriter:
+    """
+    Writes COPY data to a command's stdout, decoding incrementally since a
+    multibyte character may span two chunks.
+    """
+    def __init__(self, stdout):
+        self.stdout = stdout
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+
+    def write(self, data):
+        self.stdout.write(self.decoder.decode(bytes(data)), ending='')
+
+
+class Command(BaseCommand):
+    help = ('Export active students, employees or their child records with '
+            'COPY ... TO STDOUT, as CSV, Parquet or Arrow.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('table', choices=sorted(TABLES.keys()))
+        parser.add_argument(
+            '--format', choices=['csv', 'parquet', 'arrow'], default='csv')
+        parser.add_argument(
+            '--output', help='Path to write to, required for Parquet and '
+                             'Arrow (default stdout)')
+        parser.add_argument(
+            '--columns', help='Comma-separated field paths to export, e.g. '
+                              'uwnetid,student__major_1__major_name')
+
+    def copy_sql(self, queryset, columns):
+        try:
+            sql, params = queryset.order_by().values_list(
+                *columns).query.sql_with_params()
+        except FieldError as ex:
+            raise CommandError(ex)
+        return 'COPY ({}) TO STDOUT WITH (FORMAT csv)'.format(sql), params
+
+    def copy(self, queryset, columns, f):
+        sql, params = self.copy_sql(queryset, columns)
+        using = router.db_for_read(queryset.model)
+        with connections[using].cursor() as cursor:
+            with cursor.copy(sql, params) as copy:
+                for data in copy:
+                    f.write(data)
+            return cursor.rowcount
+
+    def write_csv(self, queryset, columns, output):
+        header = io.StringIO()
+        csv.writer(header, lineterminator='\n').writerow(columns)
+        if output:
+            with open(output, 'wb') as f:
+                f.write(header.getvalue().encode('utf-8'))
+                return self.copy(queryset, columns, f)
+
+        self.stdout.write(header.getvalue(), ending='')
+        return self.copy(queryset, columns, StdoutWriter(self.stdout))
+
+    def write_arrow(self, queryset, columns, output, file_format):
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+        except ImportError:
+            raise CommandError('{} export requires pyarrow'.format(
+                file_format.title()))
+
+        try:
+            schema = pa.schema([
+                (column, arrow_type(resolve_field(queryset.model, column)))
+                for column in columns])
+        except FieldDoesNotExist as ex:
+            raise CommandError(ex)
+
+        # COPY into a temporary file, then convert it in streamed batches
+        with tempfile.TemporaryFile() as tmp:
+            count = self.copy(queryset, columns, tmp)
+            tmp.seek(0)
+            reader = pa_csv.open_csv(
+                tmp, read_options=pa_csv.ReadOptions(column_names=columns),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types=schema, true_values=['t'],
+                    false_values=['f'], strings_can_be_null=True,
+                    quoted_strings_can_be_null=False))
+
+            if file_format == 'parquet':
+                import pyarrow.parquet as pq
+                writer = pq.ParquetWriter(output, schema)
+            else:
+                writer = pa.ipc.new_file(output, schema)
+            with writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+        return count
+
+    def handle(self, *args, **options):
+        get_queryset, columns = TABLES[options['table']]
+        if options['columns']:
+            columns = [c.strip() for c in options['columns'].split(',')
+                       if c.strip()]
+        output = options['output']
+        file_format = options['format']
+        if file_format != 'csv' and not output:
+            raise CommandError('--output is required for {} export'.format(
+                file_format))
+
+        start = time.time()
+        if file_format == 'csv':
+            count = self.write_csv(get_queryset(), columns, output)
+        else:
+            count = self.write_arrow(
+                get_queryset(), columns, output, file_format)
+        elapsed = time.time() - start
+
+        # Keep the report out of CSV written to stdout
+        report = self.stdout if output else self.stderr
+        report.write(
+            'Exported {} {} rows in {:.2f}s, {:.1f} rows/s'.format(
+                count, options['table'], elapsed,
+                count / elapsed if elapsed else 0))
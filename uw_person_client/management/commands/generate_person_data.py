@@ -0,0 +1,86 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management import call_command
+from django.db import connections
+from uw_person_client.loader import FixtureLoader
+from uw_person_client.synthetic import SyntheticPopulation
+import os
+import tempfile
+import time
+
+
+class Command(BaseCommand):
+    help = ('Generate a seeded synthetic population for the uw_person '
+            'tables, as CSV files, and load it into a localdev uw_person '
+            'database.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--persons', type=int, default=1000)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--student-ratio', type=float, default=0.7)
+        parser.add_argument('--employee-ratio', type=float, default=0.35)
+        parser.add_argument(
+            '--adviser-ratio', type=float, default=0.05,
+            help='Fraction of employees who are advisers')
+        parser.add_argument(
+            '--renamed-ratio', type=float, default=0.02,
+            help='Fraction of persons with a prior uwnetid')
+        parser.add_argument(
+            '--output', help='Directory to write the CSV files to, which '
+                             'are then not loaded unless --load is given')
+        parser.add_argument('--load', action='store_true')
+        parser.add_argument(
+            '--truncate', action='store_true',
+            help='Empty the uw_person tables before loading')
+
+    def truncate(self):
+        connection = connections['uw_person']
+        tables = [model._meta.db_table for model in FixtureLoader().models]
+        with connection.cursor() as cursor:
+            cursor.execute('TRUNCATE {} RESTART IDENTITY CASCADE'.format(
+                ', '.join(connection.ops.quote_name(t) for t in tables)))
+
+    def generate(self, directory, options):
+        population = SyntheticPopulation(
+            size=options['persons'], seed=options['seed'],
+            student_ratio=options['student_ratio'],
+            employee_ratio=options['employee_ratio'],
+            adviser_ratio=options['adviser_ratio'],
+            renamed_ratio=options['renamed_ratio'])
+
+        start = time.time()
+        counts = population.write_csv(directory)
+        elapsed = time.time() - start
+
+        total = sum(counts.values())
+        self.stdout.write(
+            'Generated {} rows in {:.2f}s, {:.1f} rows/s ({})'.format(
+                total, elapsed, total / elapsed if elapsed else 0,
+                ', '.join('{} {}'.format(count, table)
+                          for table, count in counts.items())))
+
+    def load(self, directory, options):
+        if options['truncate']:
+            self.truncate()
+        call_command('initialize_person_db', directory, stdout=self.stdout)
+
+    def handle(self, *args, **options):
+        if options['persons'] < 1:
+            raise CommandError('--persons must be at least 1')
+        if ((options['load'] or not options['output']) and
+                os.getenv('ENV', '') != 'localdev'):
+            raise CommandError('Localdev only!')
+
+        if options['output']:
+            os.makedirs(options['output'], exist_ok=True)
+            self.generate(options['output'], options)
+            if options['load']:
+                self.load(options['output'], options)
+            return
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.generate(directory, options)
+            self.load(directory, options)
@@ -6,16 +6,28 @@ from django.core.management.base import BaseCommand, CommandError
 from django.core.management import call_command
 from django.db import connections
 from django.apps import apps
+from uw_person_client.loader import FixtureLoader
+from uw_person_client.summary import (
+    create_person_summary, refresh_person_summary)
 import os
+import time
 
 
 class Command(BaseCommand):
     help = 'Set up the uw_person database for a localdev environment.'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'paths', nargs='*',
+            help='Fixture files or directories to bulk load instead of the '
+                 'bundled fixtures, see uw_person_client.loader')
+        parser.add_argument('--batch-size', type=int, default=5000)
+
     def create_person_models(self):
         unmanaged_models = [m for m in apps.get_models() if (
             m._meta.app_label == 'uw_person_client' and
-            m._meta.managed is False)]
+            m._meta.managed is False and
+            not getattr(m, 'materialized_view', False))]
 
         connection = self.get_person_connection()
         existing_tables = connection.introspection.table_names()
@@ -35,16 +47,59 @@ class Command(BaseCommand):
             )
         return connections['uw_person']
 
+    def get_fixture_paths(self, paths):
+        fixture_paths = []
+        for path in paths:
+            if os.path.isdir(path):
+                fixture_paths.extend(sorted(
+                    os.path.join(path, name) for name in os.listdir(path)
+                    if name.endswith(('.json', '.jsonl', '.csv'))))
+            elif os.path.exists(path):
+                fixture_paths.append(path)
+            else:
+                raise CommandError('No such fixture: {}'.format(path))
+        return fixture_paths
+
+    def bulk_load(self, paths, batch_size):
+        loader = FixtureLoader(batch_size=batch_size)
+        start = time.time()
+        try:
+            stats = loader.load(self.get_fixture_paths(paths))
+        except ValueError as ex:
+            raise CommandError(ex)
+        elapsed = time.time() - start
+
+        total = 0
+        for model, count, model_elapsed in stats:
+            total += count
+            self.stdout.write(
+                'Loaded {} {} rows in {:.2f}s, {:.1f} rows/s'.format(
+                    count, model._meta.db_table, model_elapsed,
+                    count / model_elapsed if model_elapsed else 0))
+        self.stdout.write('Loaded {} rows in {:.2f}s, {:.1f} rows/s'.format(
+            total, elapsed, total / elapsed if elapsed else 0))
+
     def handle(self, *args, **options):
         if os.getenv('ENV', '') != 'localdev':
             raise CommandError('Localdev only!')
 
         self.create_person_models()
 
-        # Load uw_person data
-        for fixture in [
-                'person.json', 'employee.json', 'term.json', 'major.json',
-                'student.json', 'adviser.json', 'transfer.json',
-                'transcript.json', 'hold.json', 'degree.json', 'sport.json']:
-            call_command('loaddata', fixture, database='uw_person',
-                         app_label='uw_person_client')
+        if options.get('paths'):
+            self.bulk_load(
+                options['paths'], options.get('batch_size') or 5000)
+        else:
+            # Load uw_person data
+            for fixture in [
+                    'person.json', 'employee.json', 'term.json', 'major.json',
+                    'student.json', 'adviser.json', 'transfer.json',
+                    'transcript.json', 'hold.json', 'degree.json',
+                    'sport.json']:
+                call_command('loaddata', fixture, database='uw_person',
+                             app_label='uw_person_client')
+
+        self.create_person_summary()
+
+    def create_person_summary(self):
+        create_person_summary()
+        refresh_person_summary(concurrently=False)
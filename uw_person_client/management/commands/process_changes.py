@@ -0,0 +1,98 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+from django.utils.module_loading import import_string
+from uw_person_client.models import (
+    Person, Employee, Student, Adviser, Transcript)
+import json
+import os
+import time
+
+FEEDS = {
+    'person': Person,
+    'employee': Employee,
+    'student': Student,
+    'adviser': Adviser,
+    'transcript': Transcript,
+}
+
+
+class Command(BaseCommand):
+    help = ('Pass the rows of a uw_person model changed since a watermark '
+            'to a handler callable, in batches, checkpointing the watermark '
+            'after each batch.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('feed', choices=sorted(FEEDS.keys()))
+        parser.add_argument(
+            'handler', help='Dotted path to a callable taking a list of '
+                            'changed rows')
+        parser.add_argument(
+            '--checkpoint', help='Path to a JSON file holding the watermark '
+                                 'of each feed, read on start and updated '
+                                 'after each handled batch')
+        parser.add_argument(
+            '--since', help='ISO 8601 datetime to start from, overriding '
+                            'the checkpoint')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def read_checkpoint(self, path):
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError as ex:
+            raise CommandError('Invalid checkpoint {}: {}'.format(path, ex))
+
+    def write_checkpoint(self, path, checkpoint):
+        # Replace the file atomically, so a crash never leaves it truncated
+        tmp_path = '{}.tmp'.format(path)
+        with open(tmp_path, 'w') as f:
+            json.dump(checkpoint, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def handle(self, *args, **options):
+        try:
+            handler = import_string(options['handler'])
+        except ImportError as ex:
+            raise CommandError(ex)
+
+        feed = options['feed']
+        path = options['checkpoint']
+        checkpoint = self.read_checkpoint(path) if path else {}
+
+        since = None
+        if options['since']:
+            since = parse_datetime(options['since'])
+            if since is None:
+                raise CommandError('Invalid --since: {}'.format(
+                    options['since']))
+        elif feed in checkpoint:
+            since = (parse_datetime(checkpoint[feed]['last_changed']),
+                     checkpoint[feed]['pk'])
+
+        manager = FEEDS[feed].objects
+        processed = 0
+        start = time.time()
+        for batch in manager.iter_changes(
+                since=since, batch_size=options['batch_size']):
+            handler(batch)
+            processed += len(batch)
+
+            last_changed, pk = manager.watermark(batch[-1])
+            checkpoint[feed] = {
+                'last_changed': last_changed.isoformat(), 'pk': pk}
+            if path:
+                self.write_checkpoint(path, checkpoint)
+        elapsed = time.time() - start
+
+        watermark = checkpoint.get(feed, {}).get('last_changed')
+        self.stdout.write(
+            'Processed {} {} rows in {:.2f}s, watermark {}'.format(
+                processed, feed, elapsed, watermark))
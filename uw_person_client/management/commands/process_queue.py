@@ -0,0 +1,98 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils.module_loading import import_string
+from uw_person_client.models import PersonQueue, EnrolledStudentQueue
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+QUEUES = {
+    'person': PersonQueue,
+    'enrolled_student': EnrolledStudentQueue,
+}
+
+
+class Command(BaseCommand):
+    help = ('Drain a uw_person queue with a pool of workers, passing each '
+            'claimed batch of queue rows to a handler callable.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('queue', choices=sorted(QUEUES.keys()))
+        parser.add_argument(
+            'handler', help='Dotted path to a callable taking a list of '
+                            'queue rows')
+        parser.add_argument('--workers', type=int, default=4)
+        parser.add_argument('--batch-size', type=int, default=100)
+        parser.add_argument(
+            '--max-batches', type=int, default=None,
+            help='Stop each worker after this many batches')
+
+    def handle(self, *args, **options):
+        try:
+            self.handler = import_string(options['handler'])
+        except ImportError as ex:
+            raise CommandError(ex)
+
+        self.manager = QUEUES[options['queue']].objects
+        self.batch_size = options['batch_size']
+        self.max_batches = options['max_batches']
+        self.processed = 0
+        self.failed = set()
+        self.lock = Lock()
+
+        start = time.time()
+        with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+            for _ in range(options['workers']):
+                executor.submit(self.run_worker)
+        elapsed = time.time() - start
+
+        self.stdout.write(
+            'Processed {} rows ({} failed) in {:.2f}s, {:.1f} rows/s'.format(
+                self.processed, len(self.failed), elapsed,
+                self.processed / elapsed if elapsed else 0))
+
+    def run_worker(self):
+        try:
+            batches = 0
+            while self.max_batches is None or batches < self.max_batches:
+                if not self.process_batch():
+                    break
+                batches += 1
+        except Exception as ex:
+            logger.exception('Queue worker stopped: {}'.format(ex))
+        finally:
+            connections.close_all()
+
+    def process_batch(self):
+        field = self.manager.queue_field
+        with self.manager.claim_batch(self.batch_size) as claimed:
+            # Rows that already failed in this run are moved to the back of
+            # the queue, and the worker stops once only those remain
+            items, failed = [], []
+            for item in claimed:
+                (failed if getattr(item, field) in self.failed
+                 else items).append(item)
+            if len(failed):
+                self.manager.release(failed)
+            if not len(items):
+                return False
+
+            try:
+                self.handler(items)
+            except Exception as ex:
+                logger.error('Queue handler failed: {}'.format(ex))
+                self.manager.release(items)
+                with self.lock:
+                    self.failed.update(getattr(i, field) for i in items)
+            else:
+                self.manager.ack(items)
+                with self.lock:
+                    self.processed += len(items)
+        return True
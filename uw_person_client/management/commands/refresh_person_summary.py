@@ -0,0 +1,23 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+
+from django.core.management.base import BaseCommand
+from uw_person_client.summary import refresh_person_summary
+
+
+class Command(BaseCommand):
+    help = ('Refresh the person_summary materialized view behind the '
+            'PersonSummary model.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--blocking', action='store_true',
+            help='Refresh without CONCURRENTLY, which is faster but blocks '
+                 'PersonSummary reads until it completes')
+
+    def handle(self, *args, **options):
+        elapsed = refresh_person_summary(
+            concurrently=not options['blocking'])
+        self.stdout.write('Refreshed person_summary in {:.2f}s'.format(
+            elapsed))
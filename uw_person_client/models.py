@@ -1,16 +1,102 @@
 # Copyright 2026 UW-IT, University of Washington
 # SPDX-License-Identifier: Apache-2.0
 
-from django.db import models
-from django.db.models import Q
+from django.db import connections, models, router, transaction
+from django.db.models import F, Max, Q, Prefetch
+from django.db.models.fields.related_descriptors import (
+    ForwardManyToOneDescriptor)
 from django.contrib.postgres.fields import ArrayField
-from django.forms import model_to_dict
+from django.contrib.postgres.indexes import GinIndex
+from asgiref.sync import sync_to_async
+from uw_person_client.serializers import serialize
+from uw_person_client.instrumentation import instrumented
 from uw_person_client.exceptions import (
     PersonNotFoundException, AdviserNotFoundException)
 from uw_pws import PWS, InvalidNetID, InvalidStudentSystemKey
+from collections import Counter, namedtuple
+from contextlib import contextmanager
+from threading import Lock
+import base64
+import binascii
+import json
+
+
+class QueueManager(models.Manager):
+    BATCH_SIZE = 1000
+    queue_field = None
+    # The name of the PWS method validating a queue_field value
+    validator = None
+
+    def is_valid(self, pws, value):
+        return getattr(pws, self.validator)(value)
+
+    def add_many_to_queue(self, values, batch_size=None):
+        """
+        Validates and enqueues an iterable of identifiers, inserting in
+        batches and skipping those already queued. Returns counts of
+        inserted, already queued and invalid identifiers.
+        """
+        pws = PWS()
+        counts = {'inserted': 0, 'queued': 0, 'invalid': 0}
+        valid = []
+        for value in dict.fromkeys(values):
+            if self.is_valid(pws, value):
+                valid.append(value)
+            else:
+                counts['invalid'] += 1
+
+        connection = connections[router.db_for_write(self.model)]
+        sql = ('INSERT INTO {table} ({field}) SELECT unnest(%s::text[]) '
+               'ON CONFLICT DO NOTHING RETURNING {field}').format(
+                   table=connection.ops.quote_name(self.model._meta.db_table),
+                   field=connection.ops.quote_name(
+                       self.model._meta.get_field(self.queue_field).column))
+        batch_size = batch_size or self.BATCH_SIZE
+        with connection.cursor() as cursor:
+            for index in range(0, len(valid), batch_size):
+                batch = valid[index:index + batch_size]
+                cursor.execute(sql, [batch])
+                inserted = len(cursor.fetchall())
+                counts['inserted'] += inserted
+                counts['queued'] += len(batch) - inserted
+
+        return counts
+
+    @contextmanager
+    def claim_batch(self, size):
+        """
+        Locks and yields up to size queued rows, skipping rows claimed by
+        other workers. The claim lasts for the duration of the block, in
+        which each row should be passed to ack() or release(); rows left
+        unacknowledged, or the whole batch if the block raises, return to
+        the queue.
+        """
+        using = router.db_for_write(self.model)
+        with transaction.atomic(using=using):
+            yield list(self.using(using).select_for_update(
+                skip_locked=True).order_by('pk')[:size])
+
+    def ack(self, items):
+        """
+        Removes processed rows claimed with claim_batch from the queue.
+        """
+        self.filter(pk__in=[item.pk for item in items]).delete()
+
+    def release(self, items):
+        """
+        Moves rows claimed with claim_batch to the back of the queue, so that
+        an unprocessable row doesn't block the rows behind it.
+        """
+        self.ack(items)
+        self.bulk_create([
+            self.model(**{self.queue_field: getattr(item, self.queue_field)})
+            for item in items], ignore_conflicts=True)
+
+
+class PersonQueueManager(QueueManager):
+    queue_field = 'uwnetid'
+    validator = 'valid_uwnetid'
 
-
-class PersonQueueManager(models.Manager):
     def add_to_queue(self, uwnetid):
         if PWS().valid_uwnetid(uwnetid):
             pq, _ = PersonQueue.objects.get_or_create(uwnetid=uwnetid)
@@ -29,7 +115,10 @@ class PersonQueue(models.Model):
     objects = PersonQueueManager()
 
 
-class EnrolledStudentQueueManager(models.Manager):
+class EnrolledStudentQueueManager(QueueManager):
+    queue_field = 'system_key'
+    validator = 'valid_student_system_key'
+
     def add_to_queue(self, system_key):
         if PWS().valid_student_system_key(system_key):
             esq, _ = EnrolledStudentQueue.objects.get_or_create(
@@ -49,113 +138,584 @@ class EnrolledStudentQueue(models.Model):
     objects = EnrolledStudentQueueManager()
 
 
-class PersonManager(models.Manager):
-    def _include(self, **kwargs):
-        related_fields = []
-        if kwargs.get('include_employee'):
-            related_fields.append('employee_set')
-        if kwargs.get('include_student'):
-            related_fields.append('student_set')
-            if kwargs.get('include_student_transcripts'):
-                related_fields.append('transcript_set')
-            if kwargs.get('include_student_transfers'):
-                related_fields.append('transfer_set')
-            if kwargs.get('include_student_holds'):
-                related_fields.append('studenthold_set')
-            if kwargs.get('include_student_degrees'):
-                related_fields.append('degree_set')
-        return related_fields
-
-    def _assemble(self, person, **kwargs):
-        if kwargs.get('include_employee'):
-            try:
-                person.employee = person.employee_set.get()
-            except Employee.DoesNotExist:
-                pass
-
-        if kwargs.get('include_student'):
-            try:
-                person.student = person.student_set.get()
-            except Student.DoesNotExist:
+DIRECTORY_STUDENT_FIELDS = (
+    'person', 'academic_term', 'system_key', 'student_number',
+    'student_email', 'external_email', 'class_code', 'class_desc',
+    'campus_code', 'campus_desc', 'cumulative_gpa', 'directory_release_ind',
+    'registered_in_quarter', 'enroll_status_code', 'last_changed',
+    'major_1', 'major_2', 'major_3', 'pending_major_1', 'pending_major_2',
+    'pending_major_3', 'intended_major1_code', 'intended_major2_code',
+    'intended_major3_code', 'requested_major1_code', 'requested_major2_code',
+    'requested_major3_code')
+
+ADVISING_STUDENT_FIELDS = DIRECTORY_STUDENT_FIELDS + (
+    'local_phone_number', 'gender', 'total_credits',
+    'total_deductible_credits', 'total_extension_credits',
+    'total_grade_attempted', 'total_grade_points',
+    'total_lower_div_transfer_credits', 'total_non_graded_credits',
+    'total_registered_credits', 'total_transfer_credits', 'total_uw_credits',
+    'total_upper_div_transfer_credits', 'resident_code', 'resident_desc',
+    'admitted_for_yr_qtr_desc', 'admitted_for_yr_qtr_id',
+    'application_type_code', 'application_type_desc',
+    'applied_to_graduate_yr_qtr_desc', 'applied_to_graduate_yr_qtr_id',
+    'enroll_status_request_code', 'enroll_status_desc',
+    'first_generation_4yr_ind', 'first_generation_ind',
+    'honors_program_code', 'honors_program_ind', 'special_program_code',
+    'special_program_desc', 'last_enrolled_yr_qtr_desc',
+    'last_enrolled_yr_qtr_id', 'reg_first_yr_qtr_desc',
+    'reg_first_yr_qtr_id', 'registration_hold_ind',
+    'new_continuing_returning_code', 'new_continuing_returning_desc',
+    'veteran_benefit_code', 'veteran_benefit_desc', 'veteran_desc',
+    'visa_type', 'disability_ind', 'spp_qtrs_allowed', 'spp_qtrs_used',
+    'spp_status', 'spp_category')
+
+# Named column projections accepted as the profile argument of PersonManager
+# methods. Each maps a model to the fields loaded for it, or to None to load
+# all of its columns. Person and employee rows are narrow, so only student
+# rows are projected.
+PROFILES = {
+    'full': {'person': None, 'employee': None, 'student': None},
+    'directory': {
+        'person': None, 'employee': None,
+        'student': DIRECTORY_STUDENT_FIELDS},
+    'advising': {
+        'person': None, 'employee': None,
+        'student': ADVISING_STUDENT_FIELDS},
+}
+
+
+class PersonLoadingPlan:
+    """
+    Translates the include_* flags accepted by PersonManager methods into
+    the prefetches needed to load them, so that the number of queries is
+    fixed regardless of how many persons a queryset returns. The profile
+    argument selects the columns loaded, see PROFILES.
+    """
+    def __init__(self, **kwargs):
+        self.profile = kwargs.get('profile') or 'full'
+        try:
+            self.fields = PROFILES[self.profile]
+        except KeyError:
+            raise ValueError('Unknown profile: {}'.format(self.profile))
+        self.include_employee = bool(kwargs.get('include_employee'))
+        self.include_student = bool(kwargs.get('include_student'))
+        self.include_student_transcripts = self.include_student and bool(
+            kwargs.get('include_student_transcripts'))
+        self.include_student_transfers = self.include_student and bool(
+            kwargs.get('include_student_transfers'))
+        self.include_student_holds = self.include_student and bool(
+            kwargs.get('include_student_holds'))
+        self.include_student_degrees = self.include_student and bool(
+            kwargs.get('include_student_degrees'))
+        self.include_student_advisers = self.include_student and bool(
+            kwargs.get('include_student_advisers'))
+        self.include_student_sports = self.include_student and bool(
+            kwargs.get('include_student_sports'))
+
+    def cache_key(self):
+        return self.profile + ''.join('1' if include else '0' for include in (
+            self.include_employee, self.include_student,
+            self.include_student_transcripts, self.include_student_transfers,
+            self.include_student_holds, self.include_student_degrees,
+            self.include_student_advisers, self.include_student_sports))
+
+    def project(self, queryset, name):
+        if self.fields[name] is not None:
+            queryset = queryset.only(*self.fields[name])
+        return queryset
+
+    def version_aggregates(self):
+        # The latest _last_changed of the person and each included relation,
+        # as version() computes it from the loaded rows
+        aggregates = {'_person_changed': Max('last_changed')}
+        if self.include_employee:
+            aggregates['_employee_changed'] = Max('employee__last_changed')
+        if self.include_student:
+            aggregates['_student_changed'] = Max('student__last_changed')
+        return aggregates
+
+    def version(self, person):
+        def last_changed(objs):
+            values = [obj.last_changed for obj in objs
+                      if obj.last_changed is not None]
+            return max(values) if len(values) else None
+
+        version = [person.last_changed]
+        if self.include_employee:
+            version.append(last_changed(person.employee_set.all()))
+        if self.include_student:
+            version.append(last_changed(person.student_set.all()))
+        return tuple(version)
+
+    def identifiers(self, person):
+        # Prior identifiers may since have been reassigned, so a person is
+        # only cached under one if it was the identifier looked up
+        identifiers = [('uwnetid', person.uwnetid),
+                       ('uwregid', person.uwregid),
+                       ('system_key', person.system_key)]
+        if person.student is not None:
+            identifiers.append(
+                ('student_number', person.student.student_number))
+        return [(kind, value) for kind, value in identifiers if value]
+
+    def select_references(self, queryset, *fields):
+        # Reference tables with a cache are resolved from it, not joined
+        fields = [field for field in fields if queryset.model._meta.get_field(
+            field).related_model.objects.cache is None]
+        if len(fields):
+            queryset = queryset.select_related(*fields)
+        return queryset
+
+    def student_queryset(self):
+        queryset = self.project(self.select_references(
+            Student.objects.all(), 'academic_term', 'major_1', 'major_2',
+            'major_3', 'pending_major_1', 'pending_major_2',
+            'pending_major_3'), 'student')
+
+        prefetches = []
+        if self.include_student_advisers:
+            prefetches.append(Prefetch(
+                'advisers', queryset=Adviser.objects.select_related(
+                    'employee__person')))
+        if self.include_student_sports:
+            prefetches.append('sports')
+        if self.include_student_transcripts:
+            prefetches.append(Prefetch(
+                'transcript_set', queryset=self.select_references(
+                    Transcript.objects.all(), 'tran_term',
+                    'leave_ends_term')))
+        if self.include_student_transfers:
+            prefetches.append('transfer_set')
+        if self.include_student_holds:
+            prefetches.append('studenthold_set')
+        if self.include_student_degrees:
+            prefetches.append(Prefetch(
+                'degree_set', queryset=self.select_references(
+                    Degree.objects.all(), 'degree_term')))
+
+        return queryset.prefetch_related(*prefetches)
+
+    def prefetches(self):
+        prefetches = []
+        if self.include_employee:
+            prefetches.append(Prefetch('employee_set', queryset=self.project(
+                Employee.objects.all(), 'employee')))
+        if self.include_student:
+            prefetches.append(Prefetch(
+                'student_set', queryset=self.student_queryset()))
+        return prefetches
+
+    def apply(self, queryset):
+        queryset = self.project(queryset, 'person')
+        prefetches = self.prefetches()
+        if len(prefetches):
+            queryset = queryset.prefetch_related(*prefetches)
+        return queryset
+
+    def assemble(self, person):
+        if self.include_employee:
+            employees = person.employee_set.all()
+            if len(employees):
+                person.employee = employees[0]
+
+        if self.include_student:
+            students = person.student_set.all()
+            if not len(students):
                 return person
 
-            if kwargs.get('include_student_transcripts'):
+            person.student = students[0]
+            if self.include_student_sports and (
+                    Sport.objects.cache is not None):
+                # Share the cached instance of each prefetched sport
+                sports = person.student.sports.all()
+                sports._result_cache = [
+                    Sport.objects.cache.get(Sport, sport.pk) or sport
+                    for sport in sports]
+            if self.include_student_transcripts:
                 person.student.transcripts = person.student.transcript_set
-            if kwargs.get('include_student_transfers'):
+            if self.include_student_transfers:
                 person.student.transfers = person.student.transfer_set
-            if kwargs.get('include_student_holds'):
+            if self.include_student_holds:
                 person.student.holds = person.student.studenthold_set
-            if kwargs.get('include_student_degrees'):
+            if self.include_student_degrees:
                 person.student.degrees = person.student.degree_set
 
         return person
 
+
+PersonPage = namedtuple('PersonPage', ['persons', 'next_cursor'])
+
+
+def encode_cursor(pk):
+    return base64.urlsafe_b64encode(
+        json.dumps({'id': pk}).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        data = json.loads(base64.urlsafe_b64decode(
+            cursor + '=' * (-len(cursor) % 4)))
+        return int(data['id'])
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise ValueError('Invalid cursor: {}'.format(cursor))
+
+
+class LookupCountMixin:
+    """
+    Counts the outcome of each lookup by kind, e.g. lookup_counts[('uwnetid',
+    'prior')] is the number of uwnetid lookups served by the prior_uwnetids
+    fallback.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lookup_counts = Counter()
+        self._lookup_counts_lock = Lock()
+
+    def count_lookup(self, kind, outcome):
+        with self._lookup_counts_lock:
+            self.lookup_counts[(kind, outcome)] += 1
+
+
+class ChangeFeedMixin:
+    """
+    Streams the rows whose last_changed is after a watermark, oldest first,
+    in keyset-paginated batches. A watermark is a (last_changed, pk) tuple,
+    normally that of the last row of the previous batch, so that rows sharing
+    a last_changed value are neither skipped nor repeated across batches.
+    Rows with no last_changed are never returned.
+    """
+    CHANGES_BATCH_SIZE = 1000
+
+    def _changes_queryset(self):
+        return super().get_queryset()
+
+    def _changes_batch(self, queryset, **kwargs):
+        return list(queryset)
+
+    def watermark(self, obj):
+        return (obj.last_changed, obj.pk)
+
+    def iter_changes(self, since=None, batch_size=None, **kwargs):
+        """
+        Yields lists of rows changed after since, which may be a datetime, a
+        watermark tuple or None for all rows.
+        """
+        batch_size = batch_size or self.CHANGES_BATCH_SIZE
+        last_changed, pk = (
+            since if isinstance(since, (tuple, list)) else (since, None))
+        queryset = self._changes_queryset().filter(
+            last_changed__isnull=False).order_by('last_changed', 'pk')
+
+        while True:
+            batch_queryset = queryset
+            if last_changed is not None:
+                query = Q(last_changed__gt=last_changed)
+                if pk is not None:
+                    query |= Q(last_changed=last_changed, pk__gt=pk)
+                batch_queryset = queryset.filter(query)
+
+            batch = self._changes_batch(
+                batch_queryset[:batch_size], **kwargs)
+            if not len(batch):
+                return
+            yield batch
+            if len(batch) < batch_size:
+                return
+            last_changed, pk = self.watermark(batch[-1])
+
+
+class ChangeFeedManager(ChangeFeedMixin, models.Manager):
+    pass
+
+
+class PersonManager(ChangeFeedMixin, LookupCountMixin, models.Manager):
+    ITERATOR_CHUNK_SIZE = 2000
+    PAGE_SIZE = 500
+
+    # Lookup kinds, mapped to the current and prior identifier fields
+    LOOKUPS = {
+        'uwnetid': ('uwnetid', 'prior_uwnetids'),
+        'uwregid': ('uwregid', 'prior_uwregids'),
+        'system_key': ('system_key', None),
+        'student_number': ('student__student_number', None),
+    }
+
+    # An optional uw_person_client.cache.PersonCache instance, consulted by
+    # the get_person_by_* methods
+    cache = None
+
+    def _assemble(self, person, **kwargs):
+        return PersonLoadingPlan(**kwargs).assemble(person)
+
     def _get_person(self, queryset, **kwargs):
-        related_fields = self._include(**kwargs)
+        plan = PersonLoadingPlan(**kwargs)
+        return plan.assemble(plan.apply(queryset).get())
+
+    def _get_persons(self, queryset, **kwargs):
+        plan = PersonLoadingPlan(**kwargs)
+        return [plan.assemble(person) for person in plan.apply(queryset)]
+
+    def _iter_persons(self, queryset, chunk_size=None, **kwargs):
+        plan = PersonLoadingPlan(**kwargs)
+        queryset = plan.apply(queryset.order_by('pk'))
+        for person in queryset.iterator(
+                chunk_size=chunk_size or self.ITERATOR_CHUNK_SIZE):
+            yield plan.assemble(person)
+
+    def _paginate_persons(self, queryset, cursor=None, after_id=None,
+                          page_size=None, **kwargs):
+        page_size = page_size or self.PAGE_SIZE
+        if cursor is not None:
+            after_id = decode_cursor(cursor)
+        if after_id is not None:
+            queryset = queryset.filter(pk__gt=after_id)
+
+        persons = self._get_persons(
+            queryset.order_by('pk')[:page_size], **kwargs)
+        next_cursor = None
+        if len(persons) == page_size:
+            next_cursor = encode_cursor(persons[-1].pk)
+        return PersonPage(persons, next_cursor)
+
+    def _bulk_lookup_queryset(self, kind, identifiers):
+        field, prior_field = self.LOOKUPS[kind]
+        query = Q(**{'{}__in'.format(field): identifiers})
+        if prior_field is not None:
+            query |= Q(**{'{}__overlap'.format(prior_field): identifiers})
+        return super().get_queryset().filter(query).annotate(
+            _lookup_value=F(field))
+
+    def _active_queryset(self, field):
+        return super().get_queryset().filter(**{field: True})
+
+    def _get_persons_by(self, kind, identifiers, **kwargs):
+        field, prior_field = self.LOOKUPS[kind]
+        identifiers = list(dict.fromkeys(identifiers))
+        results = dict.fromkeys(identifiers)
+        if not len(identifiers):
+            return results
+
+        prior_matches = {}
+        for person in self._get_persons(
+                self._bulk_lookup_queryset(kind, identifiers), **kwargs):
+            if person._lookup_value in results:
+                results[person._lookup_value] = person
+            if prior_field is not None:
+                for value in getattr(person, prior_field):
+                    prior_matches.setdefault(value, person)
+
+        # A current identifier match takes precedence over a prior one
+        for value, person in prior_matches.items():
+            if value in results and results[value] is None:
+                results[value] = person
+
+        return results
+
+    def _changes_batch(self, queryset, **kwargs):
+        return self._get_persons(queryset, **kwargs)
+
+    def _last_changed(self, person, plan):
+        return self._last_changed_queryset(person, plan).first()
+
+    async def _alast_changed(self, person, plan):
+        return await self._last_changed_queryset(person, plan).afirst()
+
+    def _last_changed_queryset(self, person, plan):
+        aggregates = plan.version_aggregates()
+        return super().get_queryset().filter(pk=person.pk).values(
+            'pk').annotate(**aggregates).values_list(*aggregates)
+
+    def _lookup_querysets(self, kind, identifier):
+        field, prior_field = self.LOOKUPS[kind]
+        queryset = super().get_queryset()
+        querysets = [queryset.filter(**{field: identifier})]
+        if prior_field is not None:
+            # Fall back to the prior identifiers only when the unique index
+            # lookup on the current identifier misses
+            querysets.append(queryset.filter(
+                **{'{}__contains'.format(prior_field): [identifier]}))
+        return zip(querysets, ['exact', 'prior'])
+
+    def _cache_keys(self, person, plan, key):
+        keys = [self.cache.make_key(kind, identifier, plan.cache_key())
+                for kind, identifier in plan.identifiers(person)]
+        if key not in keys:
+            keys.append(key)
+        return keys
+
+    def _get_person_by(self, kind, identifier, **kwargs):
+        plan = PersonLoadingPlan(**kwargs)
+        if self.cache is not None:
+            key = self.cache.make_key(kind, identifier, plan.cache_key())
+            person = self.cache.get(key, validate=lambda p, version: (
+                self._last_changed(p, plan) == version))
+            if person is not None:
+                return person
 
-        if len(related_fields):
-            queryset.prefetch_related(*related_fields)
+        for queryset, outcome in self._lookup_querysets(kind, identifier):
+            try:
+                person = self._get_person(queryset, **kwargs)
+                self.count_lookup(kind, outcome)
+                break
+            except Person.DoesNotExist:
+                pass
+        else:
+            self.count_lookup(kind, 'not_found')
+            raise PersonNotFoundException(identifier)
 
-        return self._assemble(queryset.get(), **kwargs)
+        if self.cache is not None:
+            self.cache.set(person, plan.version(person),
+                           self._cache_keys(person, plan, key))
+        return person
 
-    def get_person_by_uwnetid(self, uwnetid, **kwargs):
-        queryset = super().get_queryset().filter(
-            Q(uwnetid=uwnetid) | Q(prior_uwnetids__contains=[uwnetid]))
+    async def _aget_person_by(self, kind, identifier, **kwargs):
+        plan = PersonLoadingPlan(**kwargs)
+        if self.cache is not None:
+            key = self.cache.make_key(kind, identifier, plan.cache_key())
 
-        try:
-            return self._get_person(queryset, **kwargs)
-        except Person.DoesNotExist:
-            raise PersonNotFoundException(uwnetid)
+            async def validate(person, version):
+                return await self._alast_changed(person, plan) == version
 
-    def get_person_by_uwregid(self, uwregid, **kwargs):
-        queryset = super().get_queryset().filter(
-            Q(uwregid=uwregid) | Q(prior_uwregids__contains=[uwregid]))
+            person = await self.cache.aget(key, validate=validate)
+            if person is not None:
+                return person
 
-        try:
-            return self._get_person(queryset, **kwargs)
-        except Person.DoesNotExist:
-            raise PersonNotFoundException(uwregid)
+        for queryset, outcome in self._lookup_querysets(kind, identifier):
+            try:
+                person = plan.assemble(await plan.apply(queryset).aget())
+                self.count_lookup(kind, outcome)
+                break
+            except Person.DoesNotExist:
+                pass
+        else:
+            self.count_lookup(kind, 'not_found')
+            raise PersonNotFoundException(identifier)
 
-    def get_person_by_system_key(self, system_key, **kwargs):
-        queryset = super().get_queryset().filter(system_key=system_key)
+        if self.cache is not None:
+            await self.cache.aset(person, plan.version(person),
+                                  self._cache_keys(person, plan, key))
+        return person
 
-        try:
-            return self._get_person(queryset, **kwargs)
-        except Person.DoesNotExist:
-            raise PersonNotFoundException(system_key)
+    @instrumented
+    def get_person_by_uwnetid(self, uwnetid, **kwargs):
+        return self._get_person_by('uwnetid', uwnetid, **kwargs)
+
+    @instrumented
+    def get_person_by_uwregid(self, uwregid, **kwargs):
+        return self._get_person_by('uwregid', uwregid, **kwargs)
 
+    @instrumented
+    def get_person_by_system_key(self, system_key, **kwargs):
+        return self._get_person_by('system_key', system_key, **kwargs)
+
+    @instrumented
     def get_person_by_student_number(self, student_number, **kwargs):
-        queryset = super().get_queryset().filter(
-            student__student_number=student_number)
+        return self._get_person_by('student_number', student_number, **kwargs)
 
-        try:
-            return self._get_person(queryset, **kwargs)
-        except Person.DoesNotExist:
-            raise PersonNotFoundException(student_number)
+    async def aget_person_by_uwnetid(self, uwnetid, **kwargs):
+        return await self._aget_person_by('uwnetid', uwnetid, **kwargs)
 
-    def get_active_students(self, **kwargs):
-        queryset = super().get_queryset().filter(is_active_student=True)
+    async def aget_person_by_uwregid(self, uwregid, **kwargs):
+        return await self._aget_person_by('uwregid', uwregid, **kwargs)
 
-        related_fields = self._include(**kwargs)
-        if len(related_fields):
-            queryset.prefetch_related(*related_fields)
+    async def aget_person_by_system_key(self, system_key, **kwargs):
+        return await self._aget_person_by('system_key', system_key, **kwargs)
 
-        persons = []
-        for person in queryset:
-            persons.append(self._assemble(person, **kwargs))
-        return persons
+    async def aget_person_by_student_number(self, student_number, **kwargs):
+        return await self._aget_person_by(
+            'student_number', student_number, **kwargs)
 
-    def get_active_employees(self, **kwargs):
-        queryset = super().get_queryset().filter(is_active_employee=True)
+    @instrumented
+    def get_persons_by_uwnetids(self, uwnetids, **kwargs):
+        """
+        Returns a dict mapping each requested uwnetid (current or prior) to
+        its Person, or to None if no person was found.
+        """
+        return self._get_persons_by('uwnetid', uwnetids, **kwargs)
+
+    @instrumented
+    def get_persons_by_uwregids(self, uwregids, **kwargs):
+        return self._get_persons_by('uwregid', uwregids, **kwargs)
 
-        related_fields = self._include(**kwargs)
-        if len(related_fields):
-            queryset.prefetch_related(*related_fields)
+    @instrumented
+    def get_persons_by_system_keys(self, system_keys, **kwargs):
+        return self._get_persons_by('system_key', system_keys, **kwargs)
 
-        persons = []
-        for person in queryset:
-            persons.append(self._assemble(person, **kwargs))
-        return persons
+    @instrumented
+    def get_persons_by_student_numbers(self, student_numbers, **kwargs):
+        return self._get_persons_by(
+            'student_number', student_numbers, **kwargs)
+
+    @instrumented
+    def get_active_students(self, **kwargs):
+        queryset = self._active_queryset('is_active_student')
+        return self._get_persons(queryset, **kwargs)
+
+    @instrumented
+    def get_active_employees(self, **kwargs):
+        queryset = self._active_queryset('is_active_employee')
+        return self._get_persons(queryset, **kwargs)
+
+    @instrumented
+    def paginate_active_students(self, cursor=None, after_id=None,
+                                 page_size=None, **kwargs):
+        """
+        Returns a PersonPage of up to page_size active students, ordered by
+        id, with the include_* prefetches applied to the page. Pass the
+        page's next_cursor to get the following page; next_cursor is None
+        on the last page.
+        """
+        queryset = self._active_queryset('is_active_student')
+        return self._paginate_persons(
+            queryset, cursor=cursor, after_id=after_id, page_size=page_size,
+            **kwargs)
+
+    @instrumented
+    def paginate_active_employees(self, cursor=None, after_id=None,
+                                  page_size=None, **kwargs):
+        """
+        Paginated variant of get_active_employees, see
+        paginate_active_students.
+        """
+        queryset = self._active_queryset('is_active_employee')
+        return self._paginate_persons(
+            queryset, cursor=cursor, after_id=after_id, page_size=page_size,
+            **kwargs)
+
+    async def _aiter_persons(self, queryset, chunk_size=None, **kwargs):
+        plan = PersonLoadingPlan(**kwargs)
+        queryset = plan.apply(queryset.order_by('pk'))
+        async for person in queryset.aiterator(
+                chunk_size=chunk_size or self.ITERATOR_CHUNK_SIZE):
+            yield plan.assemble(person)
+
+    def iter_active_students(self, chunk_size=None, **kwargs):
+        """
+        Generator variant of get_active_students, reading persons through a
+        server-side cursor in chunks of chunk_size, with the include_*
+        prefetches applied to each chunk.
+        """
+        queryset = self._active_queryset('is_active_student')
+        return self._iter_persons(queryset, chunk_size=chunk_size, **kwargs)
+
+    def iter_active_employees(self, chunk_size=None, **kwargs):
+        """
+        Generator variant of get_active_employees, see iter_active_students.
+        """
+        queryset = self._active_queryset('is_active_employee')
+        return self._iter_persons(queryset, chunk_size=chunk_size, **kwargs)
+
+    def aget_active_students(self, chunk_size=None, **kwargs):
+        """
+        Async iterator variant of get_active_students, for use with
+        async for, see iter_active_students.
+        """
+        queryset = self._active_queryset('is_active_student')
+        return self._aiter_persons(queryset, chunk_size=chunk_size, **kwargs)
+
+    def aget_active_employees(self, chunk_size=None, **kwargs):
+        queryset = self._active_queryset('is_active_employee')
+        return self._aiter_persons(queryset, chunk_size=chunk_size, **kwargs)
 
 
 class Person(models.Model):
@@ -185,6 +745,14 @@ class Person(models.Model):
     class Meta:
         db_table = 'person'
         managed = False
+        indexes = [
+            GinIndex(fields=['prior_uwnetids'],
+                     name='person_prior_uwnetids_gin'),
+            GinIndex(fields=['prior_uwregids'],
+                     name='person_prior_uwregids_gin'),
+            models.Index(fields=['last_changed', 'id'],
+                         name='person_last_changed_idx'),
+        ]
 
     @property
     def employee(self):
@@ -209,9 +777,9 @@ class Person(models.Model):
         self._student = value
 
     def to_dict(self):
-        data = model_to_dict(self)
+        data = serialize(self)
         if self.employee is not None:
-            data['employee'] = self.employee.to_dict()
+            data['employee'] = self.employee.to_dict(include_person=False)
 
         if self.student is not None:
             data['student'] = self.student.to_dict()
@@ -230,25 +798,201 @@ class Employee(models.Model):
     last_changed = models.DateTimeField(
         db_column='_last_changed', blank=True, null=True)
 
+    objects = ChangeFeedManager()
+
     class Meta:
         db_table = 'employee'
         managed = False
-
-    def to_dict(self):
-        data = model_to_dict(self)
-        data['person'] = self.person.to_dict()
+        indexes = [
+            models.Index(fields=['last_changed', 'id'],
+                         name='employee_last_changed_idx'),
+        ]
+
+    def to_dict(self, include_person=True):
+        data = serialize(self)
+        if include_person:
+            data['person'] = self.person.to_dict()
         return data
 
 
-class AdviserManager(models.Manager):
+class AdviserManager(ChangeFeedMixin, LookupCountMixin, models.Manager):
+    # An optional uw_person_client.cache.AdviserDirectory instance, which
+    # serves the adviser lookups from an in-process snapshot
+    directory = None
+
+    def _changes_queryset(self):
+        return super().get_queryset().select_related('employee__person')
+
+    def _advisers_queryset(self):
+        return super().get_queryset().select_related(
+            'employee__person').order_by('pk')
+
+    def _lookup_querysets(self, uwnetid):
+        queryset = super().get_queryset().select_related('employee__person')
+        return zip([
+            queryset.filter(employee__person__uwnetid=uwnetid),
+            queryset.filter(
+                employee__person__prior_uwnetids__contains=[uwnetid]),
+        ], ['exact', 'prior'])
+
+    def _bulk_lookup_queryset(self, uwnetids):
+        return self._advisers_queryset().filter(
+            Q(employee__person__uwnetid__in=uwnetids) |
+            Q(employee__person__prior_uwnetids__overlap=uwnetids))
+
+    def _advisers_by_uwnetids(self, uwnetids):
+        """
+        Returns a dict mapping each uwnetid to the list of advisers for it,
+        or to None, in one query. A current uwnetid match takes precedence
+        over a prior one.
+        """
+        results = dict.fromkeys(uwnetids)
+        if not len(results):
+            return results
+
+        if self.directory is not None:
+            for uwnetid in results:
+                results[uwnetid], outcome = self.directory.lookup_all(uwnetid)
+                self.count_lookup('uwnetid', outcome)
+            return results
+
+        prior_matches = {}
+        for adviser in self._bulk_lookup_queryset(uwnetids):
+            person = adviser.employee.person
+            if person.uwnetid in results:
+                if results[person.uwnetid] is None:
+                    results[person.uwnetid] = []
+                results[person.uwnetid].append(adviser)
+            for value in person.prior_uwnetids:
+                prior_matches.setdefault(value, []).append(adviser)
+
+        for uwnetid, advisers in results.items():
+            if advisers is not None:
+                self.count_lookup('uwnetid', 'exact')
+            elif uwnetid in prior_matches:
+                results[uwnetid] = prior_matches[uwnetid]
+                self.count_lookup('uwnetid', 'prior')
+            else:
+                self.count_lookup('uwnetid', 'not_found')
+        return results
+
+    @instrumented
     def get_adviser_by_uwnetid(self, uwnetid):
-        queryset = super().get_queryset().filter(
-            Q(employee__person__uwnetid=uwnetid) | Q(
-                employee__person__prior_uwnetids__contains=[uwnetid]))
-        try:
-            return queryset.get()
-        except Adviser.DoesNotExist:
-            raise AdviserNotFoundException(uwnetid)
+        if self.directory is not None:
+            adviser, outcome = self.directory.lookup(uwnetid)
+            self.count_lookup('uwnetid', outcome)
+            if adviser is None:
+                raise AdviserNotFoundException(uwnetid)
+            return adviser
+
+        for queryset, outcome in self._lookup_querysets(uwnetid):
+            try:
+                adviser = queryset.get()
+                self.count_lookup('uwnetid', outcome)
+                return adviser
+            except Adviser.DoesNotExist:
+                pass
+
+        self.count_lookup('uwnetid', 'not_found')
+        raise AdviserNotFoundException(uwnetid)
+
+    async def aget_adviser_by_uwnetid(self, uwnetid):
+        if self.directory is not None:
+            # The directory may query to load or recheck its snapshot
+            adviser, outcome = await sync_to_async(self.directory.lookup)(
+                uwnetid)
+            self.count_lookup('uwnetid', outcome)
+            if adviser is None:
+                raise AdviserNotFoundException(uwnetid)
+            return adviser
+
+        for queryset, outcome in self._lookup_querysets(uwnetid):
+            try:
+                adviser = await queryset.aget()
+                self.count_lookup('uwnetid', outcome)
+                return adviser
+            except Adviser.DoesNotExist:
+                pass
+
+        self.count_lookup('uwnetid', 'not_found')
+        raise AdviserNotFoundException(uwnetid)
+
+    @instrumented
+    def get_advisers_by_uwnetids(self, uwnetids):
+        """
+        Returns a dict mapping each uwnetid to its Adviser, with the
+        employee and person loaded, or to None if there is no such adviser.
+        """
+        return {uwnetid: advisers[0] if advisers is not None else None
+                for uwnetid, advisers in self._advisers_by_uwnetids(
+                    list(dict.fromkeys(uwnetids))).items()}
+
+    @instrumented
+    def get_all_advisers(self, program=None, is_dept_adviser=None):
+        """
+        Returns the advisers, ordered by id, with the employee and person
+        loaded, optionally filtered by advising_program and is_dept_adviser.
+        """
+        if self.directory is not None:
+            return self.directory.advisers(
+                program=program, is_dept_adviser=is_dept_adviser)
+
+        queryset = self._advisers_queryset()
+        if program is not None:
+            queryset = queryset.filter(advising_program=program)
+        if is_dept_adviser is not None:
+            queryset = queryset.filter(is_dept_adviser=is_dept_adviser)
+        return list(queryset)
+
+    def _caseload_queryset(self, advisers):
+        return Person.objects.filter(student__advisers__in=advisers)
+
+    @instrumented
+    def get_students_for_adviser(self, uwnetid, **kwargs):
+        """
+        Returns the persons advised by the adviser with this uwnetid, ordered
+        by id, with the include_* flags of get_active_students.
+        """
+        adviser = self.get_adviser_by_uwnetid(uwnetid)
+        return Person.objects._get_persons(
+            self._caseload_queryset([adviser]).order_by('pk'), **kwargs)
+
+    def iter_students_for_adviser(self, uwnetid, chunk_size=None, **kwargs):
+        """
+        Generator variant of get_students_for_adviser, for large caseloads,
+        see PersonManager.iter_active_students.
+        """
+        adviser = self.get_adviser_by_uwnetid(uwnetid)
+        return Person.objects._iter_persons(
+            self._caseload_queryset([adviser]), chunk_size=chunk_size,
+            **kwargs)
+
+    @instrumented
+    def get_caseloads(self, uwnetids, **kwargs):
+        """
+        Returns a dict mapping each adviser uwnetid to the list of persons
+        they advise, or to None if there is no such adviser, in a fixed
+        number of queries.
+        """
+        results = dict.fromkeys(uwnetids)
+        uwnetids_by_adviser = {}
+        for uwnetid, advisers in self._advisers_by_uwnetids(
+                list(results)).items():
+            if advisers is not None:
+                results[uwnetid] = []
+                for adviser in advisers:
+                    uwnetids_by_adviser.setdefault(
+                        adviser.pk, []).append(uwnetid)
+        if not len(uwnetids_by_adviser):
+            return results
+
+        queryset = self._caseload_queryset(
+            list(uwnetids_by_adviser)).annotate(
+                _adviser_id=F('student__advisers')).order_by('pk')
+        for person in Person.objects._get_persons(queryset, **kwargs):
+            for uwnetid in uwnetids_by_adviser[person._adviser_id]:
+                results[uwnetid].append(person)
+        return results
 
 
 class Adviser(models.Model):
@@ -267,24 +1011,60 @@ class Adviser(models.Model):
     class Meta:
         db_table = 'adviser'
         managed = False
+        indexes = [
+            models.Index(fields=['last_changed', 'id'],
+                         name='adviser_last_changed_idx'),
+        ]
 
     def to_dict(self):
-        data = model_to_dict(self)
+        data = serialize(self)
         data['employee'] = self.employee.to_dict()
         return data
 
 
+class ReferenceManager(models.Manager):
+    # An optional uw_person_client.cache.ReferenceDataCache instance, which
+    # foreign keys to this model are resolved from
+    cache = None
+
+
+class ReferenceForwardDescriptor(ForwardManyToOneDescriptor):
+    def get_object(self, instance):
+        cache = self.field.related_model.objects.cache
+        if cache is not None:
+            obj = cache.get(self.field.related_model,
+                            getattr(instance, self.field.attname))
+            if obj is not None:
+                return obj
+        return super().get_object(instance)
+
+
+class ReferenceForeignKey(models.ForeignKey):
+    """
+    A foreign key to a reference table (Term, Major or Sport), resolved from
+    the ReferenceManager cache of the related model, when one is set, rather
+    than with a query.
+    """
+    forward_related_accessor_class = ReferenceForwardDescriptor
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        return name, 'django.db.models.ForeignKey', args, kwargs
+
+
 class Term(models.Model):
     year = models.SmallIntegerField()
     quarter = models.SmallIntegerField()
 
+    objects = ReferenceManager()
+
     class Meta:
         db_table = 'term'
         managed = False
         unique_together = (('year', 'quarter'),)
 
     def to_dict(self):
-        return model_to_dict(self)
+        return serialize(self)
 
 
 class Major(models.Model):
@@ -325,12 +1105,14 @@ class Major(models.Model):
     major_branch_name = models.TextField(blank=True, null=True)
     major_college_name = models.TextField(blank=True, null=True)
 
+    objects = ReferenceManager()
+
     class Meta:
         db_table = 'major'
         managed = False
 
     def to_dict(self):
-        return model_to_dict(self)
+        return serialize(self)
 
 
 class Sport(models.Model):
@@ -342,17 +1124,19 @@ class Sport(models.Model):
     sport_reg_pr_sum = models.BooleanField(blank=True, null=True)
     sport_reg_pr_win = models.BooleanField(blank=True, null=True)
 
+    objects = ReferenceManager()
+
     class Meta:
         db_table = 'sport'
         managed = False
 
     def to_dict(self):
-        return model_to_dict(self)
+        return serialize(self)
 
 
 class Student(models.Model):
     person = models.ForeignKey(Person, models.DO_NOTHING)
-    academic_term = models.ForeignKey(
+    academic_term = ReferenceForeignKey(
         Term, models.DO_NOTHING, blank=True, null=True)
     advisers = models.ManyToManyField(Adviser, through='StudentToAdviser')
     sports = models.ManyToManyField(Sport, through='StudentToSport')
@@ -464,22 +1248,22 @@ class Student(models.Model):
     requested_major1_code = models.TextField(blank=True, null=True)
     requested_major2_code = models.TextField(blank=True, null=True)
     requested_major3_code = models.TextField(blank=True, null=True)
-    major_1 = models.ForeignKey(
+    major_1 = ReferenceForeignKey(
         Major, models.DO_NOTHING, related_name='student_major_1_set',
         blank=True, null=True)
-    major_2 = models.ForeignKey(
+    major_2 = ReferenceForeignKey(
         Major, models.DO_NOTHING, related_name='student_major_2_set',
         blank=True, null=True)
-    major_3 = models.ForeignKey(
+    major_3 = ReferenceForeignKey(
         Major, models.DO_NOTHING, related_name='student_major_3_set',
         blank=True, null=True)
-    pending_major_1 = models.ForeignKey(
+    pending_major_1 = ReferenceForeignKey(
         Major, models.DO_NOTHING, related_name='student_pending_major_1_set',
         blank=True, null=True)
-    pending_major_2 = models.ForeignKey(
+    pending_major_2 = ReferenceForeignKey(
         Major, models.DO_NOTHING, related_name='student_pending_major_2_set',
         blank=True, null=True)
-    pending_major_3 = models.ForeignKey(
+    pending_major_3 = ReferenceForeignKey(
         Major, models.DO_NOTHING, related_name='student_pending_major_3_set',
         blank=True, null=True)
     enroll_status_request_code = models.TextField(blank=True, null=True)
@@ -505,9 +1289,37 @@ class Student(models.Model):
     ethnic_under_rep = models.BooleanField(blank=True, null=True)
     hispanic_under_rep = models.BooleanField(blank=True, null=True)
 
+    objects = ChangeFeedManager()
+
     class Meta:
         db_table = 'student'
         managed = False
+        indexes = [
+            models.Index(fields=['last_changed', 'id'],
+                         name='student_last_changed_idx'),
+        ]
+
+    # Included child sets are assigned as related managers, which can't be
+    # pickled, so they are restored from the prefetch cache on unpickling
+    INCLUDED_SETS = {
+        '_transcripts': 'transcript_set',
+        '_transfers': 'transfer_set',
+        '_holds': 'studenthold_set',
+        '_degrees': 'degree_set',
+    }
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['_included_sets'] = [
+            attr for attr in self.INCLUDED_SETS
+            if state.pop(attr, None) is not None]
+        return state
+
+    def __setstate__(self, state):
+        included_sets = state.pop('_included_sets', [])
+        super().__setstate__(state)
+        for attr in included_sets:
+            setattr(self, attr, getattr(self, self.INCLUDED_SETS[attr]))
 
     @property
     def majors(self):
@@ -626,7 +1438,7 @@ class Student(models.Model):
         self._degrees = value
 
     def to_dict(self):
-        data = model_to_dict(self)
+        data = serialize(self)
         data['academic_term'] = self.academic_term.to_dict()
         data['majors'] = [m.to_dict() for m in self.majors]
         data['pending_majors'] = [m.to_dict() for m in self.pending_majors]
@@ -671,7 +1483,7 @@ class StudentHold(models.Model):
         ordering = ['seq']
 
     def to_dict(self):
-        return model_to_dict(self)
+        return serialize(self)
 
 
 class StudentToAdviser(models.Model):
@@ -686,7 +1498,7 @@ class StudentToAdviser(models.Model):
 
 class StudentToSport(models.Model):
     student = models.ForeignKey(Student, models.DO_NOTHING)
-    sport = models.ForeignKey(Sport, models.DO_NOTHING)
+    sport = ReferenceForeignKey(Sport, models.DO_NOTHING)
 
     class Meta:
         db_table = 'student_to_sport'
@@ -696,7 +1508,7 @@ class StudentToSport(models.Model):
 
 class Degree(models.Model):
     student = models.ForeignKey(Student, models.DO_NOTHING)
-    degree_term = models.ForeignKey(
+    degree_term = ReferenceForeignKey(
         Term, models.DO_NOTHING, blank=True, null=True)
     campus_code = models.SmallIntegerField(blank=True, null=True)
     degree_abbr_code = models.TextField(blank=True, null=True)
@@ -734,7 +1546,7 @@ class Degree(models.Model):
             'degree_pathway_num'),)
 
     def to_dict(self):
-        data = model_to_dict(self)
+        data = serialize(self)
         if self.degree_term is not None:
             data['degree_term'] = self.degree_term.to_dict()
         return data
@@ -742,9 +1554,9 @@ class Degree(models.Model):
 
 class Transcript(models.Model):
     student = models.ForeignKey(Student, models.DO_NOTHING)
-    tran_term = models.ForeignKey(
+    tran_term = ReferenceForeignKey(
         Term, models.DO_NOTHING, blank=True, null=True)
-    leave_ends_term = models.ForeignKey(
+    leave_ends_term = ReferenceForeignKey(
         Term, models.DO_NOTHING, related_name='transcript_leave_ends_term_set',
         blank=True, null=True)
     veteran = models.SmallIntegerField(blank=True, null=True)
@@ -819,13 +1631,19 @@ class Transcript(models.Model):
     cmp_cum_total_earned = models.DecimalField(
         max_digits=5, decimal_places=1, blank=True, null=True)
 
+    objects = ChangeFeedManager()
+
     class Meta:
         db_table = 'transcript'
         managed = False
         ordering = ['-tran_term__year', '-tran_term__quarter']
+        indexes = [
+            models.Index(fields=['last_changed', 'id'],
+                         name='transcript_last_changed_idx'),
+        ]
 
     def to_dict(self):
-        data = model_to_dict(self)
+        data = serialize(self)
         if self.tran_term is not None:
             data['tran_term'] = self.tran_term.to_dict()
         if self.leave_ends_term is not None:
@@ -866,4 +1684,114 @@ class Transfer(models.Model):
         managed = False
 
     def to_dict(self):
-        return model_to_dict(self)
+        return serialize(self)
+
+
+class PersonSummaryManager(LookupCountMixin, models.Manager):
+    ITERATOR_CHUNK_SIZE = 2000
+
+    LOOKUPS = {
+        'uwnetid': ('uwnetid', 'prior_uwnetids'),
+        'uwregid': ('uwregid', 'prior_uwregids'),
+        'system_key': ('system_key', None),
+        'student_number': ('student_number', None),
+    }
+
+    def _get_summary_by(self, kind, identifier):
+        field, prior_field = self.LOOKUPS[kind]
+        queryset = super().get_queryset()
+        querysets = [(queryset.filter(**{field: identifier}), 'exact')]
+        if prior_field is not None:
+            querysets.append((queryset.filter(
+                **{'{}__contains'.format(prior_field): [identifier]}),
+                'prior'))
+
+        for queryset, outcome in querysets:
+            summary = queryset.first()
+            if summary is not None:
+                self.count_lookup(kind, outcome)
+                return summary
+
+        self.count_lookup(kind, 'not_found')
+        raise PersonNotFoundException(identifier)
+
+    @instrumented
+    def get_summary_by_uwnetid(self, uwnetid):
+        return self._get_summary_by('uwnetid', uwnetid)
+
+    @instrumented
+    def get_summary_by_uwregid(self, uwregid):
+        return self._get_summary_by('uwregid', uwregid)
+
+    @instrumented
+    def get_summary_by_system_key(self, system_key):
+        return self._get_summary_by('system_key', system_key)
+
+    @instrumented
+    def get_summary_by_student_number(self, student_number):
+        return self._get_summary_by('student_number', student_number)
+
+    @instrumented
+    def get_active_students(self):
+        return list(super().get_queryset().filter(
+            is_active_student=True).order_by('pk'))
+
+    @instrumented
+    def get_active_employees(self):
+        return list(super().get_queryset().filter(
+            is_active_employee=True).order_by('pk'))
+
+    def iter_active_students(self, chunk_size=None):
+        return super().get_queryset().filter(
+            is_active_student=True).order_by('pk').iterator(
+                chunk_size=chunk_size or self.ITERATOR_CHUNK_SIZE)
+
+    def iter_active_employees(self, chunk_size=None):
+        return super().get_queryset().filter(
+            is_active_employee=True).order_by('pk').iterator(
+                chunk_size=chunk_size or self.ITERATOR_CHUNK_SIZE)
+
+
+class PersonSummary(models.Model):
+    """
+    A flat, read-only record per person from the person_summary
+    materialized view, see uw_person_client.summary. The view is created by
+    initialize_person_db and is as current as its last refresh, see the
+    refresh_person_summary command.
+    """
+    # The loader and initialize_person_db skip materialized views
+    materialized_view = True
+
+    id = models.IntegerField(primary_key=True)
+    uwnetid = models.TextField(blank=True, null=True)
+    uwregid = models.TextField(blank=True, null=True)
+    system_key = models.TextField(blank=True, null=True)
+    student_number = models.TextField(blank=True, null=True)
+    prior_uwnetids = ArrayField(models.CharField(max_length=24))
+    prior_uwregids = ArrayField(models.CharField(max_length=32))
+    display_name = models.TextField(blank=True, null=True)
+    first_name = models.TextField(blank=True, null=True)
+    surname = models.TextField(blank=True, null=True)
+    preferred_first_name = models.TextField(blank=True, null=True)
+    preferred_surname = models.TextField(blank=True, null=True)
+    pronouns = models.TextField(blank=True, null=True)
+    email = models.TextField(blank=True, null=True)
+    class_code = models.SmallIntegerField(blank=True, null=True)
+    class_desc = models.TextField(blank=True, null=True)
+    major_name = models.TextField(blank=True, null=True)
+    adviser_uwnetids = ArrayField(models.TextField())
+    is_active_student = models.BooleanField(
+        db_column='_is_active_student', blank=True, null=True)
+    is_active_employee = models.BooleanField(
+        db_column='_is_active_employee', blank=True, null=True)
+    last_changed = models.DateTimeField(
+        db_column='_last_changed', blank=True, null=True)
+
+    objects = PersonSummaryManager()
+
+    class Meta:
+        db_table = 'person_summary'
+        managed = False
+
+    def to_dict(self):
+        return serialize(self)
@@ -0,0 +1,99 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.conf import settings
+from django.db import connections
+from asgiref.sync import async_to_sync, sync_to_async
+from uw_person_client.models import Person, Adviser
+from uw_person_client.exceptions import (
+    PersonNotFoundException, AdviserNotFoundException)
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+
+LOOKUP_KINDS = ('uwnetid', 'uwregid', 'system_key', 'student_number',
+                'adviser')
+
+
+class PersonResolver:
+    """
+    Resolves a batch of heterogeneous lookups, e.g.
+
+        PersonResolver().resolve([
+            ('uwnetid', 'javerage'), ('adviser', 'jadviser')],
+            include_student=True)
+
+    returning a dict mapping each (kind, identifier) to its Person (or
+    Adviser, for the 'adviser' kind), or to None if it wasn't found. Duplicate
+    lookups are resolved once, and lookups run concurrently on a dedicated
+    thread pool, each thread with its own database connection.
+
+    Concurrency defaults to one less than the max_size of the uw_person
+    connection pool, leaving a connection for the calling thread, or to 4
+    when no pool is configured. Each lookup's connection is closed, or
+    returned to the pool, after the lookup.
+
+    With thread_sensitive=True, lookups instead run one at a time on the
+    calling thread's connection, e.g. to see uncommitted data inside a
+    transaction.
+    """
+    def __init__(self, max_concurrency=None, thread_sensitive=False,
+                 using='uw_person'):
+        pool = settings.DATABASES.get(using, {}).get(
+            'OPTIONS', {}).get('pool')
+        if max_concurrency is None:
+            if isinstance(pool, dict):
+                max_size = pool.get('max_size') or pool.get('min_size', 4)
+                max_concurrency = max(1, max_size - 1)
+            else:
+                max_concurrency = 4
+
+        self.using = using
+        self.max_concurrency = max_concurrency
+        self.thread_sensitive = thread_sensitive
+        self.executor = None
+        if not thread_sensitive:
+            self.executor = ThreadPoolExecutor(
+                max_workers=max_concurrency,
+                thread_name_prefix='uw_person_resolver')
+
+    def _resolve(self, kind, identifier, kwargs):
+        try:
+            if kind == 'adviser':
+                return Adviser.objects.get_adviser_by_uwnetid(identifier)
+            return getattr(Person.objects, 'get_person_by_{}'.format(kind))(
+                identifier, **kwargs)
+        except (PersonNotFoundException, AdviserNotFoundException):
+            return None
+        finally:
+            # Executor threads don't outlive the resolver's use of them, so
+            # their connections are closed, or returned to the pool
+            if not self.thread_sensitive:
+                connections[self.using].close()
+
+    async def aresolve(self, lookups, **kwargs):
+        lookups = list(dict.fromkeys(
+            (kind, identifier) for kind, identifier in lookups))
+        for kind, identifier in lookups:
+            if kind not in LOOKUP_KINDS:
+                raise ValueError('Unknown lookup kind: {}'.format(kind))
+
+        resolve = sync_to_async(
+            self._resolve, thread_sensitive=self.thread_sensitive,
+            executor=self.executor)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded_resolve(kind, identifier):
+            async with semaphore:
+                return await resolve(kind, identifier, kwargs)
+
+        results = await asyncio.gather(*[
+            bounded_resolve(kind, identifier)
+            for kind, identifier in lookups])
+        return dict(zip(lookups, results))
+
+    def resolve(self, lookups, **kwargs):
+        return async_to_sync(self.aresolve)(lookups, **kwargs)
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown()
@@ -1,28 +1,174 @@
 # Copyright 2026 UW-IT, University of Washington
 # SPDX-License-Identifier: Apache-2.0
 
+from django.conf import settings
+from django.db import connections, DatabaseError
+from django.utils.connection import ConnectionDoesNotExist
+from asgiref.local import Local
+from threading import Lock, Thread
+import random
+import time
+
+# Seconds a replica is behind its primary, or 0 when it has replayed all the
+# WAL it has received (or is not a replica at all)
+REPLICA_LAG_SQL = (
+    'SELECT CASE WHEN NOT pg_is_in_recovery() THEN 0 '
+    'WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 '
+    'ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END')
+
 
 class UWPersonRouter:
     """
     A Django database router for projects that configure 'default' and
     'uw_person' databases.
+
+    Reads can be spread over replicas of the uw_person database with these
+    optional settings:
+
+        UW_PERSON_REPLICAS: a dict of replica aliases to weights, or a list
+            of aliases with equal weight
+        UW_PERSON_REPLICA_MAX_LAG: seconds a replica may be behind before
+            it is taken out of rotation (default 30)
+        UW_PERSON_REPLICA_CHECK_INTERVAL: seconds between health checks of
+            each replica (default 10)
+        UW_PERSON_STICKY_SECONDS: seconds after a write to a queue model
+            during which the writing thread reads queue models from the
+            primary (default UW_PERSON_REPLICA_MAX_LAG)
+
+    Replica health is checked on a background thread, and reads fall back
+    to the primary when no replica is healthy. Queries for related objects
+    read from the database their instance was loaded from.
     """
+    primary = 'uw_person'
+    sticky_models = ('personqueue', 'enrolledstudentqueue')
+
+    def __init__(self):
+        replicas = getattr(settings, 'UW_PERSON_REPLICAS', None) or {}
+        if not isinstance(replicas, dict):
+            replicas = dict.fromkeys(replicas, 1)
+        self.replicas = replicas
+        self.max_lag = getattr(settings, 'UW_PERSON_REPLICA_MAX_LAG', 30)
+        self.check_interval = getattr(
+            settings, 'UW_PERSON_REPLICA_CHECK_INTERVAL', 10)
+        self.sticky_seconds = getattr(
+            settings, 'UW_PERSON_STICKY_SECONDS', self.max_lag)
+        self._health = {}
+        self._health_lock = Lock()
+        self._checked = None
+        self._checking = False
+        self._local = Local()
+
+    def _is_person_model(self, model):
+        return model._meta.app_label == 'uw_person_client'
+
+    def replica_lag(self, alias):
+        # On a connection of its own, so that the check isn't routed, and
+        # isn't seen by query counts or execute wrappers on the caller's
+        if alias not in connections.settings:
+            raise ConnectionDoesNotExist(
+                'The connection {} does not exist.'.format(alias))
+        connection = connections.create_connection(alias)
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(REPLICA_LAG_SQL)
+                return cursor.fetchone()[0]
+        finally:
+            connection.close()
+
+    def is_healthy(self, alias):
+        now = time.monotonic()
+        with self._health_lock:
+            healthy, checked = self._health.get(alias, (None, None))
+        if checked is not None and now - checked < self.check_interval:
+            return healthy
+
+        try:
+            lag = self.replica_lag(alias)
+            healthy = lag is not None and lag <= self.max_lag
+        except (DatabaseError, ConnectionDoesNotExist):
+            healthy = False
+
+        with self._health_lock:
+            self._health[alias] = (healthy, now)
+        return healthy
+
+    def check_replicas(self):
+        with self._health_lock:
+            self._checked = time.monotonic()
+        for alias in self.replicas:
+            self.is_healthy(alias)
+
+    def _run_checks(self):
+        try:
+            self.check_replicas()
+        finally:
+            with self._health_lock:
+                self._checking = False
+
+    def schedule_checks(self):
+        """
+        Starts a background check of the replicas if one is due, so that
+        reads never wait on a health check.
+        """
+        with self._health_lock:
+            if self._checking or (
+                    self._checked is not None and
+                    time.monotonic() - self._checked < self.check_interval):
+                return
+            self._checking = True
+        Thread(target=self._run_checks, daemon=True,
+               name='uw_person_replica_check').start()
+
+    def healthy_replicas(self):
+        # A replica is out of rotation until its first check completes
+        self.schedule_checks()
+        with self._health_lock:
+            return [alias for alias in self.replicas
+                    if self._health.get(alias, (False, None))[0]]
+
+    def is_sticky(self, model):
+        if model._meta.model_name not in self.sticky_models:
+            return False
+        written = getattr(self._local, 'written', None)
+        return (written is not None and
+                time.monotonic() - written < self.sticky_seconds)
+
     def db_for_read(self, model, **hints):
-        if model._meta.app_label == 'uw_person_client':
-            return 'uw_person'
+        if self._is_person_model(model):
+            # Related and prefetch queries read from the same database as
+            # the instance they're for
+            instance = hints.get('instance')
+            if instance is not None and (
+                    instance._state.db == self.primary or
+                    instance._state.db in self.replicas):
+                return instance._state.db
+
+            if not len(self.replicas) or self.is_sticky(model):
+                return self.primary
+
+            replicas = self.healthy_replicas()
+            if not len(replicas):
+                return self.primary
+            return random.choices(
+                replicas, weights=[self.replicas[r] for r in replicas])[0]
         return None
 
     def db_for_write(self, model, **hints):
-        if model._meta.app_label == 'uw_person_client':
-            return 'uw_person'
+        if self._is_person_model(model):
+            if model._meta.model_name in self.sticky_models:
+                self._local.written = time.monotonic()
+            return self.primary
         return None
 
     def allow_relation(self, obj1, obj2, **hints):
+        databases = set(self.replicas) | {self.primary}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
         return None
 
     def allow_migrate(self, db, app_label, model_name=None, **hints):
         if app_label == 'uw_person_client':
-            return db == 'uw_person'
-        elif db == 'uw_person':
+            return db == self.primary
+        elif db == self.primary or db in self.replicas:
             return False
         return None
@@ -0,0 +1,89 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from contextlib import ExitStack, contextmanager
+from uw_person_client.exceptions import QueryNotAllowedException
+from operator import itemgetter
+
+_serializers = {}
+_encoder = DjangoJSONEncoder(separators=(',', ':'))
+
+
+class ModelSerializer:
+    """
+    Produces the same dict as django.forms.model_to_dict for the concrete
+    fields of a model, using an accessor compiled once per model instead of
+    walking the form field machinery for every instance. Many-to-many fields
+    are left to the model's to_dict.
+
+    Values are read straight from the instance __dict__. Fields deferred by
+    a PersonManager profile are left out rather than loaded.
+    """
+    def __init__(self, model):
+        fields = [f for f in model._meta.concrete_fields if f.editable]
+        attnames = [f.attname for f in fields]
+        self.fields = tuple(zip([f.name for f in fields], attnames))
+        self.names = tuple(f.name for f in fields)
+        self.getter = itemgetter(*attnames)
+
+    def serialize(self, instance):
+        values = instance.__dict__
+        try:
+            return dict(zip(self.names, self.getter(values)))
+        except KeyError:
+            return {name: values[attname] for name, attname in self.fields
+                    if attname in values}
+
+
+def get_serializer(model):
+    try:
+        return _serializers[model]
+    except KeyError:
+        serializer = _serializers[model] = ModelSerializer(model)
+        return serializer
+
+
+def serialize(instance):
+    return get_serializer(type(instance)).serialize(instance)
+
+
+def _forbid_query(execute, sql, params, many, context):
+    raise QueryNotAllowedException(sql)
+
+
+@contextmanager
+def no_queries():
+    """
+    Raises QueryNotAllowedException for any database query made within the
+    block, e.g. to guarantee that to_dict() is serializing an already
+    loaded graph:
+
+        with no_queries():
+            data = person.to_dict()
+    """
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(_forbid_query))
+        yield
+
+
+def dumps(data):
+    """
+    Encodes to_dict() output as JSON bytes.
+    """
+    return _encoder.encode(data).encode('utf-8')
+
+
+def iter_json(objects):
+    """
+    Streams a JSON array of the to_dict() output of each object as bytes,
+    e.g. for a StreamingHttpResponse over PersonManager.iter_active_students.
+    """
+    yield b'['
+    for index, obj in enumerate(objects):
+        if index:
+            yield b','
+        yield dumps(obj.to_dict())
+    yield b']'
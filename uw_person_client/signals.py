@@ -0,0 +1,19 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.dispatch import Signal
+
+# Sent after each instrumented PersonManager or AdviserManager call, with
+# the model class as sender and these arguments:
+#
+#   method: the manager method name, e.g. 'get_person_by_uwnetid'
+#   flags: the include_* and profile arguments the method was called with
+#   queries: the number of database queries made
+#   rows: the number of persons or advisers returned
+#   duration: wall time of the call, in seconds
+#   db_time: time spent executing queries, in seconds
+#   python_time: the rest of the call, outside query execution, e.g.
+#       building querysets, fetching and assembling model instances and
+#       checking caches, in seconds
+#   exception: the exception raised by the call, or None
+person_client_call = Signal()
@@ -0,0 +1,90 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.db import connections
+import time
+
+# A flat record per person, backing the PersonSummary model. A person's
+# first student and employee rows are used, as PersonManager does. This is
+# the current definition, used by initialize_person_db; migrations carry
+# their own copy, so a change to it needs a new migration.
+CREATE_PERSON_SUMMARY_SQL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS person_summary AS
+SELECT
+    p.id,
+    p.uwnetid,
+    p.uwregid,
+    p.system_key,
+    s.student_number,
+    p.prior_uwnetids,
+    p.prior_uwregids,
+    p.display_name,
+    p.first_name,
+    p.surname,
+    p.preferred_first_name,
+    p.preferred_surname,
+    p.pronouns,
+    COALESCE(s.student_email, e.email_addresses[1]) AS email,
+    s.class_code,
+    s.class_desc,
+    m.major_name,
+    COALESCE(a.adviser_uwnetids, '{}') AS adviser_uwnetids,
+    p._is_active_student,
+    p._is_active_employee,
+    GREATEST(p._last_changed, s._last_changed, e._last_changed)
+        AS _last_changed
+FROM person p
+LEFT JOIN LATERAL (
+    SELECT * FROM student WHERE student.person_id = p.id
+    ORDER BY student.id LIMIT 1) s ON true
+LEFT JOIN LATERAL (
+    SELECT * FROM employee WHERE employee.person_id = p.id
+    ORDER BY employee.id LIMIT 1) e ON true
+LEFT JOIN major m ON m.id = s.major_1_id
+LEFT JOIN LATERAL (
+    SELECT array_agg(ap.uwnetid ORDER BY ap.uwnetid) AS adviser_uwnetids
+    FROM student_to_adviser sa
+    JOIN adviser ad ON ad.id = sa.adviser_id
+    JOIN employee ae ON ae.id = ad.employee_id
+    JOIN person ap ON ap.id = ae.person_id
+    WHERE sa.student_id = s.id) a ON true
+"""
+
+# The unique index on id is required for REFRESH ... CONCURRENTLY
+CREATE_PERSON_SUMMARY_INDEXES_SQL = [
+    'CREATE UNIQUE INDEX IF NOT EXISTS person_summary_id '
+    'ON person_summary (id)',
+    'CREATE INDEX IF NOT EXISTS person_summary_uwnetid '
+    'ON person_summary (uwnetid)',
+    'CREATE INDEX IF NOT EXISTS person_summary_uwregid '
+    'ON person_summary (uwregid)',
+    'CREATE INDEX IF NOT EXISTS person_summary_system_key '
+    'ON person_summary (system_key)',
+    'CREATE INDEX IF NOT EXISTS person_summary_student_number '
+    'ON person_summary (student_number)',
+    'CREATE INDEX IF NOT EXISTS person_summary_prior_uwnetids '
+    'ON person_summary USING gin (prior_uwnetids)',
+    'CREATE INDEX IF NOT EXISTS person_summary_prior_uwregids '
+    'ON person_summary USING gin (prior_uwregids)',
+]
+
+DROP_PERSON_SUMMARY_SQL = 'DROP MATERIALIZED VIEW IF EXISTS person_summary'
+
+
+def create_person_summary(using='uw_person'):
+    with connections[using].cursor() as cursor:
+        cursor.execute(CREATE_PERSON_SUMMARY_SQL)
+        for sql in CREATE_PERSON_SUMMARY_INDEXES_SQL:
+            cursor.execute(sql)
+
+
+def refresh_person_summary(using='uw_person', concurrently=True):
+    """
+    Refreshes the person_summary view, returning the seconds taken. A
+    concurrent refresh doesn't block PersonSummary reads, but is slower.
+    """
+    start = time.time()
+    with connections[using].cursor() as cursor:
+        cursor.execute('REFRESH MATERIALIZED VIEW {}person_summary'.format(
+            'CONCURRENTLY ' if concurrently else ''))
+    return time.time() - start
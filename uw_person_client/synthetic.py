@@ -0,0 +1,245 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from datetime import date, datetime, timedelta, timezone
+import csv
+import os
+import random
+
+FIRST_NAMES = [
+    'Alex', 'Avery', 'Casey', 'Dana', 'Eli', 'Emerson', 'Finley', 'Harper',
+    'Hayden', 'Jamie', 'Jordan', 'Kai', 'Lee', 'Morgan', 'Noor', 'Parker',
+    'Quinn', 'Reese', 'Riley', 'Rowan', 'Sam', 'Skyler', 'Taylor', 'Yuki']
+SURNAMES = [
+    'Nguyen', 'Smith', 'Garcia', 'Kim', 'Johnson', 'Lee', 'Patel', 'Brown',
+    'Chen', 'Williams', 'Lopez', 'Tran', 'Jones', 'Singh', 'Davis', 'Wong',
+    'Miller', 'Martinez', 'Park', 'Wilson', 'Ali', 'Anderson', 'Yang', 'Le']
+CAMPUSES = [(0, 'Seattle'), (1, 'Bothell'), (2, 'Tacoma')]
+CLASSES = [(1, 'Freshman'), (2, 'Sophomore'), (3, 'Junior'), (4, 'Senior'),
+           (8, 'Graduate')]
+DEPARTMENTS = ['Computer Science', 'Biology', 'History', 'Mathematics',
+               'Nursing', 'Economics', 'Chemistry', 'Music', 'Physics']
+HOLDS = [('REG', 'Registrar'), ('SFS', 'Student Fiscal Services'),
+         ('UWEXT', 'Continuum College'), ('ADV', 'Advising')]
+SPORTS = ['Baseball', 'Basketball', 'Crew', 'Cross Country', 'Football',
+          'Golf', 'Gymnastics', 'Soccer', 'Softball', 'Swimming', 'Tennis',
+          'Track', 'Volleyball']
+
+# Columns written for each table, in CSV header order
+COLUMNS = {
+    'term': ['id', 'year', 'quarter'],
+    'major': ['id', 'major_abbr_code', 'major_name', 'major_full_name',
+              'major_short_name', 'major_pathway', 'major_graduate',
+              'major_undergrad', 'college'],
+    'sport': ['id', 'sport_code', 'short_sport_name', 'sport_descrip'],
+    'person': ['id', 'uwnetid', 'uwregid', 'system_key', 'full_name',
+               'display_name', 'first_name', 'surname', 'whitepages_publish',
+               '_is_active_student', '_is_active_employee', '_last_changed',
+               'prior_uwnetids', 'prior_uwregids'],
+    'employee': ['id', 'person_id', 'employee_number',
+                 'employee_affiliation_state', 'email_addresses',
+                 'home_department', 'title', 'department', '_last_changed'],
+    'adviser': ['id', 'employee_id', 'is_dept_adviser', 'advising_email',
+                'advising_program', '_last_changed'],
+    'student': ['id', 'person_id', 'academic_term_id', 'system_key',
+                'student_number', 'birthdate', 'student_email', 'gender',
+                'cumulative_gpa', 'campus_code', 'campus_desc', 'class_code',
+                'class_desc', 'enroll_status_code', 'registered_in_quarter',
+                'major_1_id', 'major_2_id', 'total_credits', '_last_changed'],
+    'student_to_adviser': ['student_id', 'adviser_id'],
+    'student_to_sport': ['student_id', 'sport_id'],
+    'transcript': ['id', 'student_id', 'tran_term_id', 'qtr_grade_points',
+                   'qtr_graded_attmp', 'qtr_nongrd_earned', 'scholarship_type',
+                   'class_code', 'enroll_status', '_last_changed'],
+    'transfer': ['id', 'student_id', 'institution_code', 'institution_name',
+                 'year_beginning', 'year_ending', 'transfer_gpa'],
+    'student_hold': ['id', 'student_id', 'seq', 'hold_dt', 'hold_office',
+                     'hold_office_desc', 'hold_type'],
+    'degree': ['id', 'student_id', 'degree_term_id', 'campus_code',
+               'degree_abbr_code', 'degree_pathway_num', 'degree_desc',
+               'degree_level_code', 'degree_status_code', 'degree_date'],
+}
+
+
+def pg_array(values):
+    return '{' + ','.join(values) + '}'
+
+
+def pg_bool(value):
+    return 't' if value else 'f'
+
+
+class SyntheticPopulation:
+    """
+    Generates a seeded population across the uw_person tables, written as
+    one CSV file per table for uw_person_client.loader.FixtureLoader. The
+    same size, seed and ratios always produce the same rows.
+    """
+    def __init__(self, size=1000, seed=0, student_ratio=0.7,
+                 employee_ratio=0.35, adviser_ratio=0.05, renamed_ratio=0.02,
+                 now=None):
+        self.size = size
+        self.seed = seed
+        self.student_ratio = student_ratio
+        self.employee_ratio = employee_ratio
+        self.adviser_ratio = adviser_ratio
+        self.renamed_ratio = renamed_ratio
+        # Changes are dated back from midnight, so that a seed produces the
+        # same rows all day
+        self.now = now or datetime.now(timezone.utc).replace(
+            hour=0, minute=0, second=0, microsecond=0)
+
+    def write_csv(self, directory):
+        """
+        Writes the tables to directory, returning a dict of table names to
+        row counts.
+        """
+        self.random = random.Random(self.seed)
+        self.counts = {}
+        files = {table: open(os.path.join(directory, '{}.csv'.format(table)),
+                             'w', newline='') for table in COLUMNS}
+        try:
+            self.writers = {}
+            for table, f in files.items():
+                self.writers[table] = csv.writer(f)
+                self.writers[table].writerow(COLUMNS[table])
+                self.counts[table] = 0
+            self.write_reference_data()
+            self.write_persons()
+        finally:
+            for f in files.values():
+                f.close()
+        return self.counts
+
+    def write(self, table, *row):
+        self.counts[table] += 1
+        self.writers[table].writerow(['' if value is None else value
+                                      for value in row])
+        return self.counts[table]
+
+    def changed(self):
+        return (self.now - timedelta(
+            seconds=self.random.randrange(365 * 86400))).isoformat()
+
+    def write_reference_data(self):
+        self.terms = []
+        for year in range(self.now.year - 11, self.now.year + 1):
+            for quarter in range(1, 5):
+                self.terms.append((self.write('term', len(self.terms) + 1,
+                                              year, quarter), year, quarter))
+
+        self.majors = []
+        for department in DEPARTMENTS:
+            for pathway, level in enumerate(['BS', 'BA', 'MS', 'PHD']):
+                code = department.upper().replace(' ', '')[:6]
+                self.majors.append(self.write(
+                    'major', len(self.majors) + 1, code,
+                    '{} ({})'.format(department, level),
+                    '{} {}'.format(level, department), department[:12],
+                    pathway, pg_bool(level in ('MS', 'PHD')),
+                    pg_bool(level in ('BS', 'BA')),
+                    'College of {}'.format(department)))
+
+        self.sports = [
+            self.write('sport', index + 1, index + 1, name[:10], name)
+            for index, name in enumerate(SPORTS)]
+
+    def write_persons(self):
+        rand = self.random
+        advisers = []
+        students = []
+        for pk in range(1, self.size + 1):
+            first_name = rand.choice(FIRST_NAMES)
+            surname = rand.choice(SURNAMES)
+            uwnetid = '{}{}{}'.format(
+                first_name[0], surname[:5], pk).lower()
+            is_student = rand.random() < self.student_ratio
+            is_employee = (rand.random() < self.employee_ratio or
+                           not is_student)
+            prior_uwnetids = []
+            if rand.random() < self.renamed_ratio:
+                prior_uwnetids.append('{}{}x{}'.format(
+                    first_name[0], surname[:4], pk).lower())
+
+            self.write(
+                'person', pk, uwnetid, '{:032X}'.format(rand.getrandbits(128)),
+                str(100000000 + pk) if is_student else None,
+                '{} {}'.format(first_name.upper(), surname.upper()),
+                '{} {}'.format(first_name, surname), first_name, surname,
+                pg_bool(rand.random() < 0.8), pg_bool(is_student),
+                pg_bool(is_employee), self.changed(),
+                pg_array(prior_uwnetids), pg_array([]))
+
+            if is_employee:
+                department = rand.choice(DEPARTMENTS)
+                employee = self.write(
+                    'employee', self.counts['employee'] + 1, pk,
+                    str(800000000 + pk), 'current',
+                    pg_array(['{}@uw.edu'.format(uwnetid)]), department,
+                    rand.choice(['Lecturer', 'Professor', 'Adviser',
+                                 'Program Coordinator', 'Research Scientist']),
+                    department, self.changed())
+                if rand.random() < self.adviser_ratio:
+                    advisers.append(self.write(
+                        'adviser', len(advisers) + 1, employee,
+                        pg_bool(rand.random() < 0.5),
+                        '{}@uw.edu'.format(uwnetid),
+                        '{} Advising'.format(department), self.changed()))
+
+            if is_student:
+                students.append((pk, uwnetid))
+
+        for pk, uwnetid in students:
+            self.write_student(pk, uwnetid, advisers)
+
+    def write_student(self, person, uwnetid, advisers):
+        rand = self.random
+        class_code, class_desc = rand.choice(CLASSES)
+        campus_code, campus_desc = rand.choice(CAMPUSES)
+        quarters = rand.randint(1, 12)
+        first_term = len(self.terms) - quarters
+        student = self.write(
+            'student', self.counts['student'] + 1, person,
+            self.terms[-1][0], str(100000000 + person),
+            str(1000000 + person), date(
+                self.now.year - rand.randint(18, 40), rand.randint(1, 12),
+                rand.randint(1, 28)).isoformat(),
+            '{}@uw.edu'.format(uwnetid), rand.choice(['F', 'M', 'X']),
+            '{:.2f}'.format(rand.uniform(2.0, 4.0)), campus_code,
+            campus_desc, class_code, class_desc, 12,
+            pg_bool(rand.random() < 0.9), rand.choice(self.majors),
+            rand.choice(self.majors) if rand.random() < 0.15 else None,
+            str(quarters * 15), self.changed())
+
+        for adviser in rand.sample(advisers, min(len(advisers),
+                                                 rand.randint(0, 2))):
+            self.write('student_to_adviser', student, adviser)
+        if rand.random() < 0.03:
+            self.write('student_to_sport', student, rand.choice(self.sports))
+
+        for term, year, quarter in self.terms[first_term:]:
+            self.write(
+                'transcript', self.counts['transcript'] + 1, student, term,
+                '{:.2f}'.format(rand.uniform(20, 60)), 15, 0, 0, class_code,
+                12, self.changed())
+
+        if rand.random() < 0.2:
+            year = self.terms[first_term][1] - rand.randint(1, 3)
+            self.write(
+                'transfer', self.counts['transfer'] + 1, student,
+                str(rand.randint(1000, 9999)), 'Community College',
+                year - 2, year, '{:.2f}'.format(rand.uniform(2.0, 4.0)))
+
+        holds = rand.randint(1, 2) if rand.random() < 0.1 else 0
+        for seq in range(1, holds + 1):
+            office, office_desc = rand.choice(HOLDS)
+            self.write(
+                'student_hold', self.counts['student_hold'] + 1, student,
+                seq, self.changed(), office, office_desc, rand.randint(1, 9))
+
+        if class_code == 4 and rand.random() < 0.5:
+            term, year, quarter = self.terms[-1]
+            self.write(
+                'degree', self.counts['degree'] + 1, student, term,
+                campus_code, 'BS', 0, 'Bachelor of Science', '1', '9',
+                date(year, quarter * 3, 15).isoformat())
@@ -0,0 +1,25 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+# Generated by Django 5.2.18 on 2026-10-17 12:00
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('uw_person_client', '0003_enrolledstudentqueue_personqueue_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='person',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['prior_uwnetids'], name='person_prior_uwnetids_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['prior_uwregids'], name='person_prior_uwregids_gin'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+# Generated by Django 5.2.18 on 2026-10-17 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('uw_person_client', '0004_person_prior_identifier_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(fields=['last_changed', 'id'], name='person_last_changed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(fields=['last_changed', 'id'], name='employee_last_changed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='adviser',
+            index=models.Index(fields=['last_changed', 'id'], name='adviser_last_changed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['last_changed', 'id'], name='student_last_changed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transcript',
+            index=models.Index(fields=['last_changed', 'id'], name='transcript_last_changed_idx'),
+        ),
+    ]
@@ -0,0 +1,99 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+# Generated by Django 5.2.18 on 2026-10-17 12:00
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('uw_person_client', '0005_last_changed_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            [
+                """
+CREATE MATERIALIZED VIEW IF NOT EXISTS person_summary AS
+SELECT
+    p.id,
+    p.uwnetid,
+    p.uwregid,
+    p.system_key,
+    s.student_number,
+    p.prior_uwnetids,
+    p.prior_uwregids,
+    p.display_name,
+    p.first_name,
+    p.surname,
+    p.preferred_first_name,
+    p.preferred_surname,
+    p.pronouns,
+    COALESCE(s.student_email, e.email_addresses[1]) AS email,
+    s.class_code,
+    s.class_desc,
+    m.major_name,
+    COALESCE(a.adviser_uwnetids, '{}') AS adviser_uwnetids,
+    p._is_active_student,
+    p._is_active_employee,
+    GREATEST(p._last_changed, s._last_changed, e._last_changed)
+        AS _last_changed
+FROM person p
+LEFT JOIN LATERAL (
+    SELECT * FROM student WHERE student.person_id = p.id
+    ORDER BY student.id LIMIT 1) s ON true
+LEFT JOIN LATERAL (
+    SELECT * FROM employee WHERE employee.person_id = p.id
+    ORDER BY employee.id LIMIT 1) e ON true
+LEFT JOIN major m ON m.id = s.major_1_id
+LEFT JOIN LATERAL (
+    SELECT array_agg(ap.uwnetid ORDER BY ap.uwnetid) AS adviser_uwnetids
+    FROM student_to_adviser sa
+    JOIN adviser ad ON ad.id = sa.adviser_id
+    JOIN employee ae ON ae.id = ad.employee_id
+    JOIN person ap ON ap.id = ae.person_id
+    WHERE sa.student_id = s.id) a ON true
+""",
+                'CREATE UNIQUE INDEX IF NOT EXISTS person_summary_id ON person_summary (id)',
+                'CREATE INDEX IF NOT EXISTS person_summary_uwnetid ON person_summary (uwnetid)',
+                'CREATE INDEX IF NOT EXISTS person_summary_uwregid ON person_summary (uwregid)',
+                'CREATE INDEX IF NOT EXISTS person_summary_system_key ON person_summary (system_key)',
+                'CREATE INDEX IF NOT EXISTS person_summary_student_number ON person_summary (student_number)',
+                'CREATE INDEX IF NOT EXISTS person_summary_prior_uwnetids ON person_summary USING gin (prior_uwnetids)',
+                'CREATE INDEX IF NOT EXISTS person_summary_prior_uwregids ON person_summary USING gin (prior_uwregids)',
+            ],
+            'DROP MATERIALIZED VIEW IF EXISTS person_summary'),
+        migrations.CreateModel(
+            name='PersonSummary',
+            fields=[
+                ('id', models.IntegerField(primary_key=True, serialize=False)),
+                ('uwnetid', models.TextField(blank=True, null=True)),
+                ('uwregid', models.TextField(blank=True, null=True)),
+                ('system_key', models.TextField(blank=True, null=True)),
+                ('student_number', models.TextField(blank=True, null=True)),
+                ('prior_uwnetids', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=24), size=None)),
+                ('prior_uwregids', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=32), size=None)),
+                ('display_name', models.TextField(blank=True, null=True)),
+                ('first_name', models.TextField(blank=True, null=True)),
+                ('surname', models.TextField(blank=True, null=True)),
+                ('preferred_first_name', models.TextField(blank=True, null=True)),
+                ('preferred_surname', models.TextField(blank=True, null=True)),
+                ('pronouns', models.TextField(blank=True, null=True)),
+                ('email', models.TextField(blank=True, null=True)),
+                ('class_code', models.SmallIntegerField(blank=True, null=True)),
+                ('class_desc', models.TextField(blank=True, null=True)),
+                ('major_name', models.TextField(blank=True, null=True)),
+                ('adviser_uwnetids', django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), size=None)),
+                ('is_active_student', models.BooleanField(blank=True, db_column='_is_active_student', null=True)),
+                ('is_active_employee', models.BooleanField(blank=True, db_column='_is_active_employee', null=True)),
+                ('last_changed', models.DateTimeField(blank=True, db_column='_last_changed', null=True)),
+            ],
+            options={
+                'db_table': 'person_summary',
+                'managed': False,
+            },
+        ),
+    ]
@@ -19,8 +19,11 @@ class AdviserTest(ModelTest):
         self.assertEqual(a.advising_email, 'jadviser@uw.edu')
 
     def test_get_adviser_by_prior_uwnetid(self):
+        prior = Adviser.objects.lookup_counts[('uwnetid', 'prior')]
         a = Adviser.objects.get_adviser_by_uwnetid('jadviser1')
         self.assertEqual(a.advising_email, 'jadviser@uw.edu')
+        self.assertEqual(
+            Adviser.objects.lookup_counts[('uwnetid', 'prior')], prior + 1)
 
     def test_adviser_to_dict(self):
         a = Adviser.objects.get_adviser_by_uwnetid('jadviser')
@@ -28,3 +31,89 @@ class AdviserTest(ModelTest):
         self.assertEqual(data['advising_program'], 'OMAD Advising')
         self.assertEqual(data['employee']['employee_number'], '200000000')
         self.assertEqual(data['employee']['person']['first_name'], 'Jay')
+
+    async def test_aget_adviser_by_uwnetid(self):
+        with self.assertRaises(AdviserNotFoundException):
+            await Adviser.objects.aget_adviser_by_uwnetid('javerage')
+
+        a = await Adviser.objects.aget_adviser_by_uwnetid('jadviser1')
+        self.assertEqual(a.advising_email, 'jadviser@uw.edu')
+        self.assertEqual(a.employee.person.uwnetid, 'jadviser')
+
+    def test_get_students_for_adviser(self):
+        # The adviser lookup, the caseload and its prefetches
+        with self.assertNumQueries(3, using='uw_person'):
+            students = Adviser.objects.get_students_for_adviser(
+                'jadviser', include_student=True)
+        self.assertEqual([p.uwnetid for p in students],
+                         ['javerage', 'jbothell'])
+        self.assertEqual(students[1].student.student_number, '1233334')
+
+        students = Adviser.objects.get_students_for_adviser('jadviser1')
+        self.assertEqual(len(students), 2)
+        self.assertIsNone(students[0].student)
+
+        self.assertRaises(AdviserNotFoundException,
+                          Adviser.objects.get_students_for_adviser, 'bill')
+
+    def test_iter_students_for_adviser(self):
+        students = Adviser.objects.iter_students_for_adviser(
+            'jadviser', chunk_size=1, include_student=True,
+            include_student_holds=True)
+        self.assertEqual([p.student.system_key for p in students],
+                         ['532353230', '820582050'])
+
+    def test_get_caseloads(self):
+        with self.assertNumQueries(1, using='uw_person'):
+            self.assertEqual(Adviser.objects.get_caseloads(['bill']),
+                             {'bill': None})
+
+        with self.assertNumQueries(2, using='uw_person'):
+            caseloads = Adviser.objects.get_caseloads(
+                ['jadviser', 'jadviser1', 'nobody'])
+        self.assertEqual(set(caseloads), {'jadviser', 'jadviser1', 'nobody'})
+        self.assertEqual([p.uwnetid for p in caseloads['jadviser']],
+                         ['javerage', 'jbothell'])
+        self.assertEqual([p.uwnetid for p in caseloads['jadviser1']],
+                         ['javerage', 'jbothell'])
+        self.assertIsNone(caseloads['nobody'])
+
+        # The include_* prefetches are shared across advisers
+        with self.assertNumQueries(4, using='uw_person'):
+            caseloads = Adviser.objects.get_caseloads(
+                ['jadviser'], include_student=True,
+                include_student_transcripts=True)
+        self.assertEqual(
+            len(caseloads['jadviser'][0].student.transcripts.all()), 3)
+        self.assertEqual(Adviser.objects.get_caseloads([]), {})
+
+    def test_get_advisers_by_uwnetids(self):
+        with self.assertNumQueries(1, using='uw_person'):
+            advisers = Adviser.objects.get_advisers_by_uwnetids(
+                ['jadviser', 'jadviser1', 'javerage', 'jadviser'])
+            self.assertEqual(set(advisers),
+                             {'jadviser', 'jadviser1', 'javerage'})
+            self.assertEqual(advisers['jadviser'].to_dict()['employee'][
+                'person']['uwnetid'], 'jadviser')
+            self.assertEqual(advisers['jadviser1'].pk, advisers['jadviser'].pk)
+            self.assertIsNone(advisers['javerage'])
+        self.assertEqual(Adviser.objects.get_advisers_by_uwnetids([]), {})
+
+    def test_get_all_advisers(self):
+        Adviser.objects.create(
+            employee=Employee.objects.get(employee_number='100000000'),
+            is_dept_adviser=True, advising_program='CSE Advising')
+
+        with self.assertNumQueries(1, using='uw_person'):
+            advisers = Adviser.objects.get_all_advisers()
+            self.assertEqual(
+                [a.employee.person.uwnetid for a in advisers],
+                ['jadviser', 'bill'])
+        self.assertEqual([a.advising_program for a in
+                          Adviser.objects.get_all_advisers(
+                              program='OMAD Advising')], ['OMAD Advising'])
+        self.assertEqual([a.employee.person.uwnetid for a in
+                          Adviser.objects.get_all_advisers(
+                              is_dept_adviser=True)], ['bill'])
+        self.assertEqual(Adviser.objects.get_all_advisers(
+            program='CSE Advising', is_dept_adviser=False), [])
@@ -0,0 +1,58 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from uw_person_client.tests import ModelTest
+from uw_person_client.models import PersonQueue
+from uw_person_client.benchmark import include_combinations, compare
+from io import StringIO
+import json
+import os
+import tempfile
+
+
+class BenchmarkTest(ModelTest):
+    def test_include_combinations(self):
+        combinations = list(include_combinations())
+        self.assertEqual(len(combinations), 34)
+        self.assertIn({'include_employee': True}, combinations)
+
+    def test_benchmark(self):
+        path = os.path.join(tempfile.mkdtemp(), 'benchmark.json')
+        call_command('benchmark_person_client', repeat=1, output=path,
+                     kinds='uwnetid', stdout=StringIO())
+        with open(path) as f:
+            data = json.load(f)
+
+        results = {(r['name'], json.dumps(r['params'], sort_keys=True)): r
+                   for r in data['results']}
+        self.assertEqual(len(results), 34 + 4 + 1 + 6 + 2)
+
+        result = results[('get_person_by_uwnetid', json.dumps(
+            {'include_employee': False}))]
+        self.assertEqual(result['queries'], 1)
+        self.assertEqual(result['runs'], 1)
+        self.assertGreater(result['peak_memory'], 0)
+        self.assertEqual(PersonQueue.objects.count(), 0)
+        self.assertIn(('model_to_dict', json.dumps({'model': 'Student'})),
+                      results)
+        self.assertIn(('serialize', json.dumps({'model': 'Student'})),
+                      results)
+
+        # A run is compared against a baseline by median
+        baseline = [dict(r, median=r['median'] / 10)
+                    for r in data['results']]
+        self.assertEqual(len(compare(data['results'], baseline)),
+                         len(data['results']))
+        self.assertEqual(compare(data['results'], data['results']), [])
+
+        err = StringIO()
+        call_command('benchmark_person_client', repeat=1, baseline=path,
+                     only='to_dict', threshold=-1, stdout=StringIO(),
+                     stderr=err)
+        self.assertEqual(err.getvalue().count('REGRESSION'), 1)
+        self.assertIn('REGRESSION to_dict', err.getvalue())
+
+        self.assertRaises(CommandError, call_command,
+                          'benchmark_person_client', only='nobody')
@@ -0,0 +1,355 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.utils import timezone
+from datetime import timedelta
+from uw_person_client.tests import ModelTest
+from uw_person_client.models import (
+    Person, Employee, Student, Adviser, Major, Sport, StudentToSport)
+from uw_person_client.cache import (
+    PersonCache, LocalPersonCache, DjangoPersonCache, AdviserDirectory,
+    ReferenceDataCache)
+from uw_person_client.exceptions import (
+    PersonNotFoundException, AdviserNotFoundException)
+from uw_person_client.serializers import no_queries
+from unittest.mock import patch
+from threading import Event, Thread, current_thread
+
+
+class PersonCacheTest(ModelTest):
+    def setUp(self):
+        Person.objects.cache = self.get_cache()
+
+    def tearDown(self):
+        Person.objects.cache = None
+
+    def get_cache(self):
+        return LocalPersonCache(ttl=300)
+
+    def test_cache_hit(self):
+        p = Person.objects.get_person_by_uwnetid('javerage')
+        self.assertEqual(Person.objects.cache.stats['misses'], 1)
+
+        with self.assertNumQueries(0, using='uw_person'):
+            for p in [
+                    Person.objects.get_person_by_uwnetid('javerage'),
+                    Person.objects.get_person_by_uwregid(
+                        '9136CCB8F66711D5BE060004AC494FFE'),
+                    Person.objects.get_person_by_system_key('532353230')]:
+                self.assertEqual(p.uwnetid, 'javerage')
+        self.assertEqual(Person.objects.cache.stats['hits'], 3)
+
+        # A person is cached under a prior identifier only once looked up
+        # by it
+        for queries in [2, 0]:
+            with self.assertNumQueries(queries, using='uw_person'):
+                p = Person.objects.get_person_by_uwregid(
+                    '9136CCB8F66711D5BE060004AC494FF0')
+                self.assertEqual(p.uwnetid, 'javerage')
+        self.assertEqual(Person.objects.cache.stats['hits'], 4)
+
+    def test_stats_threads(self):
+        cache = Person.objects.cache
+        threads = [Thread(target=lambda: [
+            cache.get('uw_person:nobody') for i in range(1000)])
+            for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(cache.stats['misses'], 4000)
+
+    def test_abstract(self):
+        self.assertRaises(TypeError, PersonCache)
+
+    def test_cache_reassigned_prior_identifier(self):
+        Person.objects.filter(uwnetid='javerage').update(
+            prior_uwnetids=['bill'])
+        self.assertEqual(
+            Person.objects.get_person_by_uwnetid('javerage').uwnetid,
+            'javerage')
+        self.assertEqual(
+            Person.objects.get_person_by_uwnetid('bill').uwnetid, 'bill')
+
+    def test_cache_includes(self):
+        p = Person.objects.get_person_by_uwnetid(
+            'javerage', include_student=True, include_student_holds=True)
+        self.assertEqual(len(p.student.holds.all()), 2)
+
+        # Different include flags are cached separately
+        p = Person.objects.get_person_by_uwnetid('javerage')
+        self.assertIsNone(p.student)
+        self.assertEqual(Person.objects.cache.stats['misses'], 2)
+
+        with self.assertNumQueries(0, using='uw_person'):
+            p = Person.objects.get_person_by_student_number(
+                '1033334', include_student=True, include_student_holds=True)
+            self.assertEqual(p.uwnetid, 'javerage')
+            self.assertEqual(len(p.student.holds.all()), 2)
+            self.assertEqual(p.student.holds.all()[0].hold_office, 'UWEXT')
+
+    async def test_async_cache(self):
+        cache = Person.objects.cache
+        kwargs = {'include_student': True, 'include_student_holds': True,
+                  'include_student_advisers': True,
+                  'include_student_sports': True}
+        p1 = await Person.objects.aget_person_by_uwnetid('javerage', **kwargs)
+        p2 = await Person.objects.aget_person_by_system_key(
+            '532353230', **kwargs)
+        self.assertEqual(p1.to_dict(), p2.to_dict())
+        self.assertEqual(cache.stats['misses'], 1)
+        self.assertEqual(cache.stats['hits'], 1)
+
+        # Expired entries are revalidated
+        cache.ttl = -1
+        await Person.objects.aget_person_by_uwnetid('javerage', **kwargs)
+        self.assertEqual(cache.stats['hits'], 2)
+
+    def test_cache_not_found(self):
+        self.assertRaises(PersonNotFoundException,
+                          Person.objects.get_person_by_uwnetid, 'nobody')
+        self.assertEqual(Person.objects.cache.stats['misses'], 1)
+
+    def test_cache_revalidation(self):
+        cache = Person.objects.cache
+        Person.objects.get_person_by_uwnetid(
+            'javerage', include_student=True)
+
+        # An expired entry that hasn't changed costs one probe query
+        cache.ttl = -1
+        with self.assertNumQueries(1, using='uw_person'):
+            Person.objects.get_person_by_uwnetid(
+                'javerage', include_student=True)
+        self.assertEqual(cache.stats['hits'], 1)
+
+        Student.objects.filter(system_key='532353230').update(
+            last_changed=timezone.now())
+        p = Person.objects.get_person_by_uwnetid(
+            'javerage', include_student=True)
+        self.assertIsNotNone(p.student.last_changed)
+        self.assertEqual(cache.stats['invalidations'], 1)
+        self.assertEqual(cache.stats['misses'], 2)
+
+    def test_cache_revalidation_many_rows(self):
+        # The probe compares the latest _last_changed of all of a person's
+        # employee rows, as was stored
+        cache = Person.objects.cache
+        employee = Employee.objects.get(employee_number='100000000')
+        Employee.objects.filter(pk=employee.pk).update(
+            last_changed=timezone.now() - timedelta(days=1))
+        employee.pk = None
+        employee.employee_number = '100000001'
+        employee.last_changed = timezone.now()
+        employee.save()
+
+        Person.objects.get_person_by_uwnetid('bill', include_employee=True)
+        cache.ttl = -1
+        for i in range(3):
+            Person.objects.get_person_by_uwnetid('bill', include_employee=True)
+        self.assertEqual(cache.stats['hits'], 3)
+        self.assertEqual(cache.stats['invalidations'], 0)
+
+
+class LocalPersonCacheTest(PersonCacheTest):
+    def get_cache(self):
+        return LocalPersonCache(maxsize=5)
+
+    def test_eviction(self):
+        cache = Person.objects.cache
+        Person.objects.get_person_by_uwnetid('javerage')
+        Person.objects.get_person_by_uwnetid('jbothell')
+        self.assertGreater(cache.stats['evictions'], 0)
+        self.assertLessEqual(len(cache._entries), 5)
+
+        # The most recently cached person is still served
+        with self.assertNumQueries(0, using='uw_person'):
+            Person.objects.get_person_by_uwnetid('jbothell')
+
+        cache.clear()
+        self.assertEqual(len(cache._entries), 0)
+
+
+class DjangoPersonCacheTest(PersonCacheTest):
+    def get_cache(self):
+        return DjangoPersonCache()
+
+    def tearDown(self):
+        Person.objects.cache.backend.clear()
+        super().tearDown()
+
+    def test_cache_copies(self):
+        p1 = Person.objects.get_person_by_uwnetid(
+            'javerage', include_student=True,
+            include_student_transcripts=True)
+        p2 = Person.objects.get_person_by_uwnetid(
+            'javerage', include_student=True,
+            include_student_transcripts=True)
+        self.assertIsNot(p1, p2)
+        self.assertEqual(p1.to_dict(), p2.to_dict())
+
+
+class AdviserDirectoryTest(ModelTest):
+    def setUp(self):
+        Adviser.objects.directory = AdviserDirectory(max_age=60)
+
+    def tearDown(self):
+        Adviser.objects.directory = None
+
+    def test_directory_hit(self):
+        with self.assertNumQueries(2, using='uw_person'):
+            adviser = Adviser.objects.get_adviser_by_uwnetid('jadviser')
+
+        with self.assertNumQueries(0, using='uw_person'):
+            self.assertIs(
+                Adviser.objects.get_adviser_by_uwnetid('jadviser1'), adviser)
+            self.assertEqual(adviser.to_dict()['employee']['person'][
+                'uwnetid'], 'jadviser')
+            self.assertEqual(Adviser.objects.get_advisers_by_uwnetids(
+                ['jadviser', 'javerage']),
+                {'jadviser': adviser, 'javerage': None})
+            self.assertEqual(Adviser.objects.get_all_advisers(), [adviser])
+            self.assertEqual(Adviser.objects.get_all_advisers(
+                is_dept_adviser=True), [])
+            self.assertRaises(AdviserNotFoundException,
+                              Adviser.objects.get_adviser_by_uwnetid,
+                              'javerage')
+        self.assertEqual(Adviser.objects.directory.loads, 1)
+
+    def test_directory_caseloads(self):
+        counts = Adviser.objects.lookup_counts
+        prior = counts[('uwnetid', 'prior')]
+        not_found = counts[('uwnetid', 'not_found')]
+        Adviser.objects.directory.refresh()
+
+        # Only the caseload query reaches the database
+        with self.assertNumQueries(1, using='uw_person'):
+            caseloads = Adviser.objects.get_caseloads(['jadviser1', 'bill'])
+        self.assertEqual([p.uwnetid for p in caseloads['jadviser1']],
+                         ['javerage', 'jbothell'])
+        self.assertIsNone(caseloads['bill'])
+        self.assertEqual(counts[('uwnetid', 'prior')], prior + 1)
+        self.assertEqual(counts[('uwnetid', 'not_found')], not_found + 1)
+
+    async def test_directory_aget(self):
+        adviser = await Adviser.objects.aget_adviser_by_uwnetid('jadviser1')
+        self.assertIs(adviser, Adviser.objects.directory.lookup(
+            'jadviser')[0])
+        with self.assertRaises(AdviserNotFoundException):
+            await Adviser.objects.aget_adviser_by_uwnetid('javerage')
+        self.assertEqual(Adviser.objects.directory.loads, 1)
+
+    def test_directory_refresh(self):
+        directory = Adviser.objects.directory
+        directory.max_age = -1
+        adviser = Adviser.objects.get_adviser_by_uwnetid('jadviser')
+
+        # An unchanged version is rechecked without reloading
+        with self.assertNumQueries(1, using='uw_person'):
+            self.assertIs(
+                Adviser.objects.get_adviser_by_uwnetid('jadviser'), adviser)
+        self.assertEqual(directory.loads, 1)
+
+        Adviser.objects.filter(pk=adviser.pk).update(
+            advising_program='CSE Advising', last_changed=timezone.now())
+        self.assertEqual(Adviser.objects.get_adviser_by_uwnetid(
+            'jadviser').advising_program, 'CSE Advising')
+        self.assertEqual(directory.loads, 2)
+
+        directory.refresh(force=True)
+        self.assertEqual(directory.loads, 3)
+
+
+class ReferenceDataCacheTest(ModelTest):
+    def setUp(self):
+        self.cache = ReferenceDataCache()
+        self.cache.install()
+
+    def tearDown(self):
+        self.cache.uninstall()
+
+    def test_reference_data(self):
+        StudentToSport.objects.create(student_id=1, sport_id=1)
+        persons = Person.objects.get_persons_by_uwnetids(
+            ['javerage', 'jbothell'], include_student=True,
+            include_student_transcripts=True, include_student_degrees=True,
+            include_student_advisers=True, include_student_sports=True)
+        javerage = persons['javerage'].student
+        jbothell = persons['jbothell'].student
+
+        with self.assertNumQueries(0, using='uw_person'):
+            self.assertIs(javerage.academic_term, jbothell.academic_term)
+            self.assertIs(javerage.majors[1], jbothell.majors[0])
+            self.assertIs(jbothell.pending_majors[0], javerage.majors[0])
+            self.assertIs(javerage.sports.all()[0], self.cache.get(Sport, 1))
+            data = javerage.to_dict()
+        self.assertEqual(len(data['majors']), 2)
+        self.assertEqual(len(data['transcripts']), 3)
+
+        # Foreign keys loaded outside PersonManager resolve too
+        student = Student.objects.get(system_key='532353230')
+        with self.assertNumQueries(0, using='uw_person'):
+            self.assertIs(student.major_1, javerage.major_1)
+            self.assertIs(student.academic_term, javerage.academic_term)
+
+    def test_refresh(self):
+        major_1 = self.cache.get(Major, 1)
+        major_2 = self.cache.get(Major, 2)
+        version = self.cache.version
+
+        # A snapshot younger than max_age isn't reloaded
+        with self.assertNumQueries(0, using='uw_person'):
+            self.cache.refresh()
+
+        self.cache.refresh(force=True)
+        self.assertEqual(self.cache.version, version)
+        self.assertIs(self.cache.get(Major, 1), major_1)
+
+        # Reads serve the current snapshot until the next refresh
+        Major.objects.filter(pk=1).update(major_name='Changed')
+        self.cache.max_age = -1
+        self.assertIs(self.cache.get(Major, 1), major_1)
+        self.cache.refresh()
+        self.assertEqual(self.cache.get(Major, 1).major_name, 'Changed')
+        self.assertIs(self.cache.get(Major, 2), major_2)
+        self.assertEqual(self.cache.version, version + 1)
+        self.assertIsNone(self.cache.get(Major, 0))
+
+    def test_expired_no_queries(self):
+        person = Person.objects.get_person_by_uwnetid(
+            'javerage', include_student=True, include_student_advisers=True,
+            include_student_sports=True)
+        student = Student.objects.get(system_key='820582050')
+        self.cache.loaded -= 1000
+        self.cache.max_age = 1
+
+        with no_queries():
+            self.assertEqual(len(person.to_dict()['student']['majors']), 2)
+            self.assertEqual(student.pending_major_1, person.student.major_1)
+
+    async def test_expired_async(self):
+        await StudentToSport.objects.acreate(student_id=1, sport_id=1)
+        self.cache.loaded -= 1000
+        self.cache.max_age = 1
+
+        person = await Person.objects.aget_person_by_uwnetid(
+            'javerage', include_student=True, include_student_sports=True)
+        self.assertIs(person.student.sports.all()[0],
+                      self.cache.get(Sport, 1))
+        self.assertIs(person.student.major_1, self.cache.get(Major, 1))
+
+    def test_refresh_thread(self):
+        cache = ReferenceDataCache(max_age=0.01)
+        threads = []
+        reloaded = Event()
+
+        def load():
+            threads.append(current_thread().name)
+            if len(threads) > 1:
+                reloaded.set()
+
+        with patch.object(cache, '_load', side_effect=load):
+            cache.install()
+            self.assertTrue(reloaded.wait(5))
+            cache.uninstall()
+        self.assertEqual(threads[1], 'uw_person_reference_refresh')
+        self.assertIsNone(Major.objects.cache)
@@ -0,0 +1,99 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
+from uw_person_client.tests import ModelTest
+from uw_person_client.models import Person, Adviser, Transcript
+from io import StringIO
+from datetime import timedelta
+import json
+import os
+import tempfile
+
+handled = []
+
+
+def record_handler(items):
+    handled.append([item.pk for item in items])
+
+
+class ChangeFeedTest(ModelTest):
+    def setUp(self):
+        self.now = timezone.now().replace(microsecond=0)
+        # javerage and jbothell share a last_changed value
+        for pk, minutes in [(1, 5), (2, 5), (3, 10)]:
+            Person.objects.filter(pk=pk).update(
+                last_changed=self.now + timedelta(minutes=minutes))
+        handled.clear()
+
+    def test_iter_changes(self):
+        batches = list(Person.objects.iter_changes(batch_size=2))
+        self.assertEqual([[p.uwnetid for p in batch] for batch in batches],
+                         [['javerage', 'jbothell'], ['bill']])
+
+        # A watermark resumes after the last row, even mid-timestamp
+        batches = list(Person.objects.iter_changes(
+            since=(self.now + timedelta(minutes=5), 1), batch_size=1))
+        self.assertEqual([[p.uwnetid for p in batch] for batch in batches],
+                         [['jbothell'], ['bill']])
+
+        batches = list(Person.objects.iter_changes(
+            since=self.now + timedelta(minutes=5), include_employee=True))
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0][0].uwnetid, 'bill')
+        self.assertEqual(batches[0][0].employee.employee_number, '100000000')
+
+        self.assertEqual(list(Person.objects.iter_changes(
+            since=self.now + timedelta(minutes=10))), [])
+
+    def test_iter_changes_queries(self):
+        with self.assertNumQueries(2, using='uw_person'):
+            list(Person.objects.iter_changes(batch_size=2))
+
+        with self.assertNumQueries(1, using='uw_person'):
+            self.assertEqual(list(Adviser.objects.iter_changes()), [])
+
+        Transcript.objects.filter(pk=3).update(last_changed=self.now)
+        with self.assertNumQueries(1, using='uw_person'):
+            batches = list(Transcript.objects.iter_changes(since=(
+                self.now - timedelta(minutes=1))))
+        self.assertEqual([t.pk for t in batches[0]], [3])
+
+    def test_process_changes(self):
+        path = os.path.join(tempfile.mkdtemp(), 'checkpoint.json')
+        out = StringIO()
+        call_command('process_changes', 'person',
+                     'uw_person_client.tests.test_changes.record_handler',
+                     checkpoint=path, batch_size=2, stdout=out)
+        self.assertEqual(handled, [[1, 2], [3]])
+        self.assertIn('Processed 3 person rows', out.getvalue())
+
+        with open(path) as f:
+            checkpoint = json.load(f)
+        self.assertEqual(checkpoint['person']['pk'], 3)
+
+        # Only rows changed after the checkpoint are processed
+        handled.clear()
+        Person.objects.filter(pk=4).update(
+            last_changed=self.now + timedelta(minutes=15))
+        call_command('process_changes', 'person',
+                     'uw_person_client.tests.test_changes.record_handler',
+                     checkpoint=path, stdout=out)
+        self.assertEqual(handled, [[4]])
+
+        handled.clear()
+        call_command('process_changes', 'person',
+                     'uw_person_client.tests.test_changes.record_handler',
+                     since=(self.now + timedelta(minutes=7)).isoformat(),
+                     stdout=out)
+        self.assertEqual(handled, [[3, 4]])
+
+        self.assertRaises(
+            CommandError, call_command, 'process_changes', 'person',
+            'uw_person_client.tests.test_changes.nobody', stdout=out)
+        self.assertRaises(
+            CommandError, call_command, 'process_changes', 'person',
+            'uw_person_client.tests.test_changes.record_handler',
+            since='yesterday', stdout=out)
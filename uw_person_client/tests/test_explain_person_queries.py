@@ -0,0 +1,37 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from uw_person_client.tests import ModelTest
+from uw_person_client.models import Person
+from unittest.mock import patch
+from io import StringIO
+
+
+class ExplainPersonQueriesTest(ModelTest):
+    def test_force_index(self):
+        out = StringIO()
+        call_command('explain_person_queries', force_index=True,
+                     uwnetid='javerage', stdout=out)
+        lines = out.getvalue().splitlines()
+        self.assertIn('get_person_by_uwnetid: OK', lines)
+        self.assertIn('get_person_by_uwnetid (prior): OK', lines)
+        self.assertIn('get_person_by_uwregid: OK', lines)
+        self.assertIn('get_person_by_uwregid (prior): OK', lines)
+        self.assertIn('get_person_by_system_key: SEQ SCAN on person', lines)
+        self.assertIn('get_persons_by_uwnetids: OK', lines)
+        self.assertIn('get_adviser_by_uwnetid (prior): OK', lines)
+        self.assertIn('get_advisers_by_uwnetids: OK', lines)
+
+    def test_show_plans(self):
+        out = StringIO()
+        call_command('explain_person_queries', show_plans=True, stdout=out)
+        self.assertIn('"Node Type"', out.getvalue())
+        self.assertIn('of 16 queries use a sequential scan', out.getvalue())
+
+    def test_no_students(self):
+        with patch('uw_person_client.benchmark.Person.objects.filter',
+                   return_value=Person.objects.none()):
+            self.assertRaises(CommandError, call_command,
+                              'explain_person_queries', stdout=StringIO())
@@ -0,0 +1,58 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from uw_person_client.tests import ModelTest
+from io import StringIO
+import csv
+import os
+import tempfile
+
+
+class ExportPersonsTest(ModelTest):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def test_csv_stdout(self):
+        out, err = StringIO(), StringIO()
+        call_command('export_persons', 'students', stdout=out, stderr=err)
+        rows = list(csv.DictReader(StringIO(out.getvalue())))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]['uwnetid'], 'javerage')
+        self.assertEqual(rows[0]['student__student_number'], '1033334')
+        self.assertIn('Exported 2 students rows', err.getvalue())
+
+    def test_csv_columns(self):
+        path = os.path.join(self.tmpdir, 'employees.csv')
+        out = StringIO()
+        call_command('export_persons', 'employees', output=path,
+                     columns='uwnetid, employee__employee_number', stdout=out)
+        with open(path) as f:
+            self.assertEqual(list(csv.reader(f)), [
+                ['uwnetid', 'employee__employee_number'],
+                ['bill', '100000000'], ['jadviser', '200000000']])
+        self.assertIn('Exported 2 employees rows', out.getvalue())
+
+        self.assertRaises(
+            CommandError, call_command, 'export_persons', 'employees',
+            columns='nobody', stdout=out)
+
+    def test_parquet(self):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            self.skipTest('pyarrow is not installed')
+
+        path = os.path.join(self.tmpdir, 'transcripts.parquet')
+        call_command('export_persons', 'transcripts', format='parquet',
+                     output=path, stdout=StringIO())
+        table = pq.read_table(path)
+        self.assertEqual(table.num_rows, 4)
+        self.assertEqual(str(table.schema.field('tran_term__year').type),
+                         'int16')
+        self.assertIn(2014, table.column('tran_term__year').to_pylist())
+
+        self.assertRaises(
+            CommandError, call_command, 'export_persons', 'students',
+            format='parquet', stdout=StringIO())
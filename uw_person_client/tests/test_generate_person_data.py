@@ -0,0 +1,51 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from uw_person_client.models import Person, Student, Adviser
+from unittest.mock import patch
+from io import StringIO
+import filecmp
+import os
+import tempfile
+
+
+class GeneratePersonDataTest(TestCase):
+    databases = {'default', 'uw_person'}
+
+    def test_generate_and_load(self):
+        out = StringIO()
+        with patch.dict(os.environ, {'ENV': 'localdev'}):
+            call_command('generate_person_data', persons=200, seed=1,
+                         renamed_ratio=0.1, truncate=True, stdout=out)
+        self.assertIn('Loaded 200 person rows', out.getvalue())
+
+        self.assertEqual(Person.objects.count(), 200)
+        students = Person.objects.get_active_students(
+            include_student=True, include_student_transcripts=True)
+        self.assertEqual(len(students), Student.objects.count())
+        self.assertGreater(len(students[0].student.transcripts.all()), 0)
+        self.assertGreater(Adviser.objects.count(), 0)
+
+        renamed = Person.objects.exclude(prior_uwnetids=[]).first()
+        self.assertEqual(Person.objects.get_person_by_uwnetid(
+            renamed.prior_uwnetids[0]).pk, renamed.pk)
+
+    def test_generate_is_seeded(self):
+        dirs = [tempfile.mkdtemp() for _ in range(2)]
+        for directory in dirs:
+            call_command('generate_person_data', persons=50, seed=2,
+                         output=directory, stdout=StringIO())
+
+        names = sorted(os.listdir(dirs[0]))
+        self.assertIn('student_to_adviser.csv', names)
+        match, mismatch, errors = filecmp.cmpfiles(
+            dirs[0], dirs[1], names, shallow=False)
+        self.assertEqual(mismatch + errors, [])
+
+    def test_localdev_only(self):
+        with patch.dict(os.environ, {'ENV': 'prod'}):
+            self.assertRaises(CommandError, call_command,
+                              'generate_person_data', stdout=StringIO())
@@ -9,7 +9,14 @@ from django.db import connections
 from django.apps import apps
 from unittest.mock import patch, MagicMock
 from uw_person_client.management.commands.initialize_person_db import Command
+from uw_person_client.loader import load_order
+from uw_person_client.models import (
+    Person, Employee, Adviser, Student, Transcript, StudentToAdviser,
+    PersonSummary)
+from io import StringIO
+import json
 import os
+import tempfile
 
 
 class FakeUnmanagedModel:
@@ -66,3 +73,82 @@ class TestSetupUWPersonCommand(TestCase):
             self.assertEqual(kwargs['database'], 'uw_person')
             self.assertEqual(kwargs['app_label'], 'uw_person_client')
             self.assertEqual(kwargs['fixture_name'], fixture)
+
+
+class TestBulkLoad(TestCase):
+    databases = {'default', 'uw_person'}
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        # Children first, to check that files are loaded in FK order
+        with open(os.path.join(self.tmpdir, 'adviser.jsonl'), 'w') as f:
+            for pk in range(1, 4):
+                f.write(json.dumps({
+                    'model': 'uw_person_client.adviser', 'pk': pk,
+                    'fields': {'employee': pk, 'advising_email': 'a{}'.format(
+                        pk)}}) + '\n')
+                f.write(json.dumps({
+                    'model': 'uw_person_client.employee', 'pk': pk,
+                    'fields': {'person': pk, 'employee_number': str(pk),
+                               'email_addresses': []}}) + '\n')
+        with open(os.path.join(self.tmpdir, 'person.csv'), 'w') as f:
+            f.write('id,uwnetid,prior_uwnetids,prior_uwregids\n')
+            for pk in range(1, 4):
+                f.write('{},user{},{{}},"{{a,b}}"\n'.format(pk, pk))
+
+    def test_load_order(self):
+        models = load_order()
+        for parent, child in [(Person, Employee), (Employee, Adviser),
+                              (Student, Transcript),
+                              (Adviser, StudentToAdviser),
+                              (Student, StudentToAdviser)]:
+            self.assertLess(models.index(parent), models.index(child))
+        self.assertNotIn(PersonSummary, models)
+
+    def test_bulk_load(self):
+        out = StringIO()
+        with patch.dict(os.environ, {'ENV': 'localdev'}):
+            call_command('initialize_person_db', self.tmpdir, batch_size=2,
+                         stdout=out)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0].split(' in ')[0], 'Loaded 3 person rows')
+        self.assertEqual(lines[1].split(' in ')[0], 'Loaded 3 employee rows')
+        self.assertEqual(lines[2].split(' in ')[0], 'Loaded 3 adviser rows')
+        self.assertEqual(lines[3].split(' in ')[0], 'Loaded 9 rows')
+
+        adviser = Adviser.objects.get_adviser_by_uwnetid('user2')
+        self.assertEqual(adviser.advising_email, 'a2')
+        self.assertEqual(adviser.employee.person.prior_uwregids, ['a', 'b'])
+
+        # Sequences are reset past the loaded ids
+        person = Person.objects.create(
+            uwnetid='user4', prior_uwnetids=[], prior_uwregids=[])
+        self.assertEqual(person.pk, 4)
+
+    def test_bulk_load_bundled_fixtures(self):
+        path = os.path.join(os.path.dirname(os.path.dirname(
+            os.path.abspath(__file__))), 'fixtures')
+        out = StringIO()
+        with patch.dict(os.environ, {'ENV': 'localdev'}):
+            call_command('initialize_person_db', path, stdout=out)
+
+        person = Person.objects.get_person_by_uwnetid(
+            'javerage', include_student=True)
+        self.assertEqual(len(person.student.advisers.all()), 1)
+        self.assertIn('Loaded 2 student_to_adviser rows', out.getvalue())
+
+        # The person_summary view is refreshed after loading
+        summary = PersonSummary.objects.get_summary_by_uwnetid('javerage')
+        self.assertEqual(summary.adviser_uwnetids, ['jadviser'])
+
+    def test_bulk_load_errors(self):
+        with patch.dict(os.environ, {'ENV': 'localdev'}):
+            self.assertRaises(
+                CommandError, call_command, 'initialize_person_db',
+                os.path.join(self.tmpdir, 'nobody.json'))
+
+            path = os.path.join(self.tmpdir, 'nobody.csv')
+            open(path, 'w').close()
+            self.assertRaises(
+                CommandError, call_command, 'initialize_person_db', path)
@@ -0,0 +1,74 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.db import connections
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from uw_person_client.tests import ModelTest
+from uw_person_client.models import Person, Adviser
+from uw_person_client.signals import person_client_call
+from uw_person_client.exceptions import PersonNotFoundException
+
+
+class InstrumentationTest(ModelTest):
+    def setUp(self):
+        self.calls = []
+        person_client_call.connect(self.receiver)
+
+    def tearDown(self):
+        person_client_call.disconnect(self.receiver)
+
+    def receiver(self, sender, **kwargs):
+        self.calls.append(dict(kwargs, sender=sender))
+
+    def test_person_call(self):
+        with CaptureQueriesContext(connections['uw_person']) as queries:
+            Person.objects.get_person_by_uwnetid(
+                'javerage', include_student=True,
+                include_student_holds=True)
+
+        self.assertEqual(len(self.calls), 1)
+        call = self.calls[0]
+        self.assertEqual(call['sender'], Person)
+        self.assertEqual(call['method'], 'get_person_by_uwnetid')
+        self.assertEqual(call['flags'], {'include_student': True,
+                                         'include_student_holds': True})
+        self.assertEqual(call['queries'], len(queries))
+        self.assertEqual(call['rows'], 1)
+        self.assertGreater(call['db_time'], 0)
+        self.assertLessEqual(call['db_time'], call['duration'])
+        self.assertAlmostEqual(call['db_time'] + call['python_time'],
+                               call['duration'])
+        self.assertIsNone(call['exception'])
+
+    def test_rows(self):
+        Person.objects.get_persons_by_uwnetids(['javerage', 'nobody'])
+        Person.objects.get_active_students()
+        Person.objects.paginate_active_employees(page_size=1)
+        Adviser.objects.get_adviser_by_uwnetid('jadviser')
+        self.assertEqual([(c['method'], c['rows']) for c in self.calls], [
+            ('get_persons_by_uwnetids', 1), ('get_active_students', 2),
+            ('paginate_active_employees', 1), ('get_adviser_by_uwnetid', 1)])
+        self.assertEqual(self.calls[3]['sender'], Adviser)
+
+    def test_not_found(self):
+        self.assertRaises(PersonNotFoundException,
+                          Person.objects.get_person_by_uwregid, 'nobody')
+        self.assertEqual(self.calls[0]['rows'], 0)
+        self.assertIsInstance(self.calls[0]['exception'],
+                              PersonNotFoundException)
+
+    def test_slow_call_log(self):
+        with override_settings(UW_PERSON_SLOW_CALL_THRESHOLD=0):
+            with self.assertLogs('uw_person_client.instrumentation') as logs:
+                Person.objects.get_active_employees(include_employee=True)
+        self.assertIn(
+            'Slow call get_active_employees(include_employee=True)',
+            logs.output[0])
+        self.assertIn('2 rows', logs.output[0])
+
+    def test_disabled(self):
+        person_client_call.disconnect(self.receiver)
+        with self.assertNoLogs('uw_person_client.instrumentation'):
+            Person.objects.get_person_by_uwnetid('javerage')
+        self.assertEqual(self.calls, [])
@@ -0,0 +1,123 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from uw_person_client.tests import ModelTest
+from uw_person_client.models import (
+    Person, PersonLoadingPlan, DIRECTORY_STUDENT_FIELDS)
+from uw_person_client.serializers import no_queries
+
+ALL_STUDENT_INCLUDES = {
+    'include_student': True,
+    'include_student_transcripts': True,
+    'include_student_transfers': True,
+    'include_student_holds': True,
+    'include_student_degrees': True,
+}
+
+
+class PersonLoadingPlanTest(ModelTest):
+    def test_prefetches(self):
+        self.assertEqual(PersonLoadingPlan().prefetches(), [])
+        self.assertEqual([p.prefetch_to for p in PersonLoadingPlan(
+            include_employee=True).prefetches()], ['employee_set'])
+
+        # Student child includes are ignored without include_student
+        plan = PersonLoadingPlan(include_student_transcripts=True)
+        self.assertFalse(plan.include_student_transcripts)
+        self.assertEqual(plan.prefetches(), [])
+
+        plan = PersonLoadingPlan(**ALL_STUDENT_INCLUDES)
+        self.assertEqual(len(plan.prefetches()), 1)
+        self.assertEqual(plan.prefetches()[0].prefetch_to, 'student_set')
+
+    def test_get_person_query_count(self):
+        with self.assertNumQueries(1, using='uw_person'):
+            Person.objects.get_person_by_uwnetid('javerage')
+
+        with self.assertNumQueries(2, using='uw_person'):
+            p = Person.objects.get_person_by_uwnetid(
+                'bill', include_employee=True)
+            self.assertEqual(p.employee.employee_number, '100000000')
+
+        with self.assertNumQueries(6, using='uw_person'):
+            p = Person.objects.get_person_by_uwnetid(
+                'javerage', **ALL_STUDENT_INCLUDES)
+            self.assertEqual(p.student.academic_term.year, 2013)
+            self.assertEqual(len(p.student.majors), 2)
+            self.assertEqual(len(p.student.pending_majors), 0)
+            self.assertEqual(len(p.student.transcripts.all()), 3)
+            self.assertIsNotNone(p.student.transcripts.all()[0].tran_term)
+            self.assertEqual(len(p.student.transfers.all()), 1)
+            self.assertEqual(len(p.student.holds.all()), 2)
+            self.assertEqual(len(p.student.degrees.all()), 1)
+
+        with self.assertNumQueries(4, using='uw_person'):
+            p = Person.objects.get_person_by_uwnetid(
+                'javerage', include_student=True,
+                include_student_advisers=True, include_student_sports=True)
+            self.assertEqual(len(p.student.advisers.all()), 1)
+            self.assertEqual(len(p.student.sports.all()), 0)
+
+    def test_get_active_students_query_count(self):
+        with self.assertNumQueries(6, using='uw_person'):
+            persons = Person.objects.get_active_students(
+                **ALL_STUDENT_INCLUDES)
+            self.assertEqual(len(persons), 2)
+            for p in persons:
+                self.assertIsNotNone(p.student.academic_term)
+                list(p.student.majors)
+                list(p.student.transcripts.all())
+                list(p.student.transfers.all())
+                list(p.student.holds.all())
+                list(p.student.degrees.all())
+
+    def test_get_active_employees_query_count(self):
+        with self.assertNumQueries(2, using='uw_person'):
+            persons = Person.objects.get_active_employees(
+                include_employee=True)
+            self.assertEqual(len(persons), 2)
+            for p in persons:
+                self.assertIsNotNone(p.employee)
+
+    def test_missing_student(self):
+        p = Person.objects.get_person_by_uwnetid(
+            'bill', include_employee=True, **ALL_STUDENT_INCLUDES)
+        self.assertIsNotNone(p.employee)
+        self.assertIsNone(p.student)
+
+    def test_profiles(self):
+        self.assertRaises(ValueError, PersonLoadingPlan, profile='nobody')
+        self.assertNotEqual(PersonLoadingPlan().cache_key(),
+                            PersonLoadingPlan(profile='directory').cache_key())
+
+        p = Person.objects.get_person_by_uwnetid(
+            'javerage', include_student=True, profile='directory')
+        deferred = p.student.get_deferred_fields()
+        self.assertIn('parent_name', deferred)
+        self.assertIn('total_credits', deferred)
+        self.assertNotIn('student_email', deferred)
+
+        p = Person.objects.get_person_by_uwnetid(
+            'javerage', include_student=True, profile='advising')
+        deferred = p.student.get_deferred_fields()
+        self.assertIn('parent_name', deferred)
+        self.assertNotIn('total_credits', deferred)
+
+        p = Person.objects.get_person_by_uwnetid(
+            'javerage', include_student=True, profile='full')
+        self.assertEqual(p.student.get_deferred_fields(), set())
+
+    def test_profile_to_dict(self):
+        persons = Person.objects.get_active_students(
+            include_student=True, include_student_advisers=True,
+            include_student_sports=True, profile='directory')
+        with no_queries():
+            data = [p.to_dict()['student'] for p in persons]
+
+        self.assertEqual(data[0]['student_email'], 'javerage@uw.edu')
+        self.assertEqual(data[0]['majors'][0]['major_name'],
+                         'PRE SOCIAL SCIENCE')
+        self.assertEqual(len(data[0]['requested_majors']), 2)
+        self.assertNotIn('parent_name', data[0])
+        for field in DIRECTORY_STUDENT_FIELDS:
+            self.assertIn(field, data[0])
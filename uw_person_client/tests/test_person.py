@@ -2,8 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from uw_person_client.tests import ModelTest
-from uw_person_client.models import Person
+from uw_person_client.models import Person, PersonManager
 from uw_person_client.exceptions import PersonNotFoundException
+from threading import Thread
 
 
 class PersonTest(ModelTest):
@@ -11,6 +12,35 @@ class PersonTest(ModelTest):
         p = Person.objects.get_person_by_uwnetid('jadviser1')
         self.assertEqual(p.uwnetid, 'jadviser')
 
+    def test_lookup_counts(self):
+        counts = Person.objects.lookup_counts
+        exact = counts[('uwnetid', 'exact')]
+        prior = counts[('uwnetid', 'prior')]
+        not_found = counts[('uwnetid', 'not_found')]
+
+        with self.assertNumQueries(1, using='uw_person'):
+            Person.objects.get_person_by_uwnetid('jadviser')
+        with self.assertNumQueries(2, using='uw_person'):
+            Person.objects.get_person_by_uwnetid('jadviser1')
+        self.assertRaises(PersonNotFoundException,
+                          Person.objects.get_person_by_uwnetid, 'nobody')
+
+        self.assertEqual(counts[('uwnetid', 'exact')], exact + 1)
+        self.assertEqual(counts[('uwnetid', 'prior')], prior + 1)
+        self.assertEqual(counts[('uwnetid', 'not_found')], not_found + 1)
+
+    def test_lookup_counts_threads(self):
+        # A new manager counts from threads racing on its first lookup
+        manager = PersonManager()
+        threads = [Thread(target=lambda: [
+            manager.count_lookup('uwnetid', 'exact') for _ in range(1000)])
+            for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(manager.lookup_counts[('uwnetid', 'exact')], 4000)
+
     def test_get_person_by_uwnetid(self):
         self.assertRaises(PersonNotFoundException,
                           Person.objects.get_person_by_uwnetid, 'nobody')
@@ -180,3 +210,131 @@ class PersonTest(ModelTest):
         results = Person.objects.get_active_students(include_student=True)
         self.assertEqual(len(results), 2)
         self.assertEqual(results[1].student.student_number, '1233334')
+
+    def test_iter_active_students(self):
+        results = list(Person.objects.iter_active_students())
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0].student, None)
+
+        results = Person.objects.iter_active_students(
+            chunk_size=1, include_student=True,
+            include_student_transcripts=True)
+        with self.assertNumQueries(0, using='uw_person'):
+            self.assertEqual(type(results).__name__, 'generator')
+
+        # One cursor, plus four prefetch queries per chunk of one person
+        with self.assertNumQueries(5, using='uw_person'):
+            results = list(results)
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0].student.student_number, '1033334')
+        self.assertEqual(len(results[0].student.transcripts.all()), 3)
+        self.assertEqual(results[1].student.student_number, '1233334')
+
+    def test_iter_active_employees(self):
+        results = list(Person.objects.iter_active_employees(
+            chunk_size=10, include_employee=True))
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[1].employee.employee_number, '200000000')
+
+    def test_paginate_active_students(self):
+        page = Person.objects.paginate_active_students(
+            page_size=1, include_student=True)
+        self.assertEqual(len(page.persons), 1)
+        self.assertEqual(page.persons[0].student.student_number, '1033334')
+        self.assertIsNotNone(page.next_cursor)
+
+        page = Person.objects.paginate_active_students(
+            cursor=page.next_cursor, page_size=1, include_student=True)
+        self.assertEqual(page.persons[0].student.student_number, '1233334')
+
+        page = Person.objects.paginate_active_students(
+            cursor=page.next_cursor, page_size=1)
+        self.assertEqual(page.persons, [])
+        self.assertIsNone(page.next_cursor)
+
+        page = Person.objects.paginate_active_students(after_id=1)
+        self.assertEqual([p.uwnetid for p in page.persons], ['jbothell'])
+        self.assertIsNone(page.next_cursor)
+
+        self.assertRaises(ValueError, Person.objects.paginate_active_students,
+                          cursor='nope')
+
+    def test_paginate_active_employees(self):
+        page = Person.objects.paginate_active_employees(
+            include_employee=True)
+        self.assertEqual([p.uwnetid for p in page.persons],
+                         ['bill', 'jadviser'])
+        self.assertEqual(page.persons[0].employee.employee_number,
+                         '100000000')
+        self.assertIsNone(page.next_cursor)
+
+    def test_get_persons_by_uwnetids(self):
+        self.assertEqual(Person.objects.get_persons_by_uwnetids([]), {})
+
+        with self.assertNumQueries(2, using='uw_person'):
+            results = Person.objects.get_persons_by_uwnetids(
+                ['javerage', 'jadviser1', 'nobody', 'javerage', 'bill'],
+                include_employee=True)
+        self.assertEqual(list(results.keys()),
+                         ['javerage', 'jadviser1', 'nobody', 'bill'])
+        self.assertEqual(results['javerage'].uwnetid, 'javerage')
+        self.assertEqual(results['jadviser1'].uwnetid, 'jadviser')
+        self.assertIsNone(results['nobody'])
+        self.assertEqual(results['bill'].employee.employee_number,
+                         '100000000')
+
+    def test_get_persons_by_uwregids(self):
+        results = Person.objects.get_persons_by_uwregids([
+            '9136CCB8F66711D5BE060004AC494FF0',
+            '11111B8F66711D5BE060004AC494FFE'])
+        self.assertEqual(
+            results['9136CCB8F66711D5BE060004AC494FF0'].uwnetid, 'javerage')
+        self.assertIsNone(results['11111B8F66711D5BE060004AC494FFE'])
+
+    def test_get_persons_by_system_keys(self):
+        results = Person.objects.get_persons_by_system_keys(
+            ['532353230', '010101010'])
+        self.assertEqual(results['532353230'].uwnetid, 'javerage')
+        self.assertIsNone(results['010101010'])
+
+    def test_get_persons_by_student_numbers(self):
+        with self.assertNumQueries(3, using='uw_person'):
+            results = Person.objects.get_persons_by_student_numbers(
+                ['1033334', '1233334', '1000000'], include_student=True,
+                include_student_holds=True)
+        self.assertEqual(results['1033334'].uwnetid, 'javerage')
+        self.assertEqual(len(results['1033334'].student.holds.all()), 2)
+        self.assertEqual(results['1233334'].uwnetid, 'jbothell')
+        self.assertIsNone(results['1000000'])
+
+    async def test_aget_person(self):
+        with self.assertRaises(PersonNotFoundException):
+            await Person.objects.aget_person_by_uwnetid('nobody')
+
+        p = await Person.objects.aget_person_by_uwnetid('jadviser1')
+        self.assertEqual(p.uwnetid, 'jadviser')
+
+        p = await Person.objects.aget_person_by_uwregid(
+            '9136CCB8F66711D5BE060004AC494FF0', include_student=True,
+            include_student_transcripts=True)
+        self.assertEqual(p.uwnetid, 'javerage')
+        self.assertEqual(len(p.student.transcripts.all()), 3)
+        self.assertEqual(p.student.major_1.major_name, 'PRE SOCIAL SCIENCE')
+
+        p = await Person.objects.aget_person_by_system_key(
+            '532353230', include_employee=True)
+        self.assertIsNone(p.employee)
+
+        p = await Person.objects.aget_person_by_student_number(
+            '1233334', include_student=True)
+        self.assertEqual(p.uwnetid, 'jbothell')
+
+    async def test_aget_active_students(self):
+        results = [p async for p in Person.objects.aget_active_students(
+            chunk_size=1, include_student=True)]
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[1].student.student_number, '1233334')
+
+        results = [p async for p in Person.objects.aget_active_employees(
+            include_employee=True)]
+        self.assertEqual(results[1].employee.employee_number, '200000000')
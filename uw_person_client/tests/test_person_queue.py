@@ -1,10 +1,15 @@
 # Copyright 2026 UW-IT, University of Washington
 # SPDX-License-Identifier: Apache-2.0
 
-from django.test import TestCase
+from django.test import TestCase, TransactionTestCase
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connections
 from uw_person_client.tests import ModelTest
 from uw_person_client.models import (
     PersonQueue, EnrolledStudentQueue, InvalidNetID, InvalidStudentSystemKey)
+from io import StringIO
+from threading import Thread
 
 
 class PersonQueueTest(TestCase):
@@ -16,6 +21,21 @@ class PersonQueueTest(TestCase):
         self.assertRaises(
             InvalidNetID, PersonQueue.objects.add_to_queue, '1javerage')
 
+    def test_add_many_to_queue(self):
+        PersonQueue.objects.add_to_queue('jadviser')
+
+        with self.assertNumQueries(2, using='uw_person'):
+            counts = PersonQueue.objects.add_many_to_queue(
+                ['javerage', 'jadviser', '1javerage', 'bill', 'javerage',
+                 None, 'nobody'], batch_size=2)
+        self.assertEqual(counts, {'inserted': 3, 'queued': 1, 'invalid': 2})
+        self.assertEqual(PersonQueue.objects.count(), 4)
+
+        counts = PersonQueue.objects.add_many_to_queue(['javerage', 'bill'])
+        self.assertEqual(counts, {'inserted': 0, 'queued': 2, 'invalid': 0})
+        self.assertEqual(PersonQueue.objects.add_many_to_queue([]),
+                         {'inserted': 0, 'queued': 0, 'invalid': 0})
+
 
 class EnrolledStudentQueueTest(TestCase):
     databases = '__all__'
@@ -25,3 +45,79 @@ class EnrolledStudentQueueTest(TestCase):
         self.assertRaises(
             InvalidStudentSystemKey, EnrolledStudentQueue.objects.add_to_queue,
             '12345678')
+
+    def test_add_many_to_queue(self):
+        counts = EnrolledStudentQueue.objects.add_many_to_queue(
+            ['123456789', '12345678', '532353230'])
+        self.assertEqual(counts, {'inserted': 2, 'queued': 0, 'invalid': 1})
+        self.assertEqual(EnrolledStudentQueue.objects.count(), 2)
+
+
+def fail_handler(items):
+    raise ValueError()
+
+
+class QueueConsumerTest(TransactionTestCase):
+    databases = '__all__'
+
+    # The queue models are unmanaged, so they aren't flushed between tests
+    def tearDown(self):
+        PersonQueue.objects.all().delete()
+        EnrolledStudentQueue.objects.all().delete()
+
+    def test_claim_batch(self):
+        PersonQueue.objects.add_many_to_queue(['javerage', 'bill', 'jadviser'])
+
+        with PersonQueue.objects.claim_batch(2) as items:
+            self.assertEqual([i.uwnetid for i in items], ['javerage', 'bill'])
+            PersonQueue.objects.ack(items[:1])
+            PersonQueue.objects.release(items[1:])
+
+        self.assertEqual(
+            list(PersonQueue.objects.order_by('pk').values_list(
+                'uwnetid', flat=True)), ['jadviser', 'bill'])
+
+        # A failed block returns its batch to the queue
+        with self.assertRaises(ValueError):
+            with PersonQueue.objects.claim_batch(10) as items:
+                PersonQueue.objects.ack(items)
+                raise ValueError()
+        self.assertEqual(PersonQueue.objects.count(), 2)
+
+    def test_skip_locked(self):
+        EnrolledStudentQueue.objects.add_many_to_queue(
+            ['123456789', '532353230'])
+        claimed = []
+
+        def claim():
+            with EnrolledStudentQueue.objects.claim_batch(1) as items:
+                claimed.extend(items)
+            connections.close_all()
+
+        with EnrolledStudentQueue.objects.claim_batch(1) as items:
+            self.assertEqual(items[0].system_key, '123456789')
+            thread = Thread(target=claim)
+            thread.start()
+            thread.join()
+
+        self.assertEqual(claimed[0].system_key, '532353230')
+
+    def test_process_queue_command(self):
+        PersonQueue.objects.add_many_to_queue(
+            ['user{}'.format(i) for i in range(25)])
+
+        out = StringIO()
+        call_command('process_queue', 'person', 'builtins.len',
+                     workers=2, batch_size=4, stdout=out)
+        self.assertIn('Processed 25 rows (0 failed)', out.getvalue())
+        self.assertEqual(PersonQueue.objects.count(), 0)
+
+        PersonQueue.objects.add_many_to_queue(['javerage', 'bill'])
+        out = StringIO()
+        call_command('process_queue', 'person', __name__ + '.fail_handler',
+                     workers=1, stdout=out)
+        self.assertIn('Processed 0 rows (2 failed)', out.getvalue())
+        self.assertEqual(PersonQueue.objects.count(), 2)
+
+        self.assertRaises(CommandError, call_command, 'process_queue',
+                          'person', __name__ + '.nobody')
@@ -0,0 +1,109 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.db import connections
+from django.test import TransactionTestCase, override_settings
+from uw_person_client.tests import ModelTest
+from uw_person_client.models import Person
+from uw_person_client.loader import load_order
+from uw_person_client.resolver import PersonResolver
+from unittest.mock import patch
+from threading import Lock
+import time
+
+
+class PersonResolverTest(ModelTest):
+    def test_resolve(self):
+        # Lookups run on the test's connection to see the fixtures
+        resolver = PersonResolver(thread_sensitive=True)
+        results = resolver.resolve([
+            ('uwnetid', 'javerage'), ('uwnetid', 'javerage'),
+            ('uwregid', '9136CCB8F66711D5BE060004AC494FF0'),
+            ('system_key', '532353230'), ('student_number', '1233334'),
+            ('adviser', 'jadviser1'), ('adviser', 'javerage'),
+            ('uwnetid', 'nobody')], include_student=True)
+
+        self.assertEqual(len(results), 7)
+        self.assertEqual(
+            results[('uwnetid', 'javerage')].student.student_number,
+            '1033334')
+        self.assertEqual(results[(
+            'uwregid', '9136CCB8F66711D5BE060004AC494FF0')].uwnetid,
+            'javerage')
+        self.assertEqual(
+            results[('system_key', '532353230')].uwnetid, 'javerage')
+        self.assertEqual(
+            results[('student_number', '1233334')].uwnetid, 'jbothell')
+        self.assertEqual(results[('adviser', 'jadviser1')].advising_email,
+                         'jadviser@uw.edu')
+        self.assertIsNone(results[('adviser', 'javerage')])
+        self.assertIsNone(results[('uwnetid', 'nobody')])
+
+        self.assertRaises(ValueError, resolver.resolve, [('nobody', 'x')])
+
+    def test_max_concurrency(self):
+        with override_settings(DATABASES={
+                'uw_person': {'OPTIONS': {'pool': {'max_size': 6}}}}):
+            self.assertEqual(PersonResolver().max_concurrency, 5)
+        with override_settings(DATABASES={'uw_person': {}}):
+            self.assertEqual(PersonResolver().max_concurrency, 4)
+        self.assertEqual(PersonResolver(max_concurrency=2).max_concurrency, 2)
+
+    def test_concurrency_bound(self):
+        lock = Lock()
+        running = []
+        peak = []
+
+        def get_person(uwnetid, **kwargs):
+            with lock:
+                running.append(uwnetid)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(uwnetid)
+            return Person(uwnetid=uwnetid)
+
+        resolver = PersonResolver(max_concurrency=3)
+        with patch.object(Person.objects, 'get_person_by_uwnetid',
+                          side_effect=get_person) as mock_get:
+            results = resolver.resolve(
+                [('uwnetid', 'user{}'.format(i % 10)) for i in range(20)])
+        resolver.shutdown()
+
+        self.assertEqual(mock_get.call_count, 10)
+        self.assertEqual(results[('uwnetid', 'user3')].uwnetid, 'user3')
+        self.assertEqual(max(peak), 3)
+
+
+class PersonResolverThreadTest(TransactionTestCase):
+    databases = '__all__'
+    fixtures = ModelTest.fixtures
+
+    # The person models are unmanaged, so they aren't flushed between tests
+    def tearDown(self):
+        with connections['uw_person'].cursor() as cursor:
+            cursor.execute('TRUNCATE {} CASCADE'.format(', '.join(
+                model._meta.db_table for model in load_order())))
+
+    def test_resolve_threads(self):
+        resolver = PersonResolver(max_concurrency=3)
+        results = resolver.resolve([
+            ('uwnetid', 'javerage'), ('uwnetid', 'jbothell'),
+            ('system_key', '532353230'), ('adviser', 'jadviser'),
+            ('uwnetid', 'nobody')], include_student=True)
+
+        self.assertEqual(results[('uwnetid', 'jbothell')].student.system_key,
+                         '820582050')
+        self.assertEqual(
+            results[('system_key', '532353230')].uwnetid, 'javerage')
+        self.assertEqual(
+            results[('adviser', 'jadviser')].advising_email,
+            'jadviser@uw.edu')
+        self.assertIsNone(results[('uwnetid', 'nobody')])
+
+        # The executor threads' connections were closed after each lookup
+        self.assertEqual(
+            [resolver.executor.submit(
+                lambda: connections['uw_person'].connection).result()
+             for i in range(6)], [None] * 6)
+        resolver.shutdown()
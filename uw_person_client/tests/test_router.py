@@ -1,11 +1,18 @@
 # Copyright 2026 UW-IT, University of Washington
 # SPDX-License-Identifier: Apache-2.0
 
-from django.test import TestCase
-from django.db import connections, router
+from django.test import TestCase, override_settings
+from django.db import connections, router, DatabaseError
 from django.apps import apps
 from django.db import models
 from django.core.management import call_command
+from uw_person_client.routers import UWPersonRouter
+from uw_person_client.tests import ModelTest
+from uw_person_client.models import (
+    Person, Student, PersonQueue, EnrolledStudentQueue)
+from uw_person_client.serializers import no_queries
+from unittest.mock import patch
+import threading
 
 
 class TempUWPersonModel(models.Model):
@@ -74,3 +81,127 @@ class TestUWPersonRouterIntegration(TestCase):
         # Table should not exist in default
         default_conn = connections['default']
         self.assertNotIn(table_name, default_conn.introspection.table_names())
+
+
+@override_settings(UW_PERSON_REPLICAS={'uw_person': 1, 'uw_person_r2': 3},
+                   UW_PERSON_REPLICA_MAX_LAG=5)
+class TestUWPersonRouterReplicas(ModelTest):
+
+    def setUp(self):
+        self.router = UWPersonRouter()
+
+    def test_settings(self):
+        self.assertEqual(self.router.max_lag, 5)
+        self.assertEqual(self.router.sticky_seconds, 5)
+        with override_settings(UW_PERSON_REPLICAS=['r1', 'r2']):
+            self.assertEqual(UWPersonRouter().replicas, {'r1': 1, 'r2': 1})
+
+    def test_health_check(self):
+        # 'uw_person' isn't in recovery, and 'uw_person_r2' isn't configured
+        self.assertTrue(self.router.is_healthy('uw_person'))
+        self.assertFalse(self.router.is_healthy('uw_person_r2'))
+        self.assertEqual(self.router.healthy_replicas(), ['uw_person'])
+        self.assertEqual(self.router.db_for_read(PersonQueue), 'uw_person')
+
+        # Health is cached for the check interval
+        with patch.object(self.router, 'replica_lag') as mock_lag:
+            self.router.is_healthy('uw_person')
+            mock_lag.assert_not_called()
+
+    def test_lag(self):
+        self.router.check_interval = 0
+        with patch.object(self.router, 'replica_lag', return_value=10):
+            self.assertFalse(self.router.is_healthy('uw_person'))
+        with patch.object(self.router, 'replica_lag', return_value=None):
+            self.assertFalse(self.router.is_healthy('uw_person'))
+        with patch.object(self.router, 'replica_lag', return_value=1):
+            self.assertTrue(self.router.is_healthy('uw_person'))
+
+    def test_weighted_read(self):
+        self.router.check_interval = 0
+        with patch.object(self.router, 'replica_lag', return_value=0):
+            self.router.check_replicas()
+        self.router.check_interval = 60
+        reads = [self.router.db_for_read(Person) for i in range(200)]
+        self.assertEqual(set(reads), {'uw_person', 'uw_person_r2'})
+        self.assertGreater(reads.count('uw_person_r2'),
+                           reads.count('uw_person'))
+
+    def test_failover(self):
+        self.router.check_interval = 0
+        with patch.object(self.router, 'replica_lag',
+                          side_effect=DatabaseError()):
+            self.router.check_replicas()
+            self.assertEqual(self.router.healthy_replicas(), [])
+            self.assertEqual(self.router.db_for_read(Person), 'uw_person')
+
+    def test_sticky_queue_reads(self):
+        self.router.primary = 'uw_person_primary'
+        self.router.replicas = {'uw_person': 1}
+        with patch.object(self.router, 'replica_lag', return_value=0):
+            self.router.check_replicas()
+            self.assertEqual(self.router.db_for_read(PersonQueue), 'uw_person')
+
+            self.assertEqual(self.router.db_for_write(PersonQueue),
+                             'uw_person_primary')
+            self.assertEqual(self.router.db_for_read(PersonQueue),
+                             'uw_person_primary')
+            self.assertEqual(self.router.db_for_read(EnrolledStudentQueue),
+                             'uw_person_primary')
+            self.assertEqual(self.router.db_for_read(Person), 'uw_person')
+
+            self.router.sticky_seconds = 0
+            self.assertEqual(self.router.db_for_read(PersonQueue), 'uw_person')
+
+    def test_background_checks(self):
+        # Reads don't wait on, or see the queries of, a health check, and
+        # use the primary until it completes
+        checking = threading.Event()
+
+        def replica_lag(alias):
+            checking.wait()
+            return 0
+
+        with patch.object(self.router, 'replica_lag', replica_lag):
+            with self.assertNumQueries(0, using='uw_person'):
+                with no_queries():
+                    self.assertEqual(
+                        self.router.db_for_read(Person), 'uw_person')
+                    self.assertEqual(self.router.healthy_replicas(), [])
+            checking.set()
+            for thread in threading.enumerate():
+                if thread.name == 'uw_person_replica_check':
+                    thread.join()
+        self.assertEqual(self.router.healthy_replicas(),
+                         ['uw_person', 'uw_person_r2'])
+
+    def test_health_check_connection(self):
+        with self.assertNumQueries(0, using='uw_person'):
+            with no_queries():
+                self.assertEqual(self.router.replica_lag('uw_person'), 0)
+
+    def test_instance_reads(self):
+        self.router.check_interval = 0
+        with patch.object(self.router, 'replica_lag', return_value=0):
+            self.router.check_replicas()
+        self.router.check_interval = 60
+
+        # Prefetches of persons read from 'uw_person' stay there, rather
+        # than mostly going to the unconfigured 'uw_person_r2'
+        with patch.object(router, 'routers', [self.router]):
+            for i in range(10):
+                person = Person.objects.using('uw_person').prefetch_related(
+                    'student_set__transcript_set').get(uwnetid='javerage')
+                self.assertEqual(len(person.student_set.all()), 1)
+
+        person._state.db = 'uw_person_r2'
+        self.assertEqual(self.router.db_for_read(
+            Student, instance=person), 'uw_person_r2')
+        person._state.db = 'default'
+        self.assertIn(self.router.db_for_read(Student, instance=person),
+                      ['uw_person', 'uw_person_r2'])
+
+    def test_allow_migrate(self):
+        self.assertFalse(self.router.allow_migrate('uw_person_r2', 'other'))
+        self.assertFalse(
+            self.router.allow_migrate('uw_person_r2', 'uw_person_client'))
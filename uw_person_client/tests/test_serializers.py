@@ -0,0 +1,80 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.apps import apps
+from django.forms import model_to_dict
+from uw_person_client.tests import ModelTest
+from uw_person_client.models import Person, Student, Adviser
+from uw_person_client.serializers import (
+    serialize, dumps, iter_json, no_queries)
+from uw_person_client.exceptions import QueryNotAllowedException
+import json
+
+
+class SerializerTest(ModelTest):
+    def test_serialize_matches_model_to_dict(self):
+        for model in apps.get_app_config('uw_person_client').get_models():
+            if model.__module__ != 'uw_person_client.models':
+                continue
+            exclude = [f.name for f in model._meta.many_to_many]
+            for instance in model.objects.all():
+                self.assertEqual(serialize(instance), model_to_dict(
+                    instance, exclude=exclude), model.__name__)
+
+    def test_dumps(self):
+        p = Person.objects.get_person_by_uwnetid(
+            'javerage', include_student=True,
+            include_student_transcripts=True)
+        data = json.loads(dumps(p.to_dict()))
+        self.assertEqual(data['uwnetid'], 'javerage')
+        self.assertEqual(data['student']['academic_term']['year'], 2013)
+        self.assertEqual(len(data['student']['transcripts']), 3)
+
+    def test_iter_json(self):
+        self.assertEqual(b''.join(iter_json([])), b'[]')
+
+        data = json.loads(b''.join(iter_json(
+            Person.objects.iter_active_students(include_student=True))))
+        self.assertEqual(len(data), 2)
+        self.assertEqual(data[1]['student']['student_number'], '1233334')
+
+    def test_to_dict_without_queries(self):
+        persons = Person.objects.get_active_students(
+            include_employee=True, include_student=True,
+            include_student_transcripts=True, include_student_transfers=True,
+            include_student_holds=True, include_student_degrees=True,
+            include_student_advisers=True, include_student_sports=True)
+
+        with no_queries():
+            data = [p.to_dict() for p in persons]
+        self.assertEqual(data[0]['student']['advisers'][0]['employee'][
+            'person']['uwnetid'], 'jadviser')
+        self.assertEqual(
+            data[1]['student']['sports'][0]['short_sport_name'], 'GLF')
+        self.assertEqual(
+            data[0]['student']['transcripts'][0]['tran_term']['year'], 2014)
+
+        p = Person.objects.get_person_by_uwnetid(
+            'bill', include_employee=True)
+        with no_queries():
+            data = p.to_dict()
+        self.assertEqual(data['employee']['employee_number'], '100000000')
+        self.assertEqual(data['employee']['person'], p.pk)
+
+        a = Adviser.objects.get_adviser_by_uwnetid('jadviser')
+        with no_queries():
+            self.assertEqual(
+                a.to_dict()['employee']['person']['uwnetid'], 'jadviser')
+
+    def test_to_dict_lazy_advisers(self):
+        persons = Person.objects.get_active_students(include_student=True)
+        with no_queries():
+            self.assertRaises(QueryNotAllowedException, persons[0].to_dict)
+        self.assertEqual(persons[0].to_dict()['student']['advisers'][0][
+            'employee']['person']['uwnetid'], 'jadviser')
+
+    def test_no_queries(self):
+        s = Student.objects.get(system_key='532353230')
+        with no_queries():
+            self.assertRaises(QueryNotAllowedException, s.to_dict)
+        self.assertEqual(s.to_dict()['academic_term']['year'], 2013)
@@ -0,0 +1,70 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.core.management import call_command
+from uw_person_client.tests import ModelTest
+from uw_person_client.models import Person, PersonSummary
+from uw_person_client.summary import refresh_person_summary
+from uw_person_client.exceptions import PersonNotFoundException
+from io import StringIO
+
+
+class PersonSummaryTest(ModelTest):
+    def setUp(self):
+        refresh_person_summary(concurrently=False)
+
+    def test_get_summary(self):
+        with self.assertNumQueries(1, using='uw_person'):
+            summary = PersonSummary.objects.get_summary_by_uwnetid(
+                'javerage')
+        self.assertEqual(summary.student_number, '1033334')
+        self.assertEqual(summary.adviser_uwnetids, ['jadviser'])
+        self.assertTrue(summary.is_active_student)
+        self.assertEqual(summary.to_dict()['uwnetid'], 'javerage')
+
+        for summary in [
+                PersonSummary.objects.get_summary_by_uwregid(
+                    '9136CCB8F66711D5BE060004AC494FFE'),
+                PersonSummary.objects.get_summary_by_system_key(
+                    '532353230'),
+                PersonSummary.objects.get_summary_by_student_number(
+                    '1033334')]:
+            self.assertEqual(summary.uwnetid, 'javerage')
+
+        self.assertEqual(PersonSummary.objects.get_summary_by_uwnetid(
+            'jadviser1').uwnetid, 'jadviser')
+        self.assertEqual(PersonSummary.objects.lookup_counts[
+            ('uwnetid', 'prior')], 1)
+        self.assertRaises(PersonNotFoundException,
+                          PersonSummary.objects.get_summary_by_uwnetid,
+                          'nobody')
+
+    def test_matches_person(self):
+        person = Person.objects.get_person_by_uwnetid(
+            'jbothell', include_student=True)
+        summary = PersonSummary.objects.get_summary_by_uwnetid('jbothell')
+        self.assertEqual(summary.pk, person.pk)
+        self.assertEqual(summary.display_name, person.display_name)
+        self.assertEqual(summary.email, person.student.student_email)
+        self.assertEqual(summary.major_name,
+                         person.student.major_1.major_name)
+
+    def test_active_populations(self):
+        with self.assertNumQueries(1, using='uw_person'):
+            students = PersonSummary.objects.get_active_students()
+        self.assertEqual([s.uwnetid for s in students],
+                         ['javerage', 'jbothell'])
+        self.assertEqual(
+            [s.uwnetid for s in PersonSummary.objects.iter_active_employees(
+                chunk_size=1)], ['bill', 'jadviser'])
+        employees = PersonSummary.objects.get_active_employees()
+        self.assertEqual(employees[0].class_desc, None)
+        self.assertEqual(employees[0].adviser_uwnetids, [])
+
+    def test_refresh_command(self):
+        Person.objects.filter(uwnetid='bill').update(display_name='Billy')
+        out = StringIO()
+        call_command('refresh_person_summary', stdout=out)
+        self.assertIn('Refreshed person_summary', out.getvalue())
+        self.assertEqual(PersonSummary.objects.get_summary_by_uwnetid(
+            'bill').display_name, 'Billy')
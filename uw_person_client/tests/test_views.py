@@ -0,0 +1,59 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.contrib.auth.models import User, AnonymousUser
+from django.core.exceptions import PermissionDenied
+from django.test import RequestFactory
+from django.urls import reverse
+from uw_person_client.tests import ModelTest
+from uw_person_client.views import active_students, active_employees
+import json
+
+
+class PersonViewsTest(ModelTest):
+    def get(self, view, name, user=None, **params):
+        request = RequestFactory().get(reverse(name), params)
+        request.user = user or User(username='admin', is_active=True,
+                                    is_superuser=True)
+        return view(request)
+
+    def test_active_students(self):
+        response = self.get(
+            active_students, 'uw_person_active_students', page_size=1,
+            include_student='true')
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEqual(data['results'][0]['uwnetid'], 'javerage')
+        self.assertEqual(
+            data['results'][0]['student']['student_number'], '1033334')
+
+        response = self.get(
+            active_students, 'uw_person_active_students',
+            cursor=data['next_cursor'])
+        data = json.loads(response.content)
+        self.assertEqual([p['uwnetid'] for p in data['results']],
+                         ['jbothell'])
+        self.assertNotIn('student', data['results'][0])
+        self.assertIsNone(data['next_cursor'])
+
+    def test_active_employees(self):
+        response = self.get(
+            active_employees, 'uw_person_active_employees',
+            profile='directory', include_employee='1')
+        data = json.loads(response.content)
+        self.assertEqual([p['uwnetid'] for p in data['results']],
+                         ['bill', 'jadviser'])
+        self.assertEqual(data['results'][0]['employee']['employee_number'],
+                         '100000000')
+
+    def test_bad_request(self):
+        for params in [{'cursor': 'nope'}, {'page_size': 'all'},
+                       {'page_size': 0}, {'profile': 'nobody'}]:
+            response = self.get(
+                active_students, 'uw_person_active_students', **params)
+            self.assertEqual(response.status_code, 400)
+
+    def test_permission_denied(self):
+        self.assertRaises(
+            PermissionDenied, self.get, active_students,
+            'uw_person_active_students', user=AnonymousUser())
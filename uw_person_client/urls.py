@@ -1,5 +1,13 @@
 # Copyright 2026 UW-IT, University of Washington
 # SPDX-License-Identifier: Apache-2.0
 
+from django.urls import re_path
+from uw_person_client import views
 
-urlpatterns = []
+
+urlpatterns = [
+    re_path(r'^api/v1/person/active_students/?$', views.active_students,
+            name='uw_person_active_students'),
+    re_path(r'^api/v1/person/active_employees/?$', views.active_employees,
+            name='uw_person_active_employees'),
+]
@@ -0,0 +1,48 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.contrib.auth.decorators import permission_required
+from django.http import HttpResponse, HttpResponseBadRequest
+from django.views.decorators.http import require_GET
+from uw_person_client.models import Person
+from uw_person_client.serializers import dumps
+
+MAX_PAGE_SIZE = 1000
+
+INCLUDE_FLAGS = (
+    'include_employee', 'include_student', 'include_student_transcripts',
+    'include_student_transfers', 'include_student_holds',
+    'include_student_degrees', 'include_student_advisers',
+    'include_student_sports')
+
+
+def _paginate(request, paginate):
+    kwargs = {flag: request.GET.get(flag, '').lower() in ('1', 'true')
+              for flag in INCLUDE_FLAGS}
+    try:
+        page_size = min(int(request.GET.get('page_size', 100)),
+                        MAX_PAGE_SIZE)
+        if page_size < 1:
+            raise ValueError('Invalid page_size')
+        page = paginate(cursor=request.GET.get('cursor') or None,
+                        page_size=page_size,
+                        profile=request.GET.get('profile'), **kwargs)
+    except ValueError as ex:
+        return HttpResponseBadRequest(str(ex))
+
+    return HttpResponse(dumps({
+        'results': [person.to_dict() for person in page.persons],
+        'next_cursor': page.next_cursor,
+    }), content_type='application/json')
+
+
+@require_GET
+@permission_required('uw_person_client.view_person', raise_exception=True)
+def active_students(request):
+    return _paginate(request, Person.objects.paginate_active_students)
+
+
+@require_GET
+@permission_required('uw_person_client.view_person', raise_exception=True)
+def active_employees(request):
+    return _paginate(request, Person.objects.paginate_active_employees)